@@ -0,0 +1,31 @@
+"""
+ClubOps documentation generators
+One package for the Operations Manual and the UI Documentation, defined as
+document configurations over shared section builders and caches
+
+Usage:
+    python -m clubops_docs                 # build every document
+    python -m clubops_docs manual          # build selected documents
+    python -m clubops_docs --deterministic # reproducible output, skip unchanged
+    python -m clubops_docs --locales en,es,fr  # every document in each of its locales
+    python -m clubops_docs --asset-store URL   # screenshots from URL/<document>/ via a local cache
+    python -m clubops_docs --thumbnails        # page previews for the portal (needs PyMuPDF)
+    python -m clubops_docs --watch             # rebuild when screenshots change
+    python -m clubops_docs --draft             # quick layout check with placeholder screenshots
+    python -m clubops_docs --changes           # revision notice: only the pages changed since publishing
+    python -m clubops_docs --incremental       # append only the changed objects to the published PDF
+    python -m clubops_docs manual --impose booklet  # print variants of the published PDF (needs pdfrw)
+    python -m clubops_docs --compliance clubops.db  # license compliance roster per club
+    python -m clubops_docs --vip-occupancy clubops.db  # VIP booth occupancy heatmaps per club
+    python -m clubops_docs diff manual             # screenshot changes since the published set (needs NumPy)
+"""
+
+from .build import BuildContext, BuildOptions, SharedResources, build_document, build_documents
+from .config import DocumentConfig
+from .documents import DOCUMENTS
+from .preflight import PreflightError
+
+__all__ = [
+    "BuildContext", "BuildOptions", "DocumentConfig", "DOCUMENTS", "PreflightError", "SharedResources",
+    "build_document", "build_documents",
+]
@@ -0,0 +1,152 @@
+"""
+Command line entry point: python -m clubops_docs [document ...] [--locales en,es,fr]
+Subcommand: python -m clubops_docs diff [document] (see diff.py)
+"""
+
+import argparse
+import functools
+import sys
+
+from .build import BuildOptions, SharedResources, build_document, build_documents, localized_configs
+from .changes import build_changes
+from .compliance import build_rosters
+from .compression import DEFAULT_LEVEL
+from .imposition import impose_document
+from .occupancy import build_occupancy_reports
+from .documents import DOCUMENTS
+from .i18n import SOURCE_LOCALE, available_locales
+from .preflight import PreflightError
+from .watch import watch
+from . import diff, imposition, thumbnails
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv[:1] == ["diff"]:
+        return diff.main(argv[1:])
+    parser = argparse.ArgumentParser(prog="clubops_docs", description="Build ClubOps documentation PDFs")
+    parser.add_argument("documents", nargs="*", metavar="document",
+                        help=f"documents to build (default: all of {', '.join(sorted(DOCUMENTS))})")
+    parser.add_argument("--deterministic", action="store_true",
+                        help="byte-identical output: fixed dates (SOURCE_DATE_EPOCH or the git commit time), "
+                             "invariant PDF structure, skip documents whose inputs are unchanged")
+    parser.add_argument("--no-search-index", dest="search_index", action="store_false",
+                        help="do not write the <document>.search.json sidecar")
+    parser.add_argument("--html", action="store_true",
+                        help="also write a lightweight HTML version with responsive images")
+    parser.add_argument("--locales", default=SOURCE_LOCALE, metavar="LIST",
+                        help=f"comma-separated locales to build, concurrently "
+                             f"(available: {', '.join(available_locales())}; default: {SOURCE_LOCALE})")
+    parser.add_argument("--asset-store", metavar="URL",
+                        help="fetch screenshots from URL/<document>/<file> into a local cache "
+                             "instead of reading each document's screenshot directory")
+    parser.add_argument("--thumbnails", nargs="?", const="webp", choices=thumbnails.FORMATS,
+                        help="also rasterize changed pages to previews and thumbnails "
+                             "(default format: webp; needs PyMuPDF)")
+    parser.add_argument("--draft", action="store_true",
+                        help="fast layout check: placeholder boxes instead of screenshots, no compression, "
+                             "written to <document>-draft.pdf with the final pagination")
+    parser.add_argument("--changes", action="store_true",
+                        help="write <document>-changes.pdf: a summary and only the pages that changed "
+                             "since the last published build, with change bars")
+    parser.add_argument("--impose", choices=sorted(imposition.LAYOUTS), metavar="LAYOUT",
+                        help=f"arrange the published PDF's pages on print sheets without laying it out again "
+                             f"({', '.join(sorted(imposition.LAYOUTS))}); written to <document>-<layout>.pdf")
+    parser.add_argument("--section", metavar="TEXT",
+                        help="with --impose: only the pages of the section whose title or label contains TEXT, "
+                             "e.g. --impose cards-4up --section 'quick reference'")
+    parser.add_argument("--compliance", metavar="DATABASE",
+                        help="instead of the documents, write a color-coded license compliance roster per club "
+                             "from a SQLite export of database/schema.sql, into docs/compliance/")
+    parser.add_argument("--vip-occupancy", metavar="DATABASE",
+                        help="instead of the documents, write VIP booth occupancy, peak concurrency and idle gap "
+                             "heatmaps per club from a SQLite export, into docs/vip-occupancy/")
+    parser.add_argument("--page-compression", type=int, choices=range(10), default=DEFAULT_LEVEL, metavar="LEVEL",
+                        help=f"zlib level 0-9 for page content streams (default {DEFAULT_LEVEL})")
+    parser.add_argument("--image-compression", type=int, choices=range(10), default=DEFAULT_LEVEL, metavar="LEVEL",
+                        help=f"zlib level 0-9 for images that are decoded; plain PNGs are embedded as they are "
+                             f"(default {DEFAULT_LEVEL})")
+    parser.add_argument("--compress-threads", type=int, metavar="N",
+                        help="threads compressing streams (default: one per core; 1 compresses sequentially, "
+                             "with identical output)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="publish a revision as a PDF incremental update: only changed objects are appended "
+                             "to the published file, whose earlier bytes stay as they are (small revisions "
+                             "download as a short tail)")
+    parser.add_argument("--force", action="store_true", help="rebuild even if the inputs are unchanged")
+    parser.add_argument("--watch", nargs="?", const=2.0, type=float, metavar="SECONDS",
+                        help="keep running and rebuild a document when its screenshots change "
+                             "(polled every SECONDS, default 2)")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.documents if name not in DOCUMENTS]
+    if unknown:
+        parser.error(f"unknown document(s): {', '.join(unknown)}")
+    if args.thumbnails and not thumbnails.available():
+        parser.error("--thumbnails needs PyMuPDF (pip install pymupdf)")
+    locales = [locale.strip() for locale in args.locales.split(",") if locale.strip()]
+    unknown = [locale for locale in locales if locale not in available_locales()]
+    if unknown:
+        parser.error(f"no message catalog for locale(s): {', '.join(unknown)}")
+    if args.draft and args.html:
+        parser.error("--draft has no images to put in the HTML version")
+    if args.changes and (args.draft or args.html or args.thumbnails or args.watch):
+        parser.error("--changes cannot be combined with --draft, --html, --thumbnails or --watch")
+    if args.impose and not imposition.available():
+        parser.error("--impose needs pdfrw (pip install pdfrw)")
+    if args.impose and (args.draft or args.html or args.thumbnails or args.watch or args.changes):
+        parser.error("--impose works on the published PDF and cannot be combined with "
+                     "--draft, --html, --thumbnails, --watch or --changes")
+    if args.incremental and (args.draft or args.changes or args.impose or args.compliance or args.vip_occupancy):
+        parser.error("--incremental updates the published PDF and cannot be combined with "
+                     "--draft, --changes, --impose, --compliance or --vip-occupancy")
+    if args.section and not args.impose:
+        parser.error("--section only applies to --impose")
+    if args.compliance and (args.documents or args.draft or args.html or args.thumbnails or args.watch
+                            or args.changes or args.impose or args.asset_store):
+        parser.error("--compliance builds rosters from the database only and takes no documents, "
+                     "--draft, --html, --thumbnails, --watch, --changes, --impose or --asset-store")
+    if args.vip_occupancy and (args.documents or args.draft or args.html or args.thumbnails or args.watch
+                               or args.changes or args.impose or args.asset_store or args.compliance):
+        parser.error("--vip-occupancy builds reports from the database only and takes no documents, "
+                     "--draft, --html, --thumbnails, --watch, --changes, --impose, --asset-store or --compliance")
+    if args.compress_threads is not None and args.compress_threads < 1:
+        parser.error("--compress-threads must be at least 1")
+    if args.watch and args.asset_store:
+        parser.error("--watch polls local screenshot directories and cannot be combined with --asset-store")
+    try:
+        options = BuildOptions(deterministic=args.deterministic, force=args.force,
+                               search_index=args.search_index, html=args.html,
+                               asset_store=args.asset_store, thumbnails=args.thumbnails, draft=args.draft,
+                               page_compression=args.page_compression, image_compression=args.image_compression,
+                               compress_threads=args.compress_threads, incremental=args.incremental)
+        if args.compliance:
+            build_rosters(args.compliance, options=options)
+        elif args.vip_occupancy:
+            build_occupancy_reports(args.vip_occupancy, options=options)
+        elif args.watch:
+            shared = SharedResources(options)
+            try:
+                watch(localized_configs(shared, args.documents or None, locales), shared, args.watch)
+            finally:
+                shared.close()
+        else:
+            if args.impose:
+                build = functools.partial(impose_document, layout_name=args.impose, section=args.section)
+            else:
+                build = build_changes if args.changes else build_document
+            build_documents(args.documents or None, options=options, locales=locales, build=build)
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
+    except PreflightError as e:
+        print(f"\n{e.report()}")
+        return 1
+    except Exception as e:
+        print(f"\n❌ Error generating PDF: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
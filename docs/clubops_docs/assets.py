@@ -0,0 +1,540 @@
+"""
+Screenshot loading shared by every document in a build
+Each image file is read, decoded and Flate-compressed once per process;
+documents then embed the prepared stream without touching the pixels again.
+Plain 8-bit PNGs skip the decode entirely: their IDAT data already is a
+Flate stream with PNG predictors, which PDF readers undo themselves. Other
+images are compressed at the cache's zlib level; a build prepares all of a
+document's images on a thread pool before layout (see prepare_all).
+
+Tall captures split across pages are cut into row bands as their PNG
+scanlines stream in, so memory follows the band height, not the image's
+(see png_tiles and ScreenshotAsset.tiles).
+
+SVG files are converted to reportlab drawings and drawn as vectors. Parsed
+drawings are pickled by content hash, so later builds skip the XML parsing.
+This needs svglib (pip install svglib); raster screenshots work without it.
+"""
+
+from reportlab.graphics import renderPDF
+from reportlab.lib.colors import HexColor
+from reportlab.lib.rl_accel import asciiBase85Encode
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase.pdfdoc import (PDFArray, PDFDictionary, PDFImageXObject, PDFName, PDFObjectReference,
+                                      PDFStream, _digester, _mode2CS)
+from reportlab import rl_config
+from PIL import Image as PILImage
+import hashlib
+import io
+import itertools
+import mmap
+import os
+import pickle
+import struct
+import threading
+import zlib
+
+import reportlab
+
+from .compression import DEFAULT_LEVEL
+from .config import CACHE_DIR
+from .publish import atomic_write
+
+try:
+    import svglib
+    from svglib.svglib import svg2rlg
+except ImportError:  # optional dependency
+    svglib = svg2rlg = None
+
+PLACEHOLDER_FILL = HexColor("#E2E8F0")
+PLACEHOLDER_LINE = HexColor("#94A3B8")
+DRAWING_CACHE_DIR = os.path.join(CACHE_DIR, "drawings")
+VECTOR_EXTENSIONS = (".svg",)
+PX_TO_PT = 0.75  # svglib sizes drawings in points from the SVG's CSS pixel size
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PNG_COLORS = {0: ("DeviceGray", 1), 2: ("DeviceRGB", 3)}  # PNG color type -> (color space, components)
+PNG_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}  # samples per pixel of each PNG color type
+INFLATE_CHUNK = 1 << 20  # bytes of scanlines inflated at a time when cutting a PNG into bands
+
+
+class PredictorImageXObject(PDFImageXObject):
+    """Image XObject that can carry /DecodeParms, for PNG-predicted Flate data"""
+
+    decodeParms = None
+
+    def format(self, document):
+        if self.decodeParms is None:
+            return PDFImageXObject.format(self, document)
+        stream = PDFStream(content=self.streamContent)
+        stream.dictionary.dict.update({
+            "Type": PDFName("XObject"),
+            "Subtype": PDFName("Image"),
+            "Width": self.width,
+            "Height": self.height,
+            "BitsPerComponent": self.bitsPerComponent,
+            "ColorSpace": PDFName(self.colorSpace),
+            "Filter": PDFArray(map(PDFName, self._filters)),
+            # one parameter dictionary per entry of the Filter array
+            "DecodeParms": PDFArray([PDFDictionary(dict(self.decodeParms))]),
+            "Length": len(self.streamContent),
+        })
+        return stream.format(document)
+
+
+class FlateImageXObject(PDFImageXObject):
+    """Image XObject whose decoded pixels (and alpha mask) are compressed at a chosen zlib level"""
+
+    def __init__(self, name, source, mask=None, level=DEFAULT_LEVEL):
+        self.level = level
+        PDFImageXObject.__init__(self, name, source, mask=mask)
+
+    def loadImageFromSRC(self, im):
+        fp = im.jpeg_fh()
+        if fp:
+            self.loadImageFromJPEG(fp)
+            return
+        self.width, self.height = im.getSize()
+        self.streamContent = zlib.compress(im.getRGBData(), self.level)
+        if rl_config.useA85:
+            self.streamContent = asciiBase85Encode(self.streamContent)
+            self._filters = "ASCII85Decode", "FlateDecode"
+        else:
+            self._filters = "FlateDecode",
+        self.colorSpace = _mode2CS[im.mode]
+        self.bitsPerComponent = 8
+        self._checkTransparency(im)
+
+    def _checkTransparency(self, im):
+        if self.mask == "auto" and im._dataA:
+            self.mask = None
+            self._smask = FlateImageXObject(_digester(im._dataA.getRGBData()), im._dataA, level=self.level)
+            self._smask._decode = [0, 1]
+        else:
+            PDFImageXObject._checkTransparency(self, im)
+
+
+def png_chunks(data):
+    """(type, payload start, payload end) of every chunk of a PNG, up to IEND"""
+    pos = 8
+    while pos + 8 <= len(data):
+        length, kind = struct.unpack(">I4s", data[pos:pos + 8])
+        yield kind, pos + 8, pos + 8 + length
+        if kind == b"IEND":
+            return
+        pos += 12 + length
+
+
+def png_chunk(kind, payload):
+    return struct.pack(">I", len(payload)) + kind + payload + struct.pack(">I", zlib.crc32(kind + payload))
+
+
+def predictor_xobject(name, width, height, color_type, stream):
+    """Image XObject for PNG-filtered, Flate-compressed 8-bit grayscale or RGB scanlines"""
+    color_space, colors = PNG_COLORS[color_type]
+    xobj = PredictorImageXObject(name)
+    xobj.width, xobj.height = width, height
+    xobj.bitsPerComponent = 8
+    xobj.colorSpace = color_space
+    xobj._filters = ("FlateDecode",)
+    xobj.streamContent = stream
+    xobj.mask = None
+    xobj.decodeParms = {"Predictor": 15, "Colors": colors, "BitsPerComponent": 8, "Columns": width}
+    return xobj
+
+
+def png_passthrough(path, name):
+    """Image XObject built straight from a PNG's IDAT chunks, or None
+
+    Only 8-bit, non-interlaced grayscale or RGB files without transparency
+    qualify; anything else (alpha, palettes, 16-bit, interlacing) would have
+    to be decoded, and takes the regular path. The file is read through a
+    memory map and only the IDAT payloads are copied out. A truncated file
+    or an IDAT chunk failing its CRC also takes the regular path, whose
+    decoder reports the damage.
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        if data[:8] != PNG_SIGNATURE or data[12:16] != b"IHDR":
+            return None
+        width, height, depth, color_type, _, _, interlace = struct.unpack(">IIBBBBB", data[16:29])
+        if depth != 8 or interlace or color_type not in PNG_COLORS:
+            return None
+        idat, kind = [], None
+        for kind, start, end in png_chunks(data):
+            if kind == b"IDAT":
+                if data[end:end + 4] != struct.pack(">I", zlib.crc32(data[start - 4:end])):
+                    return None
+                idat.append(data[start:end])
+            elif kind == b"tRNS":
+                return None
+        if not idat or kind != b"IEND":
+            return None
+    return predictor_xobject(name, width, height, color_type, b"".join(idat))
+
+
+def png_scanlines(data, idat, row_bytes, height):
+    """Filtered scanlines (filter type byte first) of a PNG, inflated a piece at a time
+
+    ValueError once the data turns out to hold more or fewer than `height`
+    rows, or the compressed stream is cut off.
+    """
+    inflater = zlib.decompressobj()
+
+    def inflated():
+        for start, end in idat:
+            compressed = data[start:end]
+            while compressed:
+                yield inflater.decompress(compressed, INFLATE_CHUNK)
+                compressed = inflater.unconsumed_tail
+        yield inflater.flush()
+
+    pending = bytearray()
+    size = row_bytes + 1
+    rows = 0
+    for piece in inflated():
+        pending += piece
+        offset = 0
+        while len(pending) - offset >= size:
+            if rows == height:
+                raise ValueError(f"image data holds more than the {height} rows in its header")
+            yield bytes(pending[offset:offset + size])
+            rows += 1
+            offset += size
+        del pending[:offset]
+    if not inflater.eof:
+        raise ValueError(f"compressed image data is cut off after row {rows} of {height}")
+    if rows < height or pending:
+        raise ValueError(f"image data ends after row {rows} of {height}")
+
+
+def decode_band(width, depth, color_type, extra_chunks, seed, scanlines):
+    """PIL image of consecutive PNG scanlines, given the raw scanline just above them (or None)
+
+    The scanlines go into a small PNG of their own, after the seed row stored
+    unfiltered, so PIL undoes their filters exactly as in the whole file.
+    """
+    lines = ([b"\0" + seed] if seed is not None else []) + scanlines
+    header = struct.pack(">IIBBBBB", width, len(lines), depth, color_type, 0, 0, 0)
+    png = (PNG_SIGNATURE + png_chunk(b"IHDR", header) + extra_chunks
+           + png_chunk(b"IDAT", zlib.compress(b"".join(lines), 1)) + png_chunk(b"IEND", b""))
+    im = PILImage.open(io.BytesIO(png))
+    im.load()
+    return im.crop((0, 1, width, len(lines))) if seed is not None else im
+
+
+def png_tiles(path, bounds, name, level=DEFAULT_LEVEL):
+    """Image XObjects for contiguous row bands [(top, bottom), ...] of a PNG, or None
+
+    Each band's XObject is named <name>r<top>_<bottom>.
+    Scanlines are inflated as a stream and each band is decoded on its own,
+    seeded with the last raw row of the band above, so memory stays at about
+    one band however tall the image is. Grayscale and RGB bands keep their
+    PNG filters, only the first row of each is stored unfiltered; other color
+    types are compressed from the decoded band. Files that cannot be cut this
+    way (16-bit, packed palettes, interlacing, not a PNG) return None.
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        if data[:8] != PNG_SIGNATURE or data[12:16] != b"IHDR":
+            return None
+        width, height, depth, color_type, _, _, interlace = struct.unpack(">IIBBBBB", data[16:29])
+        if depth != 8 or interlace or color_type not in PNG_CHANNELS:
+            return None
+        chunks = list(png_chunks(data))
+        extra_chunks = b"".join(png_chunk(kind, data[start:end]) for kind, start, end in chunks
+                                if kind in (b"PLTE", b"tRNS"))
+        keep_filters = color_type in PNG_COLORS and not any(kind == b"tRNS" for kind, _, _ in chunks)
+        scanlines = png_scanlines(data, [(start, end) for kind, start, end in chunks if kind == b"IDAT"],
+                                  width * PNG_CHANNELS[color_type], height)
+        xobjs, seed, row = [], None, 0
+        for top, bottom in bounds:
+            if top != row:
+                raise ValueError(f"row bands must be contiguous from the top, got {bounds}")
+            band = list(itertools.islice(scanlines, bottom - top))
+            im = decode_band(width, depth, color_type, extra_chunks, seed, band)
+            tile_name = f"{name}r{top}_{bottom}"
+            if keep_filters:
+                compressor = zlib.compressobj(level)
+                parts = [compressor.compress(b"\0" + im.crop((0, 0, width, 1)).tobytes())]
+                parts.extend(compressor.compress(line) for line in band[1:])
+                stream = b"".join(parts) + compressor.flush()
+                xobjs.append(predictor_xobject(tile_name, width, bottom - top, color_type, stream))
+            else:
+                xobjs.append(FlateImageXObject(tile_name, ImageReader(im), mask="auto", level=level))
+            seed = im.crop((0, im.height - 1, width, im.height)).tobytes()
+            row = bottom
+        if row == height:
+            next(scanlines, None)  # past the last row: the end-of-data checks
+    return xobjs
+
+
+class PreparedImage:
+    """Decoded and compressed image stream, reusable across PDF documents"""
+
+    _FIELDS = ("width", "height", "bitsPerComponent", "colorSpace", "_filters",
+               "streamContent", "mask", "_decode", "decodeParms")
+
+    def __init__(self, name, xobj):
+        self.name = name
+        for field in self._FIELDS:
+            setattr(self, field, getattr(xobj, field, None))
+        smask = getattr(xobj, "_smask", None)
+        self.smask = PreparedImage(smask.name, smask) if smask is not None else None
+
+    def xobject(self):
+        """Fresh image XObject for one document, sharing the prepared stream bytes"""
+        xobj = PredictorImageXObject(self.name)
+        for field in self._FIELDS:
+            setattr(xobj, field, getattr(self, field))
+        return xobj
+
+    def draw(self, canv, x, y, width, height):
+        """Place the image on a canvas, registering it with the document on first use"""
+        doc = canv._doc
+        reg_name = doc.getXObjectName(self.name)
+        if not doc.idToObject.get(reg_name):
+            xobj = self.xobject()
+            canv._setXObjects(xobj)
+            doc.Reference(xobj, reg_name)
+            doc.addForm(self.name, xobj)
+            if self.smask is not None:
+                mask_name = doc.getXObjectName(self.smask.name)
+                if not doc.idToObject.get(mask_name):
+                    mask = self.smask.xobject()
+                    canv._setXObjects(mask)
+                    doc.Reference(mask, mask_name)
+                xobj.smask = PDFObjectReference(mask_name)
+
+        canv._currentPageHasImages = 1
+        canv.saveState()
+        canv.translate(x, y)
+        canv.scale(width, height)
+        canv._code.append("/%s Do" % reg_name)
+        canv.restoreState()
+        canv._formsinuse.append(self.name)
+
+
+def is_vector(path):
+    return os.path.splitext(path)[1].lower() in VECTOR_EXTENSIONS
+
+
+def load_drawing(path, digest, cache_dir=DRAWING_CACHE_DIR):
+    """reportlab Drawing for an SVG file, parsed once per file content
+
+    The cache key includes the reportlab and svglib versions, so upgrading
+    either one re-parses instead of unpickling incompatible objects.
+    """
+    if svg2rlg is None:
+        raise RuntimeError("SVG assets need svglib: pip install svglib")
+    cached = os.path.join(cache_dir, f"{digest}-rl{reportlab.Version}-svglib{svglib.__version__}.pickle")
+    try:
+        with open(cached, "rb") as f:
+            return pickle.load(f)
+    except Exception:  # not cached yet, or an unreadable entry that is parsed again and replaced
+        pass
+    drawing = svg2rlg(path)
+    if drawing is None:
+        raise ValueError("not a valid SVG file")
+    os.makedirs(cache_dir, exist_ok=True)
+    atomic_write(cached, pickle.dumps(drawing, pickle.HIGHEST_PROTOCOL))
+    return drawing
+
+
+class VectorAsset:
+    """One SVG file as a reportlab drawing
+
+    width and height are the SVG's own size in CSS pixels, so overlays use
+    the same coordinates as in the SVG (or a browser) rather than points.
+    """
+
+    vector = True
+
+    def __init__(self, path, digest, drawing):
+        self.path = path
+        self.digest = digest
+        self.drawing = drawing
+        self.width, self.height = drawing.width / PX_TO_PT, drawing.height / PX_TO_PT
+
+    def draw(self, canv, x, y, width, height):
+        canv.saveState()
+        canv.translate(x, y)
+        canv.scale(width / self.drawing.width, height / self.drawing.height)
+        renderPDF.draw(self.drawing, canv, 0, 0)
+        canv.restoreState()
+
+
+class ScreenshotAsset:
+    """One screenshot file: pixel size up front, prepared stream on first draw"""
+
+    vector = False
+
+    def __init__(self, path, digest, size, level=DEFAULT_LEVEL):
+        self.path = path
+        self.digest = digest
+        self.width, self.height = size
+        self.level = level
+        self._prepared = None
+        self._tiles = {}  # row bands -> [PreparedImage]
+        self._lock = threading.Lock()
+
+    def prepared(self):
+        """Decode and compress the image the first time any document draws it"""
+        with self._lock:
+            if self._prepared is None:
+                name = "ss" + self.digest[:20]
+                xobj = png_passthrough(self.path, name) or \
+                    FlateImageXObject(name, ImageReader(self.path), mask="auto", level=self.level)
+                self._prepared = PreparedImage(name, xobj)
+            return self._prepared
+
+    def tiles(self, bounds):
+        """Prepared images of contiguous row bands [(top, bottom), ...], for a tall screenshot split across pages
+
+        PNGs are cut while their scanlines stream in (see png_tiles); other
+        files are decoded whole once and cropped.
+        """
+        bounds = tuple(bounds)
+        with self._lock:
+            if bounds not in self._tiles:
+                name = "ss" + self.digest[:20]
+                xobjs = png_tiles(self.path, bounds, name, self.level)
+                if xobjs is None:
+                    with PILImage.open(self.path) as im:
+                        im.load()
+                        xobjs = [FlateImageXObject(f"{name}r{top}_{bottom}",
+                                                   ImageReader(im.crop((0, top, im.width, bottom))),
+                                                   mask="auto", level=self.level)
+                                 for top, bottom in bounds]
+                self._tiles[bounds] = [PreparedImage(xobj.name, xobj) for xobj in xobjs]
+            return self._tiles[bounds]
+
+    def tile(self, bounds, index):
+        return TileAsset(self, bounds, index)
+
+    def draw(self, canv, x, y, width, height):
+        self.prepared().draw(canv, x, y, width, height)
+
+
+class TileAsset:
+    """One row band of a ScreenshotAsset, drawn from the bands prepared together"""
+
+    vector = False
+
+    def __init__(self, source, bounds, index):
+        self.source = source
+        self.bounds = tuple(bounds)
+        self.index = index
+        self.path = source.path
+        top, bottom = self.bounds[index]
+        self.digest = f"{source.digest}:{top}-{bottom}"
+        self.width, self.height = source.width, bottom - top
+
+    def prepared(self):
+        return self.source.tiles(self.bounds)
+
+    def draw(self, canv, x, y, width, height):
+        self.prepared()[self.index].draw(canv, x, y, width, height)
+
+
+class PlaceholderAsset:
+    """Draft stand-in for a screenshot: same pixel size, drawn as a labelled box
+
+    Only the image header is read, so draft builds never decode, hash or
+    embed pixel data, yet every figure takes exactly the space it will in
+    the final build.
+    """
+
+    digest = None
+    vector = False
+
+    def __init__(self, path, size):
+        self.path = path
+        self.width, self.height = size
+
+    def draw(self, canv, x, y, width, height):
+        canv.saveState()
+        canv.setFillColor(PLACEHOLDER_FILL)
+        canv.setStrokeColor(PLACEHOLDER_LINE)
+        canv.rect(x, y, width, height, stroke=1, fill=1)
+        canv.line(x, y, x + width, y + height)
+        canv.line(x, y + height, x + width, y)
+        canv.setFillColor(PLACEHOLDER_LINE)
+        canv.setFont("Helvetica", 9)
+        canv.drawCentredString(x + width / 2, y + height / 2 - 3,
+                               f"{os.path.basename(self.path)}  ({self.width}x{self.height})")
+        canv.restoreState()
+
+    def tile(self, bounds, index):
+        top, bottom = bounds[index]
+        return PlaceholderAsset(self.path, (self.width, bottom - top))
+
+
+class ScreenshotCache:
+    """Process-wide screenshot registry keyed by path and by content
+
+    Path entries also carry the file's modification time and size, so a
+    long-running process (--watch) picks up screenshots replaced on disk.
+    """
+
+    def __init__(self, level=DEFAULT_LEVEL):
+        self.level = level  # zlib level for images that are decoded
+        self._by_path = {}
+        self._by_digest = {}
+        self._placeholders = {}
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        """Asset for an image path, or None when the file does not exist"""
+        path = os.path.abspath(path)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            if key in self._by_path:
+                return self._by_path[key]
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            digest = hashlib.sha1(data).hexdigest()
+        with self._lock:
+            asset = self._by_digest.get(digest)
+        if asset is None:
+            if is_vector(path):
+                asset = VectorAsset(path, digest, load_drawing(path, digest))
+            else:
+                with PILImage.open(path) as im:
+                    asset = ScreenshotAsset(path, digest, im.size, self.level)
+        with self._lock:
+            # identical files in different directories share one prepared stream
+            asset = self._by_digest.setdefault(digest, asset)
+            self._by_path[key] = asset
+            return asset
+
+    def placeholder(self, path):
+        """Draft placeholder for an image path, or None when the file does not exist
+
+        Vector assets have no pixels to skip and are returned as they are.
+        """
+        path = os.path.abspath(path)
+        if is_vector(path):
+            return self.get(path)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            if key in self._placeholders:
+                return self._placeholders[key]
+        with PILImage.open(path) as im:  # reads the header only
+            asset = PlaceholderAsset(path, im.size)
+        with self._lock:
+            return self._placeholders.setdefault(key, asset)
+
+    def prepare_all(self, assets, pool):
+        """Decode and compress raster assets concurrently, ahead of the layout that draws them"""
+        pending = {asset.digest: asset for asset in assets if isinstance(asset, (ScreenshotAsset, TileAsset))}
+        for future in [pool.submit(asset.prepared) for asset in pending.values()]:
+            future.result()  # a broken image fails here rather than mid-layout
+        return len(pending)
+
+    def __len__(self):
+        return len(self._by_digest)
@@ -0,0 +1,401 @@
+"""
+Document build pipeline
+Builds any set of documents, in any set of locales, in one process, sharing
+styles, fonts, message catalogs and prepared screenshots between them
+"""
+
+from reportlab.platypus import SimpleDocTemplate
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, asdict, replace
+import functools
+import multiprocessing
+import os
+import threading
+import time
+from datetime import datetime
+
+from .assets import ScreenshotCache
+from .build_queue import BuildQueue
+from .compression import DEFAULT_LEVEL, CompressingCanvas, StreamCompressor
+from .config import PAGE_SIZE, PAGE_MARGIN
+from .documents import DOCUMENTS
+from .preflight import preflight
+from .page_manifest import PageManifestBuilder, manifest_path
+from .publish import PublishLock, discard, temp_path
+from .html_output import write_html
+from .incremental import publish_incremental
+from .i18n import Catalog, SOURCE_LOCALE, localize
+from .reproducible import dated_canvas, fixed_build_date, inputs_hash, is_up_to_date, write_stamp
+from .search_index import SearchIndexBuilder, index_path
+from .sources import screenshot_source
+from .styles import STYLE_SETS
+from .thumbnails import render_thumbnails, thumbnail_dir
+
+IMAGE_BUILDS = 2  # concurrent builds that also render images (HTML variants, thumbnails)
+
+
+@dataclass
+class BuildOptions:
+    """Switches that apply to every document in one invocation"""
+    deterministic: bool = False   # fixed dates, invariant PDF output, skip unchanged inputs
+    force: bool = False           # rebuild even when the inputs hash matches
+    search_index: bool = True     # emit <document>.search.json during layout
+    html: bool = False            # also render html/<document>.html from the same story
+    asset_store: str = None       # fetch screenshots from <asset_store>/<document>/ instead of screenshot_dir
+    thumbnails: str = None        # "webp" or "png": rasterize changed pages into thumbnails/<document>/
+    draft: bool = False           # placeholder boxes for screenshots, uncompressed streams, <document>-draft.pdf
+    page_compression: int = DEFAULT_LEVEL   # zlib level for page content streams
+    image_compression: int = DEFAULT_LEVEL  # zlib level for decoded images; passthrough PNGs keep their own
+    compress_threads: int = None  # threads compressing streams and images; None: one per core, 1: sequential
+    incremental: bool = False     # append changed objects to the published PDF instead of rewriting it
+
+    def fingerprint(self):
+        """Options that change the generated bytes, for the inputs hash
+
+        The asset store is left out because the fetched files themselves are
+        hashed, thumbnails because they are brought up to date on their own,
+        and compress_threads because the output is the same for any count.
+        """
+        settings = asdict(self)
+        del settings["force"], settings["asset_store"], settings["thumbnails"], settings["compress_threads"]
+        return settings
+
+
+class ClubOpsDocTemplate(SimpleDocTemplate):
+    """SimpleDocTemplate that reports every placed flowable to layout listeners
+
+    Listeners implement flowable_placed(flowable, page, frame) and see
+    flowables in final position, including the parts of split paragraphs and
+    tables; frame._y is the bottom of the flowable just placed.
+    """
+
+    def __init__(self, filename, listeners=(), **kw):
+        SimpleDocTemplate.__init__(self, filename, **kw)
+        self.listeners = list(listeners)
+
+    def afterFlowable(self, flowable):
+        for listener in self.listeners:
+            listener.flowable_placed(flowable, self.page, self.frame)
+
+
+def document_template(filename, config, options, listeners=(), template=ClubOpsDocTemplate, **kw):
+    """Doc template with the shared page geometry and the output settings of options"""
+    return template(
+        filename,
+        listeners=listeners,
+        pagesize=PAGE_SIZE,
+        rightMargin=PAGE_MARGIN,
+        leftMargin=PAGE_MARGIN,
+        topMargin=PAGE_MARGIN,
+        bottomMargin=PAGE_MARGIN,
+        title=config.title,
+        invariant=1 if options.deterministic else None,
+        # drafts are opened locally right away; compressing them only costs time
+        pageCompression=0 if options.draft else None,
+        **kw
+    )
+
+
+class SharedResources:
+    """Caches shared by every document built in one invocation
+
+    reportlab keeps font metrics process-wide, so building all documents in
+    one process also loads each font once.
+    """
+
+    def __init__(self, options=None):
+        self.options = options or BuildOptions()
+        if self.options.deterministic:
+            self.build_date = fixed_build_date([config.screenshot_dir for config in DOCUMENTS.values()])
+            self.pdf_date = self.build_date
+        else:
+            self.build_date = datetime.now()
+            self.pdf_date = None  # the clock, at the moment each PDF is created
+        self.screenshots = ScreenshotCache(self.options.image_compression)
+        self._styles = {}
+        self._catalogs = {}
+        self._fetched = {}
+        self._render_pool = None
+        self._compress_pool = None
+        self._lock = threading.Lock()
+
+    def styles(self, style_set):
+        """Style sheet for a style set, created on first request"""
+        with self._lock:
+            if style_set not in self._styles:
+                self._styles[style_set] = STYLE_SETS[style_set]()
+            return self._styles[style_set]
+
+    def catalog(self, locale):
+        """Message catalog for a locale, loaded on first request"""
+        with self._lock:
+            if locale not in self._catalogs:
+                self._catalogs[locale] = Catalog.load(locale)
+            return self._catalogs[locale]
+
+    def fetch_screenshots(self, config):
+        """Mirror a document's screenshots from the asset store, once per invocation
+
+        Returns the local directory and the files that could not be fetched.
+        Locale variants of a document share one fetch. The files are the
+        ones config.screenshots lists, so the fetch does not wait for the
+        story to be built (preflight checks the list is complete).
+        """
+        with self._lock:
+            entry = self._fetched.setdefault(config.name, [threading.Lock(), None])
+        with entry[0]:
+            if entry[1] is None:
+                source = screenshot_source(config, self.options.asset_store)
+                started = time.perf_counter()
+                entry[1] = source.sync(config.screenshots)
+                stats = source.stats
+                print(f"📥 {config.name}: {stats['fetched']} fetched ({stats['bytes'] / 1024:.0f} KB), "
+                      f"{stats['not_modified']} unchanged, {stats['failed']} failed "
+                      f"in {time.perf_counter() - started:.2f}s from {source.base_url}")
+            return entry[1]
+
+    def render_pool(self):
+        """Process pool for page rasterization, started on first use"""
+        with self._lock:
+            if self._render_pool is None:
+                self._render_pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+            return self._render_pool
+
+    def compress_pool(self):
+        """Thread pool for stream compression, started on first use; None when compression is sequential"""
+        with self._lock:
+            if self._compress_pool is None and self.options.compress_threads != 1:
+                self._compress_pool = ThreadPoolExecutor(self.options.compress_threads,
+                                                         thread_name_prefix="clubops-compress")
+            return self._compress_pool
+
+    def stream_compressor(self):
+        return StreamCompressor(self.compress_pool(), self.options.page_compression)
+
+    def canvasmaker(self, canvas=None):
+        """doc.build canvasmaker with the PDF dates of this invocation; by default compressing its pages"""
+        if canvas is None:
+            canvas = functools.partial(CompressingCanvas, compressor=self.stream_compressor())
+        return dated_canvas(self.pdf_date, canvas)
+
+    def close(self):
+        if self._render_pool is not None:
+            self._render_pool.shutdown()
+            self._render_pool = None
+        if self._compress_pool is not None:
+            self._compress_pool.shutdown()
+            self._compress_pool = None
+
+
+class BuildContext:
+    """Per-document state handed to every section builder"""
+
+    def __init__(self, config, shared):
+        self.config = config
+        self.shared = shared
+        self.options = shared.options
+        self.build_date = shared.build_date
+        self.styles = shared.styles(config.style_set)
+        self.catalog = shared.catalog(config.locale)
+        self.gettext = self.catalog.gettext
+        self.translate_rows = self.catalog.translate_rows
+        self.month_year = self.catalog.month_year
+        self.figures = []
+        self.problems = []
+        self.sections = []  # (label, first story index, end story index) per section builder
+
+
+def build_story(config, shared, quiet=False):
+    """Run every section builder of a document and return the context and story
+
+    A failing builder (for example invalid paragraph markup) is recorded as a
+    preflight problem so that one run reports every broken section.
+    """
+    ctx = BuildContext(config, shared)
+    story = []
+    for label, builder in config.sections:
+        if not quiet:
+            print(f"📝 Building {label}...")
+        start = len(story)
+        try:
+            builder(story, ctx)
+        except Exception as e:
+            ctx.problems.append(f"{label}: {type(e).__name__}: {' '.join(str(e).split())}")
+        ctx.sections.append((label, start, len(story)))
+    return ctx, story
+
+
+def write_thumbnails(config, shared):
+    started = time.perf_counter()
+    out_dir = thumbnail_dir(config.output_file)
+    rendered, total = render_thumbnails(config.output_file, out_dir, shared.options.thumbnails,
+                                        pool=shared.render_pool())
+    print(f"🖼️  Thumbnails: {rendered} of {total} page(s) rendered in {time.perf_counter() - started:.2f}s "
+          f"→ {out_dir}")
+
+
+def draft_output(output_file):
+    """<document>-draft.pdf next to the final PDF, so drafts are never published"""
+    stem, ext = os.path.splitext(output_file)
+    return f"{stem}-draft{ext}"
+
+
+def local_screenshots(config, shared):
+    """Config reading screenshots from the asset store's local mirror, if one is used
+
+    Returns the config and the screenshots that could not be fetched.
+    """
+    if not shared.options.asset_store:
+        return config, []
+    screenshot_dir, fetch_problems = shared.fetch_screenshots(config)
+    return replace(config, screenshot_dir=screenshot_dir), fetch_problems
+
+
+def build_document(config, shared=None):
+    """Generate one document PDF"""
+    shared = shared or SharedResources()
+    options = shared.options
+    print(f"🚀 Starting {config.title} PDF generation...")
+    started = time.perf_counter()
+    config, fetch_problems = local_screenshots(config, shared)
+    if options.draft:
+        config = replace(config, output_file=draft_output(config.output_file))
+    print(f"📁 Screenshot directory: {config.screenshot_dir}")
+    print(f"📄 Output file: {config.output_file}")
+
+    # one build per output at a time, across threads and processes
+    with PublishLock(config.output_file) as lock:
+        if lock.waited >= 0.01:
+            print(f"🔒 Waited {lock.waited:.2f}s for another build of {os.path.basename(config.output_file)}")
+        return _build_and_publish(config, shared, started, fetch_problems)
+
+
+def _build_and_publish(config, shared, started, fetch_problems):
+    options = shared.options
+    digest = None
+    if options.deterministic:
+        digest = inputs_hash(config, shared.build_date, options.fingerprint())
+        if not options.force and is_up_to_date(config.output_file, digest):
+            print(f"⏭️  Up to date (inputs {digest[:12]}), skipping generation\n")
+            if options.thumbnails:
+                write_thumbnails(config, shared)
+            return config.output_file
+
+    indexer = SearchIndexBuilder(config) if options.search_index else None
+    partial = temp_path(config.output_file)
+    doc = document_template(partial, config, options, listeners=[indexer] if indexer else [])
+    ctx, story = build_story(config, shared)
+    ctx.problems.extend(fetch_problems)
+    # revision notices (--changes) compare against the pages of the last published build
+    pages = None if options.draft else PageManifestBuilder(config, ctx, story, shared.build_date)
+    if pages:
+        doc.listeners.append(pages)
+
+    print("🔎 Running preflight checks...")
+    preflight(ctx, story)
+    print(f"✔️  Preflight passed: {len(ctx.figures)} figure(s) in {time.perf_counter() - started:.2f}s")
+
+    if options.html:
+        print(f"🌐 HTML: {write_html(config, story, lang=config.locale)}")
+
+    pool = None if options.draft else shared.compress_pool()
+    if pool:
+        prepare_started = time.perf_counter()
+        # a tiled figure prepares its bands rather than the whole image
+        prepared = shared.screenshots.prepare_all(
+            [figure.asset.tile(figure.tiles, 0) if figure.tiles else figure.asset for figure in ctx.figures], pool)
+        if prepared:
+            print(f"🗜️  {prepared} image(s) prepared in {time.perf_counter() - prepare_started:.2f}s")
+
+    print("🔨 Generating PDF document...")
+    try:
+        doc.build(story, canvasmaker=shared.canvasmaker())
+        # readers of the published path see the old file or the new one, never a partial one
+        if options.incremental:
+            appended = publish_incremental(partial, config.output_file)
+            print("🧩 Incremental update: " + ("rewrote the whole file" if appended is None else
+                                                f"appended {appended / 1024:.1f} KB to the published file"))
+        else:
+            os.replace(partial, config.output_file)
+    finally:
+        discard(partial)
+    if indexer:
+        print(f"🔍 Search index: {indexer.write(index_path(config.output_file))}")
+    if pages:
+        pages.write(manifest_path(config.output_file))
+    if digest:
+        write_stamp(config.output_file, digest)
+    if options.thumbnails:
+        write_thumbnails(config, shared)
+
+    file_size = os.path.getsize(config.output_file)
+    print(f"\n✅ PDF generated successfully!")
+    print(f"📄 File: {config.output_file}")
+    print(f"📊 Size: {file_size / 1024:.1f} KB ({file_size / (1024*1024):.2f} MB)")
+    print(f"⏱️  Build time: {time.perf_counter() - started:.2f}s")
+    print(f"📅 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    return config.output_file
+
+
+def build_matrix(names=None, locales=(SOURCE_LOCALE,)):
+    """(document, locale) configs to build; locales a document has no catalog for are skipped"""
+    configs = []
+    for name in (names or DOCUMENTS):
+        config = DOCUMENTS[name]
+        for locale in locales:
+            if locale in config.locales:
+                configs.append((config, locale))
+            else:
+                print(f"⚠️  {config.name} has no '{locale}' translation, skipping")
+    return configs
+
+
+def build_documents(names=None, shared=None, options=None, locales=(SOURCE_LOCALE,), max_workers=None,
+                    build=build_document):
+    """Generate several documents in one process; all documents, English only by default
+
+    Builds go through a BuildQueue with one worker per locale, so locale
+    variants of a document are laid out concurrently. They share the style
+    sheets, catalogs and prepared screenshots, so each extra locale only adds
+    its own layout time. build is the per-document build function
+    (build_document, or changes.build_changes for revision notices).
+    """
+    owned = shared is None
+    shared = shared or SharedResources(options)
+    try:
+        outputs = _build_all(shared, names, locales, max_workers, build)
+    finally:
+        if owned:
+            shared.close()
+    print(f"🖼️  {len(shared.screenshots)} distinct screenshot(s) prepared for {len(outputs)} document(s)")
+    return outputs
+
+
+def localized_configs(shared, names=None, locales=(SOURCE_LOCALE,)):
+    """Document configs for every (document, locale) pair to build"""
+    return [localize(config, shared.catalog(locale)) for config, locale in build_matrix(names, locales)]
+
+
+def job_kind(options):
+    """BuildQueue job kind: builds that also render images are capped separately"""
+    return "image" if options.html or options.thumbnails else "layout"
+
+
+def _build_all(shared, names, locales, max_workers, build):
+    configs = localized_configs(shared, names, locales)
+    queue = BuildQueue(shared, build, workers=max_workers or len(locales), limits={"image": IMAGE_BUILDS})
+    kind = job_kind(shared.options)
+    try:
+        futures = [queue.request(config, tenant=config.tenant, kind=kind) for config in configs]
+        outputs = [future.result() for future in futures]
+    finally:
+        queue.close()
+    if len(configs) > 1:
+        print(queue.report())
+    for locale in sorted({config.locale for config in configs}):
+        missing = shared.catalog(locale).missing
+        if missing:
+            print(f"⚠️  {len(missing)} untranslated string(s) in '{locale}', English used instead:")
+            for message in sorted(missing):
+                print(f"   - {message[:70]}")
+    return outputs
@@ -0,0 +1,217 @@
+"""
+Build queue
+Rebuild requests are queued per output file. A request for a document that
+is already waiting joins the waiting run instead of adding another, and a
+request that arrives while the document is being built schedules exactly
+one follow-up run, however many requests arrive meanwhile.
+
+Waiting jobs are scheduled by priority class first (an on-demand download
+before a nightly batch), then by deadline, counted back from the expected
+build time of that output, then by fairness between tenants: the tenant
+with the fewest running builds and the least build time used so far goes
+next. Each job kind can be capped separately, so image-heavy builds cannot
+occupy every worker. Latency percentiles are kept per priority class.
+
+A request may bring its own build function, so documents and per-club
+reports can share one queue: a nightly report batch then waits behind an
+interactive download, and each club is a tenant of its own.
+"""
+
+from collections import defaultdict, deque
+from concurrent.futures import Future
+import itertools
+import math
+import threading
+import time
+
+PRIORITIES = ("interactive", "normal", "batch")  # most urgent first
+KINDS = ("layout", "image")  # layout-bound builds, and builds that also render images (HTML, thumbnails)
+LATENCY_WINDOW = 1000  # finished builds kept per priority class for percentiles
+DURATION_SMOOTHING = 0.3  # weight of the newest build time in the expected build time
+
+
+def percentile(values, q):
+    """Nearest-rank percentile of a sorted list"""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, max(0, math.ceil(q / 100 * len(values)) - 1))]
+
+
+class BuildJob:
+    """One pending or running build and every request folded into it"""
+
+    def __init__(self, config, priority, deadline, tenant, kind, build, seq):
+        self.config = config
+        self.priority = priority
+        self.deadline = deadline  # perf_counter time by which the build should be finished, or None
+        self.tenant = tenant
+        self.kind = kind
+        self.build = build  # build(config, shared) for this request, or None for the queue's
+        self.seq = seq
+        self.future = Future()
+        self.queued = time.perf_counter()
+        self.requests = 1
+
+    def merge(self, config, priority, deadline, tenant, kind, build):
+        """Fold another request for the same output into this job, keeping the most urgent terms
+
+        The newest request decides what is built, so its tenant is charged
+        for the build and its kind counts against the limits.
+        """
+        self.config, self.tenant, self.kind, self.build = config, tenant, kind, build
+        self.requests += 1
+        self.priority = min(self.priority, priority, key=PRIORITIES.index)
+        if deadline is not None:
+            self.deadline = deadline if self.deadline is None else min(self.deadline, deadline)
+
+
+class BuildQueue:
+    """Worker threads that build queued documents with shared resources
+
+    The same output file is never built by two workers at once; different
+    documents and locales build in parallel up to the number of workers and
+    the per-kind limits (for example {"image": 2}).
+    """
+
+    def __init__(self, shared, build=None, workers=1, limits=None):
+        self.shared = shared
+        self.build = build  # build(config, shared) -> output path, for requests that bring none
+        self.limits = dict(limits or {})
+        self._pending = {}  # output file -> BuildJob
+        self._running = set()
+        self._kind_running = defaultdict(int)
+        self._tenant_running = defaultdict(int)
+        self._tenant_usage = defaultdict(float)  # build seconds since the queue was last idle
+        self._expected = {}  # output file -> smoothed build time
+        self._latency = defaultdict(lambda: deque(maxlen=LATENCY_WINDOW))  # priority -> (wait, total)
+        self._missed = defaultdict(int)
+        self._seq = itertools.count()
+        self._closed = False
+        self._cond = threading.Condition()
+        self._threads = [threading.Thread(target=self._work, name=f"clubops-build-{i}", daemon=True)
+                         for i in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def request(self, config, priority="normal", deadline=None, tenant=None, kind="layout", build=None):
+        """Ask for a build of config; returns a Future for the output path
+
+        deadline is in seconds from now. tenant defaults to config.tenant (a
+        document, or the club of a per-club report), then to the document
+        name. build replaces the queue's build function for this request.
+        """
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority {priority!r}; expected one of {', '.join(PRIORITIES)}")
+        if kind not in KINDS:
+            raise ValueError(f"Unknown job kind {kind!r}; expected one of {', '.join(KINDS)}")
+        key = config.output_file
+        tenant = tenant or config.tenant or config.name
+        due = time.perf_counter() + deadline if deadline is not None else None
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("build queue is closed")
+            job = self._pending.get(key)
+            if job is not None:
+                job.merge(config, priority, due, tenant, kind, build)
+                return job.future
+            job = self._pending[key] = BuildJob(config, priority, due, tenant, kind, build, next(self._seq))
+            self._cond.notify()
+            return job.future
+
+    def _rank(self, key, job):
+        latest_start = job.deadline - self._expected.get(key, 0.0) if job.deadline is not None else math.inf
+        return (PRIORITIES.index(job.priority), latest_start,
+                self._tenant_running[job.tenant], self._tenant_usage[job.tenant], job.seq)
+
+    def _next(self):
+        best = None
+        for key, job in self._pending.items():
+            if key in self._running or self._kind_running[job.kind] >= self.limits.get(job.kind, math.inf):
+                continue
+            rank = self._rank(key, job)
+            if best is None or rank < best[0]:
+                best = (rank, key, job)
+        if best is None:
+            return None
+        _, key, job = best
+        del self._pending[key]
+        self._running.add(key)
+        self._kind_running[job.kind] += 1
+        self._tenant_running[job.tenant] += 1
+        return key, job
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while not (found := self._next()):
+                    if self._closed and not self._pending:
+                        return
+                    self._cond.wait()
+            key, job = found
+            started = time.perf_counter()
+            try:
+                job.future.set_result((job.build or self.build)(job.config, self.shared))
+            except BaseException as e:
+                job.future.set_exception(e)
+            finally:
+                finished = time.perf_counter()
+                merged = f", {job.requests} requests merged" if job.requests > 1 else ""
+                late = f", {finished - job.deadline:.2f}s past its deadline" \
+                    if job.deadline is not None and finished > job.deadline else ""
+                print(f"⏱️  {job.config.name} [{job.config.locale}] ({job.priority}): "
+                      f"waited {started - job.queued:.2f}s in queue, built in {finished - started:.2f}s{merged}{late}")
+                with self._cond:
+                    self._finished(key, job, started, finished)
+                    self._cond.notify_all()
+
+    def _finished(self, key, job, started, finished):
+        duration = finished - started
+        self._running.discard(key)
+        self._kind_running[job.kind] -= 1
+        self._tenant_running[job.tenant] -= 1
+        self._tenant_usage[job.tenant] += duration
+        previous = self._expected.get(key)
+        self._expected[key] = duration if previous is None else \
+            DURATION_SMOOTHING * duration + (1 - DURATION_SMOOTHING) * previous
+        self._latency[job.priority].append((started - job.queued, finished - job.queued))
+        if job.deadline is not None and finished > job.deadline:
+            self._missed[job.priority] += 1
+        if not self._pending and not self._running:
+            self._tenant_usage.clear()  # fairness is about contention; an idle queue starts even
+
+    def stats(self):
+        """{priority: {"builds", "missed_deadlines", "wait": {...}, "total": {...}}} with p50/p90/p99/max in seconds"""
+        with self._cond:
+            samples = {priority: list(values) for priority, values in self._latency.items()}
+            missed = dict(self._missed)
+        result = {}
+        for priority in PRIORITIES:
+            if priority not in samples:
+                continue
+            entry = {"builds": len(samples[priority]), "missed_deadlines": missed.get(priority, 0)}
+            for index, name in enumerate(("wait", "total")):
+                values = sorted(sample[index] for sample in samples[priority])
+                entry[name] = {f"p{q}": percentile(values, q) for q in (50, 90, 99)}
+                entry[name]["max"] = values[-1]
+            result[priority] = entry
+        return result
+
+    def report(self):
+        """One line of latency percentiles per priority class"""
+        lines = []
+        for priority, entry in self.stats().items():
+            wait, total = entry["wait"], entry["total"]
+            missed = f", {entry['missed_deadlines']} missed deadline(s)" if entry["missed_deadlines"] else ""
+            lines.append(f"📊 {priority}: {entry['builds']} build(s), queue wait p50 {wait['p50']:.2f}s "
+                         f"p90 {wait['p90']:.2f}s p99 {wait['p99']:.2f}s, request to done p50 {total['p50']:.2f}s "
+                         f"p90 {total['p90']:.2f}s p99 {total['p99']:.2f}s{missed}")
+        return "\n".join(lines)
+
+    def close(self, wait=True):
+        """Stop accepting requests; workers exit once the queue is drained"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
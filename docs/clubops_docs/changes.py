@@ -0,0 +1,277 @@
+"""
+Revision notices
+Compares a fresh build of a document with the page manifest of its last
+published build and writes <document>-changes.pdf: a summary page, then only
+the pages that differ, with change bars beside the edited content and the
+page they replace in the top margin.
+
+Sections whose content hash is unchanged are not laid out at all. Sections
+separated by page breaks paginate independently, so every run of sections
+up to a page break (a layout unit) that contains a changed section is laid
+out on its own and compared page by page with the published pages. The
+notice then lays those units out once more and drops their unchanged pages
+before anything on them is drawn.
+"""
+
+from reportlab.lib.colors import HexColor
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import ActionFlowable, PageBreak
+from dataclasses import dataclass, field, replace
+from difflib import SequenceMatcher
+import io
+import os
+import time
+
+from .build import ClubOpsDocTemplate, SharedResources, build_story, document_template, local_screenshots
+from .config import RED
+from .flowables import data_table
+from .page_manifest import PageManifestBuilder, load_manifest, manifest_path, section_hashes, section_titles
+from .paragraphs import Paragraph
+from .preflight import preflight
+from .publish import PublishLock, discard, temp_path
+
+CHANGE_BAR_COLOR = RED
+CHANGE_BAR_WIDTH = 3
+CHANGE_BAR_OFFSET = 12  # points left of the text frame
+DELETION_MARK = 4       # half height of the bar marking removed content
+HEADER_COLOR = HexColor("#64748B")
+
+
+def changes_output(output_file):
+    """<document>-changes.pdf next to the published PDF"""
+    stem, ext = os.path.splitext(output_file)
+    return f"{stem}-changes{ext}"
+
+
+def layout_units(ctx, story):
+    """Section indices grouped into runs that end with a page break"""
+    units, current = [], []
+    for index, (_, start, end) in enumerate(ctx.sections):
+        current.append(index)
+        if end > start and isinstance(story[end - 1], PageBreak):
+            units.append(current)
+            current = []
+    if current:
+        units.append(current)
+    return units
+
+
+def unit_story(ctx, story, unit):
+    return story[ctx.sections[unit[0]][1]:ctx.sections[unit[-1]][2]]
+
+
+class LayoutOnlyCanvas(Canvas):
+    """Canvas that drops every page and writes nothing: pagination without output"""
+
+    def showPage(self):
+        self._startPage()
+
+    def save(self):
+        pass
+
+
+def measure(config, shared, ctx, story, unit):
+    """Page manifest entries of one layout unit, laid out on its own"""
+    pages = PageManifestBuilder(config, ctx, story)
+    doc = document_template(io.BytesIO(), config, shared.options, listeners=[pages])
+    doc.build(unit_story(ctx, story, unit), canvasmaker=LayoutOnlyCanvas)
+    return pages.to_dict()["pages"]
+
+
+def changed_bands(previous, page):
+    """Vertical extents on a page that differ from the published page
+
+    Content that was removed is marked by a short bar where it used to be.
+    """
+    if previous is None:
+        return page["bands"]
+    bands = []
+    matcher = SequenceMatcher(None, previous["items"], page["items"], autojunk=False)
+    for tag, _, _, j1, j2 in matcher.get_opcodes():
+        if tag in ("replace", "insert"):
+            bands.extend(page["bands"][j1:j2])
+        elif tag == "delete" and page["bands"]:
+            y = page["bands"][j1][1] if j1 < len(page["bands"]) else page["bands"][-1][0]
+            bands.append([y - DELETION_MARK, y + DELETION_MARK])
+    return bands
+
+
+@dataclass
+class UnitPlan:
+    """Pages of one layout unit that go into the notice"""
+    sections: list
+    keep: dict = field(default_factory=dict)  # unit page index -> (page, published page or None, bands)
+
+
+class UnitStart(ActionFlowable):
+    """Marks where a layout unit begins in the notice story"""
+
+    def __init__(self, plan):
+        ActionFlowable.__init__(self)
+        self.plan = plan
+
+    def apply(self, doc):
+        doc.start_unit(self.plan)
+
+
+class NoticeCanvas(Canvas):
+    """Canvas that leaves out the pages its doc template marks as discarded"""
+
+    discarding = False
+
+    def showPage(self):
+        if self.discarding:
+            self._startPage()
+        else:
+            Canvas.showPage(self)
+
+
+class NoticeDocTemplate(ClubOpsDocTemplate):
+    """Lays out changed units again, keeping only their changed pages
+
+    Whether a page is kept is decided when it begins, so the flowables on a
+    dropped page never embed their images.
+    """
+
+    def __init__(self, filename, gettext=str, **kw):
+        ClubOpsDocTemplate.__init__(self, filename, **kw)
+        self.gettext = gettext
+        self.plan = None
+        self.plan_first_page = 0
+
+    def start_unit(self, plan):
+        self.plan = plan
+        self.plan_first_page = self.page
+        self._choose_page()
+
+    def handle_pageBegin(self):
+        ClubOpsDocTemplate.handle_pageBegin(self)
+        self._choose_page()
+
+    def _choose_page(self):
+        self.canv.discarding = self.plan is not None and self._unit_page() not in self.plan.keep
+
+    def _unit_page(self):
+        return self.page - self.plan_first_page
+
+    def afterPage(self):
+        if self.plan is None or self.canv.discarding:
+            return
+        _ = self.gettext
+        page, published, bands = self.plan.keep[self._unit_page()]
+        canv = self.canv
+        canv.saveState()
+        canv.setFillColor(CHANGE_BAR_COLOR)
+        for bottom, top in bands:
+            canv.rect(self.leftMargin - CHANGE_BAR_OFFSET, bottom, CHANGE_BAR_WIDTH, top - bottom, stroke=0, fill=1)
+        if published is None:
+            label = _("Page {page}, new page").format(page=page)
+        else:
+            label = _("Page {page}, replaces page {previous}").format(page=page, previous=published)
+        canv.setFillColor(HEADER_COLOR)
+        canv.setFont("Helvetica", 8)
+        canv.drawRightString(self.pagesize[0] - self.rightMargin, self.pagesize[1] - self.topMargin / 2, label)
+        canv.restoreState()
+
+
+def summary_story(ctx, manifest, rows, pages, previous_pages):
+    """Cover page of the notice: what changed and where"""
+    _ = ctx.gettext
+    styles = ctx.styles
+    body = styles[ctx.config.body_style]
+    story = [
+        Paragraph(_("Revision Notice"), styles["SectionTitle"]),
+        Paragraph(ctx.config.title, body),
+        Paragraph(_("Changes since the edition built on {date}.").format(date=(manifest["built"] or "")[:10]), body),
+    ]
+    if rows:
+        story.append(data_table([[_("Section"), _("Change"), _("Pages")]] + rows))
+        story.append(Paragraph(_("Change bars in the margin mark edited content."), body))
+    else:
+        story.append(Paragraph(_("No content changed since that edition."), body))
+    if pages != previous_pages:
+        story.append(Paragraph(_("The document now has {pages} pages (previously {previous}).").format(
+            pages=pages, previous=previous_pages), body))
+    story.append(PageBreak())
+    return story
+
+
+def build_changes(config, shared=None):
+    """Write a revision notice with the pages that changed since the last published build"""
+    shared = shared or SharedResources()
+    options = shared.options
+    started = time.perf_counter()
+    manifest = load_manifest(manifest_path(config.output_file))
+    if manifest is None:
+        raise RuntimeError(f"No page manifest for the published {config.title} "
+                           f"({manifest_path(config.output_file)}); publish a full build first")
+    print(f"📑 Comparing {config.title} with the build of {manifest['built']}...")
+    config, fetch_problems = local_screenshots(config, shared)
+    ctx, story = build_story(config, shared, quiet=True)
+    ctx.problems.extend(fetch_problems)
+    preflight(ctx, story)
+    _ = ctx.gettext
+
+    hashes = section_hashes(ctx, story)
+    titles = section_titles(ctx, story)
+    published = {section["label"]: section for section in manifest["sections"]}
+    published_labels = [section["label"] for section in manifest["sections"]]
+    plans, rows = [], []
+    page, laid_out, changed_sections = 1, 0, 0
+    for unit in layout_units(ctx, story):
+        labels = {ctx.sections[index][0] for index in unit}
+        old_pages = [(number, old) for number, old in enumerate(manifest["pages"], 1)
+                     if any(published_labels[index] in labels for index in old["sections"])]
+        changed = [index for index in unit
+                   if published.get(ctx.sections[index][0], {}).get("hash") != hashes[index]]
+        if not changed:
+            page += len(old_pages)
+            continue
+        changed_sections += len(changed)
+        new_pages = measure(config, shared, ctx, story, unit)
+        laid_out += len(new_pages)
+        plan = UnitPlan(unit)
+        for i, new in enumerate(new_pages):
+            number, old = old_pages[i] if i < len(old_pages) else (None, None)
+            if old is None or old["hash"] != new["hash"]:
+                plan.keep[i] = (page + i, number, changed_bands(old, new))
+        for index in unit:
+            kept = [plan.keep[i][0] for i, new in enumerate(new_pages) if i in plan.keep and index in new["sections"]]
+            if index not in changed and not kept:
+                continue
+            label = ctx.sections[index][0]
+            change = _("new") if label not in published else _("revised") if index in changed else _("reflowed")
+            rows.append([titles[index], change, ", ".join(map(str, kept)) or "-"])
+        if plan.keep:
+            plans.append(plan)
+        page += len(new_pages)
+    current = {section[0] for section in ctx.sections}
+    rows.extend([section["title"], _("removed"), "-"] for section in manifest["sections"]
+                if section["label"] not in current)
+
+    # a second, fresh story: layout splits and wraps flowables, so the measured ones are spent
+    notice_ctx, notice_story = build_story(config, shared, quiet=True)
+    flowables = summary_story(notice_ctx, manifest, rows, page - 1, len(manifest["pages"]))
+    for plan in plans:
+        if not isinstance(flowables[-1], PageBreak):
+            flowables.append(PageBreak())
+        flowables.append(UnitStart(plan))
+        flowables.extend(unit_story(notice_ctx, notice_story, plan.sections))
+
+    output_file = changes_output(config.output_file)
+    notice = replace(config, title=f"{config.title} - {_('Revision Notice')}")
+    with PublishLock(output_file):
+        partial = temp_path(output_file)
+        try:
+            doc = document_template(partial, notice, options, template=NoticeDocTemplate, gettext=_)
+            doc.build(flowables, canvasmaker=shared.canvasmaker(NoticeCanvas))
+            os.replace(partial, output_file)
+        finally:
+            discard(partial)
+
+    emitted = sum(len(plan.keep) for plan in plans)
+    print(f"📑 Revision notice: {changed_sections} of {len(ctx.sections)} section(s) changed, "
+          f"{emitted} page(s) emitted, {laid_out} of {page - 1} page(s) laid out")
+    print(f"📄 File: {output_file} ({os.path.getsize(output_file) / 1024:.1f} KB)")
+    print(f"⏱️  Build time: {time.perf_counter() - started:.2f}s\n")
+    return output_file
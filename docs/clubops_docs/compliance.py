@@ -0,0 +1,187 @@
+"""
+License compliance rosters
+Reads the dancers table of a SQLite export of database/schema.sql and writes
+one color-coded roster PDF per club, with every active dancer in the bucket
+the Dancer Management screen would show: Expired, Expiring Soon, Pending or
+Valid.
+
+All clubs come out of one query ordered by club and license expiry date
+(the order of idx_dancers_license_expiry), so each club's dated licenses
+arrive sorted and the Expired / Expiring Soon / Valid boundaries are found
+by binary search for today and the end of the 14-day window. ISO dates
+compare as text in date order, so the expiry column is never parsed to
+bucket a row.
+"""
+
+from reportlab.lib.colors import black, white
+from reportlab.platypus import Spacer
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+import itertools
+import os
+import time
+
+from .build import SharedResources
+from .config import BLUE, COMPLIANCE_DIR, GOLD, GREEN, RED
+from .flowables import data_table
+from .paragraphs import Paragraph
+from .reports import (build_reports, club_slug, load_clubs, open_export, report_config, title_paragraph,
+                      write_report)
+
+EXPIRING_DAYS = 14  # "Expiring Soon" window, as in the app's compliance alerts
+BUCKETS = ("Expired", "Expiring Soon", "Pending", "Valid")  # most urgent first
+BUCKET_COLORS = {"Expired": (RED, white), "Expiring Soon": (GOLD, black), "Pending": (BLUE, white),
+                 "Valid": (GREEN, black)}  # header background and text
+REVOKED = ("expired", "suspended")  # license_status values that cannot perform whatever the date
+
+DANCERS_QUERY = """
+    SELECT club_id, stage_name, legal_name, license_number, license_expiry_date, license_status
+    FROM dancers
+    WHERE COALESCE(is_active, 1) NOT IN (0, '0', 'f', 'false')
+    ORDER BY club_id, license_expiry_date, stage_name
+"""
+
+
+@dataclass(frozen=True)
+class Dancer:
+    stage_name: str
+    legal_name: str
+    license_number: str
+    expiry: str  # ISO date as stored, or None
+    status: str
+
+
+@dataclass
+class ClubRoster:
+    """One club's active dancers, dated licenses in expiry order"""
+    club_id: str
+    name: str
+    subdomain: str
+    dancers: list = field(default_factory=list)
+
+    def buckets(self, today, days=EXPIRING_DAYS):
+        """{bucket: [Dancer]} as of today
+
+        A pending application, or a license without an expiry date on file,
+        is Pending; a license marked expired or suspended is Expired whatever
+        its date. The remaining licenses are bucketed by where today and
+        today + days fall in their sorted expiry dates.
+        """
+        pending, revoked, dated = [], [], []
+        for dancer in self.dancers:
+            if dancer.status in REVOKED:
+                revoked.append(dancer)
+            elif dancer.status == "pending" or not dancer.expiry:
+                pending.append(dancer)
+            else:
+                dated.append(dancer)
+        expiries = [dancer.expiry for dancer in dated]
+        # expiring soon: today <= expiry < today + days + 1 (stored timestamps sort after their date)
+        first_current = bisect_left(expiries, today.isoformat())
+        first_valid = bisect_left(expiries, (today + timedelta(days=days + 1)).isoformat(), first_current)
+        return {
+            "Expired": revoked + dated[:first_current],
+            "Expiring Soon": dated[first_current:first_valid],
+            "Pending": pending,
+            "Valid": dated[first_valid:],
+        }
+
+
+def load_rosters(db_path):
+    """ClubRoster for every club in a SQLite export, in club name order"""
+    connection = open_export(db_path)
+    try:
+        rosters = {club_id: ClubRoster(str(club_id), name, subdomain)
+                   for club_id, name, subdomain in load_clubs(connection)}
+        for club_id, rows in itertools.groupby(connection.execute(DANCERS_QUERY), key=lambda row: row[0]):
+            roster = rosters.get(club_id)
+            if roster is not None:
+                roster.dancers = [Dancer(*row[1:]) for row in rows]
+    finally:
+        connection.close()
+    return list(rosters.values())
+
+
+def roster_output(roster, out_dir=COMPLIANCE_DIR):
+    """<out_dir>/<subdomain>-compliance.pdf"""
+    return os.path.join(out_dir, f"{club_slug(roster.subdomain, roster.club_id)}-compliance.pdf")
+
+
+def days_left(expiry, today):
+    try:
+        return str((date.fromisoformat(expiry[:10]) - today).days)
+    except (TypeError, ValueError):
+        return "-"
+
+
+def roster_story(ctx, roster, buckets, today):
+    """Summary of the bucket counts, then a color-coded table per non-empty bucket"""
+    styles = ctx.styles
+    body = styles[ctx.config.body_style]
+    swatches = []
+    for row, bucket in enumerate(BUCKETS, 1):
+        background, text = BUCKET_COLORS[bucket]
+        swatches += [("BACKGROUND", (0, row), (0, row), background), ("TEXTCOLOR", (0, row), (0, row), text)]
+    story = [
+        title_paragraph(ctx),
+        Paragraph(f"{len(roster.dancers)} active dancer(s) as of {today.isoformat()}. Licenses expiring "
+                  f"within {EXPIRING_DAYS} days are listed as Expiring Soon.", body),
+        data_table([["Status", "Dancers"]] + [[bucket, str(len(buckets[bucket]))] for bucket in BUCKETS],
+                   extra_styles=swatches),
+    ]
+    for bucket in BUCKETS:
+        dancers = buckets[bucket]
+        if not dancers:
+            continue
+        background, text = BUCKET_COLORS[bucket]
+        story.append(Spacer(1, 12))
+        story.append(Paragraph(f"{bucket} ({len(dancers)})", styles["SubSection"]))
+        rows = [["Stage name", "Legal name", "License", "Expires", "Days left", "Status"]]
+        rows.extend([dancer.stage_name or "", dancer.legal_name or "", dancer.license_number or "-",
+                     (dancer.expiry or "-")[:10], days_left(dancer.expiry, today), dancer.status or "-"]
+                    for dancer in dancers)
+        story.append(data_table(rows, header_bg=background, header_fg=text, repeat_header=True))
+    return story
+
+
+def roster_report(roster, buckets, today, out_dir=COMPLIANCE_DIR):
+    """(config, story builder) of one club's roster, charged to the club"""
+    config = report_config("compliance", f"{roster.name} License Compliance Roster", roster_output(roster, out_dir),
+                           tenant=club_slug(roster.subdomain, roster.club_id))
+    return config, lambda ctx: roster_story(ctx, roster, buckets, today)
+
+
+def build_roster(roster, buckets, shared, today, out_dir=COMPLIANCE_DIR):
+    """Write one club's roster PDF from its buckets; returns its path"""
+    config, story_builder = roster_report(roster, buckets, today, out_dir)
+    return write_report(config, shared, story_builder)
+
+
+def build_rosters(db_path, out_dir=COMPLIANCE_DIR, shared=None, options=None, today=None, queue=None):
+    """Roster PDFs for every club in the export in one pass; returns their paths
+
+    today defaults to the build date, so deterministic builds bucket against
+    the pinned date. The rosters are batch jobs on queue, one tenant per
+    club (see reports.build_reports).
+    """
+    owned = shared is None
+    shared = shared or SharedResources(options)
+    today = today or shared.build_date.date()
+    started = time.perf_counter()
+    os.makedirs(out_dir, exist_ok=True)
+    try:
+        rosters = load_rosters(db_path)
+        print(f"🪪 {sum(len(roster.dancers) for roster in rosters)} active dancer(s) in {len(rosters)} club(s) "
+              f"from {db_path}")
+        buckets = [roster.buckets(today) for roster in rosters]
+        outputs = build_reports([roster_report(roster, club_buckets, today, out_dir)
+                                 for roster, club_buckets in zip(rosters, buckets)], shared, queue)
+        for roster, club_buckets, output in zip(rosters, buckets, outputs):
+            print(f"   {roster.name}: " + ", ".join(f"{len(club_buckets[bucket])} {bucket.lower()}"
+                                                    for bucket in BUCKETS) + f" → {output}")
+    finally:
+        if owned:
+            shared.close()
+    print(f"✅ {len(outputs)} compliance roster(s) as of {today.isoformat()} in {time.perf_counter() - started:.2f}s")
+    return outputs
@@ -0,0 +1,60 @@
+"""
+Shared configuration for the ClubOps documentation builds
+Brand colors, page geometry and default locations
+"""
+
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.lib.colors import HexColor
+from dataclasses import dataclass, field
+import os
+
+# Locations
+DOCS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MANUAL_DIR = os.path.join(DOCS_DIR, "manual")
+UI_GUIDE_DIR = os.path.join(DOCS_DIR, "pdf-v3")
+COMPLIANCE_DIR = os.path.join(DOCS_DIR, "compliance")
+OCCUPANCY_DIR = os.path.join(DOCS_DIR, "vip-occupancy")
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "clubops_docs")
+
+# Page geometry (all documents share the letter layout)
+PAGE_SIZE = letter
+PAGE_MARGIN = 0.75*inch
+FRAME_WIDTH = PAGE_SIZE[0] - 2 * PAGE_MARGIN
+FRAME_HEIGHT = PAGE_SIZE[1] - 2 * PAGE_MARGIN
+
+# Default table width (auto-sized tables span it)
+TABLE_WIDTH = 6*inch
+
+# Default screenshot box
+SCREENSHOT_MAX_WIDTH = 6.5*inch
+SCREENSHOT_MAX_HEIGHT = 4.5*inch
+
+# ClubOps Brand Colors
+GOLD = HexColor("#F59E0B")
+ELECTRIC = HexColor("#3B82F6")
+ROYAL = HexColor("#8B5CF6")
+DARK_BG = HexColor("#0F172A")
+BLUE = HexColor("#2563EB")
+RED = HexColor("#DC2626")
+GREEN = HexColor("#22C55E")
+STATUS_SUCCESS = GREEN
+STATUS_DANGER = RED
+
+
+@dataclass
+class DocumentConfig:
+    """Everything that distinguishes one generated document from another"""
+    name: str
+    title: str
+    screenshot_dir: str
+    output_file: str
+    style_set: str
+    body_style: str
+    sections: list = field(default_factory=list)  # (progress label, builder) pairs
+    screenshots: tuple = ()  # every file the sections add, fetched up front from an asset store
+    figure_spacing: float = 0
+    locale: str = "en"
+    locales: tuple = ("en",)  # locales with a complete catalog for this document
+    tenant: str = None  # who a BuildQueue charges the build to: the document, or a report's club
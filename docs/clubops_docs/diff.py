@@ -0,0 +1,332 @@
+"""
+Screenshot diff report
+Compares a document's recaptured screenshots with the previously published
+ones (from git or a directory) and writes a change manifest plus an appendix
+PDF with side-by-side highlights, both next to the document's PDF:
+<document>-screenshot-diff.json and <document>-screenshot-diff.pdf.
+
+Nothing is written into the screenshot directory, so a diff run does not
+change the inputs hash of --deterministic builds or wake --watch. The
+manifest carries no wall-clock time: the same screenshots against the same
+baseline give the same manifest.
+
+Needs NumPy (pip install numpy); everything else works without it.
+"""
+
+from reportlab.lib.pagesizes import letter, landscape
+from reportlab.lib.units import inch
+from reportlab.lib.colors import white
+from reportlab.platypus import SimpleDocTemplate, Spacer, Image, PageBreak, Table, TableStyle
+from PIL import Image as PILImage, ImageDraw
+from xml.sax.saxutils import escape
+import argparse
+import functools
+import hashlib
+import io
+import json
+import os
+import subprocess
+import sys
+
+from .config import DARK_BG
+from .documents import DOCUMENTS
+from .flowables import data_table
+from .paragraphs import Paragraph
+from .publish import PublishLock, atomic_write, discard, temp_path
+from .reproducible import dated_canvas, fixed_build_date
+from .styles import STYLE_SETS
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+BASELINE_REF = "HEAD"
+
+# Comparison tuning
+TILE_SIZE = 32            # tile edge in pixels
+PIXEL_THRESHOLD = 24      # per-channel delta below this is treated as noise
+TILE_THRESHOLD = 0.005    # fraction of differing pixels that marks a tile changed
+PREVIEW_WIDTH = 900       # width of the highlighted previews in the appendix
+HIGHLIGHT = (220, 38, 38)
+
+PAGE_SIZE = landscape(letter)
+MARGIN = 0.5*inch
+
+
+def available():
+    return np is not None
+
+
+def diff_output(output_file, ext=".pdf"):
+    """<document>-screenshot-diff.pdf (or .json) next to the published PDF"""
+    return f"{os.path.splitext(output_file)[0]}-screenshot-diff{ext}"
+
+
+@functools.lru_cache(maxsize=None)
+def _dct_matrix(n):
+    """Orthonormal DCT-II basis used by the perceptual hash"""
+    k = np.arange(n)[:, None]
+    x = np.arange(n)[None, :]
+    m = np.cos(np.pi * (2 * x + 1) * k / (2 * n)) * np.sqrt(2.0 / n)
+    m[0] /= np.sqrt(2.0)
+    return m
+
+
+def perceptual_hash(img):
+    """64-bit DCT perceptual hash of a PIL image, as a hex string"""
+    dct = _dct_matrix(32)
+    small = np.asarray(img.convert("L").resize((32, 32), PILImage.LANCZOS), dtype=np.float64)
+    low = (dct @ small @ dct.T)[:8, :8].ravel()
+    bits = low > np.median(low[1:])
+    return "%016x" % int("".join("1" if b else "0" for b in bits), 2)
+
+
+def hamming(hash_a, hash_b):
+    """Number of differing bits between two perceptual hashes"""
+    return bin(int(hash_a, 16) ^ int(hash_b, 16)).count("1")
+
+
+def changed_tiles(old, new, tile=TILE_SIZE):
+    """Boolean grid of tiles whose pixels differ beyond the noise thresholds"""
+    delta = np.abs(old.astype(np.int16) - new.astype(np.int16)).max(axis=2) > PIXEL_THRESHOLD
+    h, w = delta.shape
+    rows, cols = -(-h // tile), -(-w // tile)
+    padded = np.zeros((rows * tile, cols * tile), dtype=bool)
+    padded[:h, :w] = delta
+    fraction = padded.reshape(rows, tile, cols, tile).mean(axis=(1, 3))
+    return fraction > TILE_THRESHOLD
+
+
+def tile_regions(grid, width, height, tile=TILE_SIZE):
+    """Merge adjacent changed tiles into pixel bounding boxes (x, y, w, h)"""
+    seen = np.zeros_like(grid)
+    regions = []
+    for r, c in zip(*np.nonzero(grid)):
+        if seen[r, c]:
+            continue
+        seen[r, c] = True
+        stack = [(r, c)]
+        r0, r1, c0, c1 = r, r, c, c
+        while stack:
+            y, x = stack.pop()
+            r0, r1, c0, c1 = min(r0, y), max(r1, y), min(c0, x), max(c1, x)
+            for ny, nx in ((y - 1, x), (y + 1, x), (y, x - 1), (y, x + 1)):
+                if 0 <= ny < grid.shape[0] and 0 <= nx < grid.shape[1] and grid[ny, nx] and not seen[ny, nx]:
+                    seen[ny, nx] = True
+                    stack.append((ny, nx))
+        x0, y0 = int(c0) * tile, int(r0) * tile
+        x1, y1 = min((int(c1) + 1) * tile, width), min((int(r1) + 1) * tile, height)
+        regions.append([x0, y0, x1 - x0, y1 - y0])
+    return regions
+
+
+def list_screenshots(root):
+    """Relative paths of every PNG under the screenshot directory"""
+    found = []
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            if name.lower().endswith(".png"):
+                found.append(os.path.relpath(os.path.join(dirpath, name), root).replace(os.sep, "/"))
+    return sorted(found)
+
+
+def load_baseline(screenshot_dir, relpath, baseline_dir=None, ref=BASELINE_REF):
+    """Bytes of the previously published screenshot, or None if it did not exist"""
+    if baseline_dir:
+        path = os.path.join(baseline_dir, relpath)
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+    # ./ makes the path relative to screenshot_dir, wherever it sits in the checkout
+    result = subprocess.run(["git", "show", f"{ref}:./{relpath}"], cwd=screenshot_dir, capture_output=True)
+    return result.stdout if result.returncode == 0 else None
+
+
+def compare_screenshot(screenshot_dir, relpath, baseline_dir=None, ref=BASELINE_REF):
+    """Compare one screenshot with its baseline; returns (manifest entry, old image, new image)"""
+    with open(os.path.join(screenshot_dir, relpath), "rb") as f:
+        current = f.read()
+    entry = {"file": relpath, "sha256": hashlib.sha256(current).hexdigest()}
+    previous = load_baseline(screenshot_dir, relpath, baseline_dir, ref)
+
+    if previous is None:
+        new_img = PILImage.open(io.BytesIO(current)).convert("RGB")
+        entry.update(status="new", unchanged=False, phash=perceptual_hash(new_img),
+                     regions=[[0, 0, new_img.width, new_img.height]])
+        return entry, None, new_img
+    if hashlib.sha256(previous).hexdigest() == entry["sha256"]:
+        entry.update(status="unchanged", unchanged=True, regions=[])
+        return entry, None, None
+
+    old_img = PILImage.open(io.BytesIO(previous)).convert("RGB")
+    new_img = PILImage.open(io.BytesIO(current)).convert("RGB")
+    entry["phash"] = perceptual_hash(new_img)
+    entry["phash_distance"] = hamming(perceptual_hash(old_img), entry["phash"])
+
+    if old_img.size != new_img.size:
+        regions = [[0, 0, new_img.width, new_img.height]]
+        entry["resized_from"] = list(old_img.size)
+    else:
+        grid = changed_tiles(np.asarray(old_img), np.asarray(new_img))
+        regions = tile_regions(grid, new_img.width, new_img.height)
+        entry["changed_tiles"] = int(grid.sum())
+        entry["total_tiles"] = int(grid.size)
+
+    entry["regions"] = regions
+    entry["unchanged"] = not regions
+    entry["status"] = "changed" if regions else "unchanged"
+    return entry, old_img, new_img
+
+
+def highlighted_preview(img, regions):
+    """Downscaled JPEG of a screenshot with changed regions outlined"""
+    scale = min(1.0, PREVIEW_WIDTH / img.width)
+    preview = img.resize((max(1, int(img.width * scale)), max(1, int(img.height * scale))), PILImage.BILINEAR)
+    draw = ImageDraw.Draw(preview)
+    for x, y, w, h in regions:
+        draw.rectangle([x * scale, y * scale, (x + w) * scale, (y + h) * scale], outline=HIGHLIGHT, width=3)
+    buf = io.BytesIO()
+    preview.save(buf, format="JPEG", quality=80)
+    buf.seek(0)
+    return buf
+
+
+def fitted_image(buf, max_width, max_height):
+    """reportlab Image scaled into the given box"""
+    img = Image(buf)
+    scale = min(max_width / img.drawWidth, max_height / img.drawHeight)
+    img.drawWidth *= scale
+    img.drawHeight *= scale
+    return img
+
+
+def summary_story(styles, entries, baseline, frame_width):
+    """Summary page listing every compared screenshot"""
+    rows = [["Screenshot", "Status", "Changed Regions", "pHash Distance"]]
+    rows.extend([entry["file"], entry["status"].title(), str(len(entry.get("regions", []))),
+                 str(entry.get("phash_distance", "-"))] for entry in entries)
+    return [
+        Paragraph("Screenshot Changes", styles['SectionTitle']),
+        Paragraph(f"Baseline: {escape(baseline)}", styles['ManualBody']),
+        Spacer(1, 0.2*inch),
+        data_table(rows, width=frame_width, repeat_header=True),
+    ]
+
+
+def change_story(styles, entry, old_img, new_img, frame_width, frame_height):
+    """One side-by-side page for a changed or new screenshot"""
+    regions = entry["regions"]
+    cell_width = (frame_width - 0.25*inch) / 2
+    cell_height = frame_height - 1.5*inch
+    previous = fitted_image(highlighted_preview(old_img, regions), cell_width, cell_height) if old_img else \
+        Paragraph("[Not previously published]", styles['ManualBody'])
+    current = fitted_image(highlighted_preview(new_img, regions), cell_width, cell_height)
+
+    pair = Table([["Previous", "Current"], [previous, current]], colWidths=[cell_width, cell_width])
+    pair.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), DARK_BG),
+        ('TEXTCOLOR', (0, 0), (-1, 0), white),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ]))
+    return [
+        PageBreak(),
+        Paragraph(f"{escape(entry['file'])} ({entry['status']})", styles['SubSection']),
+        Paragraph(f"{len(regions)} changed region(s): " +
+                  ", ".join(f"{w}x{h} at ({x}, {y})" for x, y, w, h in regions[:12]) +
+                  (" ..." if len(regions) > 12 else ""), styles['ManualBody']),
+        pair,
+    ]
+
+
+def write_appendix(output_file, entries, changed, baseline, build_date=None):
+    """Lay out the appendix PDF, dated build_date, and publish it atomically"""
+    styles = STYLE_SETS["manual"]()
+    frame_width, frame_height = PAGE_SIZE[0] - 2 * MARGIN, PAGE_SIZE[1] - 2 * MARGIN
+    story = summary_story(styles, entries, baseline, frame_width)
+    for entry, old_img, new_img in changed:
+        story.extend(change_story(styles, entry, old_img, new_img, frame_width, frame_height))
+    with PublishLock(output_file):
+        partial = temp_path(output_file)
+        try:
+            doc = SimpleDocTemplate(partial, pagesize=PAGE_SIZE, rightMargin=MARGIN, leftMargin=MARGIN,
+                                    topMargin=MARGIN, bottomMargin=MARGIN, title="Screenshot Changes",
+                                    invariant=1)
+            doc.build(story, canvasmaker=dated_canvas(build_date))
+            os.replace(partial, output_file)
+        finally:
+            discard(partial)
+
+
+def generate_report(config, baseline_dir=None, ref=BASELINE_REF):
+    """Compare all of a document's screenshots, write the manifest and the appendix PDF; returns the entries"""
+    screenshot_dir = config.screenshot_dir
+    if not os.path.isdir(screenshot_dir):
+        raise FileNotFoundError(f"No screenshot directory at {screenshot_dir}")
+    baseline = baseline_dir or f"git {ref}"
+    # the appendix's PDF dates follow the screenshots, not the clock
+    build_date = fixed_build_date([screenshot_dir])
+    print("🔍 Comparing screenshots with the published set...")
+    print(f"📁 Screenshot directory: {screenshot_dir}")
+    print(f"📌 Baseline: {baseline}")
+
+    entries, changed = [], []
+    for relpath in list_screenshots(screenshot_dir):
+        entry, old_img, new_img = compare_screenshot(screenshot_dir, relpath, baseline_dir, ref)
+        entries.append(entry)
+        marker = "✅" if entry["unchanged"] else "✏️"
+        print(f"  {marker} {relpath}: {entry['status']} ({len(entry['regions'])} region(s))")
+        if not entry["unchanged"]:
+            changed.append((entry, old_img, new_img))
+
+    if baseline_dir:
+        current = {entry["file"] for entry in entries}
+        for relpath in list_screenshots(baseline_dir):
+            if relpath not in current:
+                entries.append({"file": relpath, "status": "removed", "unchanged": False, "regions": []})
+
+    manifest_file = diff_output(config.output_file, ".json")
+    atomic_write(manifest_file, json.dumps({"document": config.name, "baseline": baseline_dir or ref,
+                                            "screenshots": entries}, indent=2))
+    print(f"🗂️  Manifest: {manifest_file}")
+
+    output_file = diff_output(config.output_file)
+    if not changed:
+        discard(output_file)  # an appendix from an earlier run would describe changes that are gone
+        print("\n✅ No screenshot changes - appendix not generated")
+        return entries
+    write_appendix(output_file, entries, changed, baseline, build_date)
+    print(f"\n✅ {len(changed)} changed screenshot(s)")
+    print(f"📄 Appendix: {output_file}")
+    return entries
+
+
+def main(argv=None):
+    """python -m clubops_docs diff [document] [--baseline-dir DIR | --ref REV]; returns the exit status"""
+    parser = argparse.ArgumentParser(prog="clubops_docs diff",
+                                     description="Compare a document's screenshots with the published ones")
+    parser.add_argument("document", nargs="?", default="manual", choices=sorted(DOCUMENTS),
+                        help="document whose screenshots to compare (default: manual)")
+    parser.add_argument("--baseline-dir", help="directory holding the published screenshots "
+                                               "(default: read them from git)")
+    parser.add_argument("--ref", default=BASELINE_REF, help="git revision of the published screenshots")
+    args = parser.parse_args(argv)
+    if not available():
+        parser.error("diff needs NumPy (pip install numpy)")
+    try:
+        generate_report(DOCUMENTS[args.document], args.baseline_dir, args.ref)
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
+    except Exception as e:
+        print(f"\n❌ Error generating screenshot diff: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
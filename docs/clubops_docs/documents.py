@@ -0,0 +1,8 @@
+"""
+Registry of the documents this package knows how to build
+"""
+
+from .manual import MANUAL
+from .ui_guide import UI_GUIDE
+
+DOCUMENTS = {config.name: config for config in (MANUAL, UI_GUIDE)}
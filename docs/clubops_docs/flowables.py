@@ -0,0 +1,249 @@
+"""
+Building blocks shared by the section builders
+"""
+
+from reportlab.lib.colors import black
+from reportlab.platypus import Flowable, Spacer, Table, TableStyle
+
+from .config import DARK_BG, FRAME_HEIGHT, GOLD, SCREENSHOT_MAX_WIDTH, SCREENSHOT_MAX_HEIGHT, TABLE_WIDTH
+from .metrics import text_extent, text_widths, wrap_text
+from .overlays import BADGE_RADIUS, LINE_WIDTH, draw_overlays
+from .paragraphs import Paragraph
+from dataclasses import dataclass
+import math
+import os
+
+TABLE_FONT = 'Helvetica'
+TABLE_HEADER_FONT = 'Helvetica-Bold'
+TABLE_FONT_SIZE = 10
+CELL_PADDING = 6  # reportlab's default left/right cell padding
+FRAME_PADDING = 6  # reportlab's default frame padding, on each side
+
+
+@dataclass
+class FigureRef:
+    """A screenshot referenced by a section builder, checked during preflight"""
+    filename: str
+    path: str
+    caption: str
+    story_index: int
+    asset: object = None
+    width: float = 0
+    height: float = 0
+    error: str = None
+    overlays: tuple = ()
+    tiles: tuple = ()  # (top, bottom) pixel rows of each page-height band, for a tiled screenshot
+
+
+class Screenshot(Flowable):
+    """Centered screenshot drawn from the shared screenshot cache, with optional vector callouts"""
+
+    def __init__(self, asset, width, height, overlays=()):
+        Flowable.__init__(self)
+        self.asset = asset
+        self.drawWidth = width
+        self.drawHeight = height
+        self.overlays = tuple(overlays)
+        self.hAlign = 'CENTER'
+
+    def wrap(self, availWidth, availHeight):
+        return self.drawWidth, self.drawHeight
+
+    def draw(self):
+        if getattr(self.canv, "discarding", False):
+            return  # a revision notice leaves this page out; do not embed the image
+        self.asset.draw(self.canv, 0, 0, self.drawWidth, self.drawHeight)
+        if self.overlays:
+            draw_overlays(self.canv, self.overlays, self.drawWidth / self.asset.width, self.asset.height)
+
+
+class ScreenshotTile(Screenshot):
+    """One page-height band of a tall screenshot
+
+    Overlays keep the whole image's coordinates and are clipped to the band;
+    whole is the untiled Screenshot, for targets that scroll (HTML).
+    """
+
+    def __init__(self, asset, width, height, overlays, top, part, parts, whole):
+        Screenshot.__init__(self, asset, width, height, overlays)
+        self.top = top
+        self.part = part
+        self.parts = parts
+        self.whole = whole
+
+    def draw(self):
+        if getattr(self.canv, "discarding", False):
+            return
+        self.asset.draw(self.canv, 0, 0, self.drawWidth, self.drawHeight)
+        if self.overlays:
+            scale = self.drawWidth / self.asset.width
+            self.canv.saveState()
+            clip = self.canv.beginPath()
+            clip.rect(0, 0, self.drawWidth, self.drawHeight)
+            self.canv.clipPath(clip, stroke=0, fill=0)
+            # place the whole image's coordinates so that this band lands on the flowable
+            self.canv.translate(0, (self.top + self.asset.height - self.whole.asset.height) * scale)
+            draw_overlays(self.canv, self.overlays, scale, self.whole.asset.height)
+            self.canv.restoreState()
+
+
+def tile_bounds(image_height, band_height):
+    """(top, bottom) pixel rows of bands of at most band_height rows, with the last two evened out"""
+    count = math.ceil(image_height / band_height)
+    tops = [index * band_height for index in range(count)]
+    if count > 1:
+        # a sliver of a last band reads badly; split the final two bands evenly instead
+        tops[-1] = tops[-2] + (image_height - tops[-2] + 1) // 2
+    return tuple(zip(tops, tops[1:] + [image_height]))
+
+
+def add_screenshot(story, ctx, filename, caption, max_width=SCREENSHOT_MAX_WIDTH,
+                   max_height=SCREENSHOT_MAX_HEIGHT, overlays=(), tile=False):
+    """Add a screenshot image with caption
+
+    overlays are callouts from clubops_docs.overlays (Box, Arrow, Badge) in
+    the image's pixel coordinates, drawn as vectors over the shared image.
+    With tile, a raster image too tall to be read at max_width (a full-page
+    capture) is not shrunk to max_height but kept at max_width and split
+    into bands of one page each, captioned as continuations. Problems are
+    recorded on the context for the preflight report; the placeholder
+    paragraphs only show up if the story is rendered anyway.
+    """
+    styles = ctx.styles
+    figure = FigureRef(filename, os.path.join(ctx.config.screenshot_dir, filename), caption, len(story),
+                       overlays=tuple(overlays))
+    ctx.figures.append(figure)
+    # draft builds size a placeholder from the image header instead of loading the image
+    lookup = ctx.shared.screenshots.placeholder if ctx.options.draft else ctx.shared.screenshots.get
+    try:
+        figure.asset = lookup(figure.path)
+    except Exception as e:
+        figure.error = f"cannot read image ({e})"
+        story.append(Paragraph(f"[Error loading screenshot: {filename}]", styles[ctx.config.body_style]))
+        return
+    if figure.asset is None:
+        story.append(Paragraph(f"[Screenshot not found: {filename}]", styles[ctx.config.body_style]))
+        return
+
+    spacing = ctx.config.figure_spacing
+    if tile and not figure.asset.vector and figure.asset.height * max_width / figure.asset.width > max_height:
+        add_tiles(story, ctx, figure, max_width)
+        return
+
+    scale = min(max_width / figure.asset.width, max_height / figure.asset.height)
+    figure.width, figure.height = figure.asset.width * scale, figure.asset.height * scale
+    if spacing:
+        story.append(Spacer(1, spacing))
+    story.append(Screenshot(figure.asset, figure.width, figure.height, figure.overlays))
+    story.append(Paragraph(caption, styles['ImageCaption']))
+    if spacing:
+        story.append(Spacer(1, spacing))
+
+
+def add_tiles(story, ctx, figure, max_width):
+    """Add a tall screenshot at max_width as page-height bands, each with its caption"""
+    styles = ctx.styles
+    spacing = ctx.config.figure_spacing
+    asset = figure.asset
+    scale = max_width / asset.width
+    continued = ctx.gettext("{caption} (continued, {part} of {parts})")
+    # room for one band: a whole frame, less its caption and spacing (measured on the longest caption)
+    longest = Paragraph(continued.format(caption=figure.caption, part=99, parts=99), styles['ImageCaption'])
+    caption_height = longest.wrap(max_width, FRAME_HEIGHT)[1] + longest.getSpaceBefore() + longest.getSpaceAfter()
+    room = FRAME_HEIGHT - 2 * FRAME_PADDING - caption_height - 2 * spacing - 1
+    figure.tiles = tile_bounds(asset.height, max(1, math.floor(room / scale)))
+    figure.width = max_width
+    figure.height = max(bottom - top for top, bottom in figure.tiles) * scale
+    whole = Screenshot(asset, max_width, asset.height * scale, figure.overlays)
+    reach = (BADGE_RADIUS + LINE_WIDTH) / scale  # how far a callout draws beyond its bounds, in pixels
+    for index, (top, bottom) in enumerate(figure.tiles):
+        band = asset.tile(figure.tiles, index)
+        overlays = [overlay for overlay in figure.overlays
+                    if (bounds := overlay.bounds())[1] - reach < bottom and bounds[3] + reach > top]
+        if spacing:
+            story.append(Spacer(1, spacing))
+        story.append(ScreenshotTile(band, max_width, (bottom - top) * scale, overlays, top,
+                                    index + 1, len(figure.tiles), whole))
+        text = figure.caption if index == 0 else continued.format(
+            caption=figure.caption, part=index + 1, parts=len(figure.tiles))
+        story.append(Paragraph(text, styles['ImageCaption']))
+        if spacing:
+            story.append(Spacer(1, spacing))
+
+
+def column_widths(data, width=TABLE_WIDTH):
+    """Column widths that fit the text of a table into the given width
+
+    Columns start at their widest word and share the remaining space in
+    proportion to how much wider their longest line is, the same rule HTML
+    uses for automatic table layout. Columns whose text fits outright get
+    their natural width plus a share of any slack, so the table always spans
+    the full width.
+    """
+    columns = list(zip(*data))
+    natural, minimum = [], []
+    for column in columns:
+        header, body = column[0], [cell for cell in column[1:] if isinstance(cell, str)]
+        line, word = text_extent(body, TABLE_FONT, TABLE_FONT_SIZE)
+        if isinstance(header, str):
+            header_line, header_word = text_extent([header], TABLE_HEADER_FONT, TABLE_FONT_SIZE)
+            line, word = max(line, header_line), max(word, header_word)
+        natural.append(line + 2 * CELL_PADDING)
+        minimum.append(word + 2 * CELL_PADDING)
+
+    if sum(natural) <= width:
+        return [w + (width - sum(natural)) * w / sum(natural) for w in natural]
+    slack = width - sum(minimum)
+    stretch = [n - m for n, m in zip(natural, minimum)]
+    if slack <= 0 or not sum(stretch):
+        return minimum
+    return [m + slack * s / sum(stretch) for m, s in zip(minimum, stretch)]
+
+
+def wrap_cells(data, col_widths):
+    """Break strings that do not fit their column onto several lines
+
+    The cells stay plain strings, so the table's own font and colour
+    commands still apply and no paragraph has to be parsed per cell.
+    """
+    wrapped = [list(row) for row in data]
+    for rows, font in (([0], TABLE_HEADER_FONT), (range(1, len(data)), TABLE_FONT)):
+        for column, col_width in enumerate(col_widths):
+            cells = [(row, data[row][column]) for row in rows if isinstance(data[row][column], str)]
+            widths = text_widths([text for _, text in cells], font, TABLE_FONT_SIZE)
+            lines = {}  # a value repeated down the column is broken once
+            for (row, text), text_width in zip(cells, widths):
+                if text_width + 2 * CELL_PADDING > col_width + 0.01:
+                    if text not in lines:
+                        lines[text] = wrap_text(text, font, TABLE_FONT_SIZE, col_width - 2 * CELL_PADDING)
+                    wrapped[row][column] = lines[text]
+    return wrapped
+
+
+def data_table(data, col_widths=None, header_bg=DARK_BG, header_fg=GOLD, padding=6,
+               top_padding=None, extra_styles=(), width=TABLE_WIDTH, repeat_header=False):
+    """Table with the ClubOps header row, grid and cell padding
+
+    Without col_widths the columns are sized from the text itself (see
+    column_widths) and cells that still do not fit are broken into lines.
+    With repeat_header, a table split across pages repeats its header row.
+    """
+    commands = []
+    if col_widths is None:
+        col_widths = column_widths(data, width)
+        data = wrap_cells(data, col_widths)
+        # keep single-line cells level with wrapped neighbours
+        commands.append(('VALIGN', (0, 0), (-1, -1), 'MIDDLE'))
+    table = Table(data, colWidths=col_widths, repeatRows=1 if repeat_header else 0)
+    commands += [
+        ('BACKGROUND', (0, 0), (-1, 0), header_bg),
+        ('TEXTCOLOR', (0, 0), (-1, 0), header_fg),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('GRID', (0, 0), (-1, -1), 1, black),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), padding),
+        ('TOPPADDING', (0, 0), (-1, -1), padding if top_padding is None else top_padding),
+    ]
+    commands.extend(extra_styles)
+    table.setStyle(TableStyle(commands))
+    return table
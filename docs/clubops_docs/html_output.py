@@ -0,0 +1,217 @@
+"""
+Lightweight HTML target
+Renders the same story the PDF is laid out from into one self-contained HTML
+page: inlined CSS, no CDN, and screenshots as responsive WebP variants with
+srcset and native lazy loading, so phones fetch only what they scroll to.
+"""
+
+from reportlab.platypus import Paragraph, Table
+from PIL import Image as PILImage
+import html
+import os
+import re
+import threading
+
+from .flowables import Screenshot, ScreenshotTile
+from .overlays import overlay_svg
+from .publish import atomic_write
+
+IMAGE_WIDTHS = (480, 960, 1440)
+IMAGE_QUALITY = 78
+MARKUP_TAG = re.compile(r"(<[^<>]*>)")
+ALLOWED_TAGS = re.compile(r"</?(b|i|u|strong|em)>|<br/?>")
+
+# Paragraph style name -> (tag, css class)
+STYLE_TAGS = {
+    "CoverTitle": ("h1", "cover-title"),
+    "CoverSubtitle": ("p", "cover-subtitle"),
+    "CoverVersion": ("p", "cover-version"),
+    "SectionTitle": ("h2", None),
+    "SubSection": ("h3", None),
+    "SubSubSection": ("h4", None),
+    "CodeBlock": ("pre", None),
+    "BulletItem": ("li", None),
+    "FeatureItem": ("li", None),
+}
+
+CSS = """
+:root{--gold:#F59E0B;--electric:#3B82F6;--royal:#8B5CF6;--dark:#0F172A}
+*{box-sizing:border-box}
+body{margin:0;font:16px/1.55 -apple-system,BlinkMacSystemFont,"Segoe UI",Roboto,Helvetica,Arial,sans-serif;color:#111;background:#fff}
+main{max-width:46rem;margin:0 auto;padding:1rem}
+nav{background:var(--dark);padding:.75rem 1rem;position:sticky;top:0;overflow-x:auto;white-space:nowrap}
+nav a{color:var(--gold);text-decoration:none;margin-right:1rem;font-size:.9rem}
+h1.cover-title{color:var(--gold);text-align:center;font-size:2.4rem;margin:2rem 0 .5rem}
+.cover-subtitle{color:var(--electric);text-align:center;font-size:1.3rem;margin:0}
+.cover-version{text-align:center}
+h2{color:var(--electric);font-size:1.5rem;margin:2.5rem 0 .75rem;scroll-margin-top:3.5rem}
+h3{color:var(--royal);font-size:1.2rem;margin:1.5rem 0 .5rem}
+h4{font-size:1rem;margin:1.25rem 0 .4rem}
+ul{padding-left:1.25rem}
+li{list-style:none;margin:.2rem 0}
+pre{background:#F5F5F5;padding:.75rem;overflow-x:auto}
+figure{margin:1rem 0}
+figure img{width:100%;height:auto;display:block;border:1px solid #ddd}
+.shot{position:relative}
+.shot svg{position:absolute;top:0;left:0;width:100%;height:100%}
+figcaption{color:#555;font-style:italic;text-align:center;font-size:.9rem;margin-top:.35rem}
+.table{overflow-x:auto}
+table{border-collapse:collapse;width:100%;font-size:.9rem}
+th,td{border:1px solid #000;padding:.4rem .5rem;text-align:left;vertical-align:top}
+th{background:var(--dark);color:var(--gold)}
+"""
+
+
+def markup(text):
+    """Paragraph mini-markup to safe HTML, keeping only simple inline tags
+
+    The text between tags is already entity-encoded for reportlab ("R&amp;B"),
+    so it is decoded first and escaped once; other tags are shown as text.
+    """
+    parts = MARKUP_TAG.split(text)
+    for index, part in enumerate(parts):
+        if index % 2 == 0:
+            parts[index] = html.escape(html.unescape(part), quote=False)
+        elif not ALLOWED_TAGS.fullmatch(part):
+            parts[index] = html.escape(part, quote=False)
+    return "".join(parts)
+
+
+def cell_html(cell):
+    if isinstance(cell, Paragraph):
+        return markup(cell.text)
+    return html.escape(str(cell), quote=False)
+
+
+class ResponsiveImages:
+    """Writes each screenshot once per width, shared by every page rendered"""
+
+    def __init__(self, out_dir, url_prefix="img"):
+        self.out_dir = out_dir
+        self.url_prefix = url_prefix
+        os.makedirs(out_dir, exist_ok=True)
+
+    def variants(self, asset):
+        """[(url, width, height)] for an asset, encoding missing variants only"""
+        if asset.vector:
+            return [self.vector(asset)]
+        widths = [w for w in IMAGE_WIDTHS if w < asset.width] + [min(asset.width, IMAGE_WIDTHS[-1])]
+        result, source = [], None
+        try:
+            for width in sorted(set(widths)):
+                height = round(asset.height * width / asset.width)
+                name = f"{asset.digest[:16]}-{width}.webp"
+                path = os.path.join(self.out_dir, name)
+                if not os.path.exists(path):
+                    if source is None:
+                        source = PILImage.open(asset.path).convert("RGB")
+                    # Locale builds share variants; write aside and rename so a
+                    # concurrent page never links a half-written file
+                    partial = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+                    source.resize((width, height), PILImage.LANCZOS).save(
+                        partial, "WEBP", quality=IMAGE_QUALITY, method=4)
+                    os.replace(partial, path)
+                result.append((f"{self.url_prefix}/{name}", width, height))
+        finally:
+            if source is not None:
+                source.close()
+        return result
+
+    def vector(self, asset):
+        """SVG assets are copied as they are; one file serves every width"""
+        name = f"{asset.digest[:16]}.svg"
+        path = os.path.join(self.out_dir, name)
+        if not os.path.exists(path):
+            with open(asset.path, "rb") as f:
+                atomic_write(path, f.read())
+        return f"{self.url_prefix}/{name}", round(asset.width), round(asset.height)
+
+
+def figure_html(screenshot, caption, images):
+    variants = images.variants(screenshot.asset)
+    srcset = ", ".join(f"{url} {width}w" for url, width, _ in variants)
+    url, width, height = variants[-1]
+    caption_html = f"<figcaption>{markup(caption.text)}</figcaption>" if caption is not None else ""
+    image = (f'<img src="{url}" srcset="{srcset}" sizes="(max-width: 46rem) 100vw, 46rem" '
+             f'width="{width}" height="{height}" loading="lazy" decoding="async" '
+             f'alt="{html.escape(caption.getPlainText() if caption is not None else "")}">')
+    if screenshot.overlays:
+        asset = screenshot.asset
+        svg = overlay_svg(screenshot.overlays, asset.width, asset.height, screenshot.drawWidth / asset.width)
+        image = f'<div class="shot">{image}{svg}</div>'
+    return f'<figure>{image}{caption_html}</figure>'
+
+
+def table_html(table):
+    rows = table._cellvalues
+    head = "".join(f"<th>{cell_html(cell)}</th>" for cell in rows[0]) if rows else ""
+    body = "".join("<tr>" + "".join(f"<td>{cell_html(cell)}</td>" for cell in row) + "</tr>"
+                   for row in rows[1:])
+    return f'<div class="table"><table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table></div>'
+
+
+def render_story(story, images, section_style="SectionTitle"):
+    """HTML body and navigation entries for a story"""
+    parts, nav = [], []
+    in_list = False
+    i = 0
+    while i < len(story):
+        flowable = story[i]
+        tag = None
+        if isinstance(flowable, Paragraph):
+            tag, css = STYLE_TAGS.get(flowable.style.name, ("p", None))
+        if in_list and tag != "li":
+            parts.append("</ul>")
+            in_list = False
+
+        if isinstance(flowable, Screenshot):
+            caption = story[i + 1] if i + 1 < len(story) and isinstance(story[i + 1], Paragraph) \
+                and story[i + 1].style.name == "ImageCaption" else None
+            if isinstance(flowable, ScreenshotTile):
+                # a page scrolls: the first band stands for the whole image, the rest are left out
+                if flowable.part == 1:
+                    parts.append(figure_html(flowable.whole, caption, images))
+            else:
+                parts.append(figure_html(flowable, caption, images))
+            i += 2 if caption is not None else 1
+            continue
+        if isinstance(flowable, Table):
+            parts.append(table_html(flowable))
+        elif tag == "li":
+            if not in_list:
+                parts.append("<ul>")
+                in_list = True
+            parts.append(f"<li>{markup(flowable.text)}</li>")
+        elif tag:
+            attrs = f' class="{css}"' if css else ""
+            if flowable.style.name == section_style:
+                anchor = f"s{len(nav) + 1}"
+                attrs += f' id="{anchor}"'
+                nav.append((anchor, flowable.getPlainText()))
+            parts.append(f"<{tag}{attrs}>{markup(flowable.text)}</{tag}>")
+        i += 1
+    if in_list:
+        parts.append("</ul>")
+    return "\n".join(parts), nav
+
+
+def html_dir(output_file):
+    """Directory that holds a document's HTML rendition"""
+    return os.path.join(os.path.dirname(output_file), "html")
+
+
+def write_html(config, story, lang="en", out_dir=None):
+    """Write <document>.html and its image variants; return the page path"""
+    out_dir = out_dir or html_dir(config.output_file)
+    images = ResponsiveImages(os.path.join(out_dir, "img"))
+    body, nav = render_story(story, images)
+    nav_html = "".join(f'<a href="#{anchor}">{html.escape(title)}</a>' for anchor, title in nav)
+    page = (
+        f'<!DOCTYPE html>\n<html lang="{lang}"><head><meta charset="utf-8">'
+        f'<meta name="viewport" content="width=device-width, initial-scale=1">'
+        f'<title>{html.escape(config.title)}</title><style>{CSS.strip()}</style></head>'
+        f'<body><nav>{nav_html}</nav><main>\n{body}\n</main></body></html>\n'
+    )
+    path = os.path.join(out_dir, os.path.splitext(os.path.basename(config.output_file))[0] + ".html")
+    atomic_write(path, page)
+    return path
@@ -0,0 +1,79 @@
+"""
+Message catalogs for localized builds
+Section builders write English source strings and look them up through
+ctx.gettext; each locale is a flat JSON file in locales/ mapping the English
+text to its translation. English needs no catalog.
+"""
+
+from dataclasses import replace
+import json
+import os
+import re
+import threading
+
+LOCALES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locales")
+SOURCE_LOCALE = "en"
+MONTHS = ("January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December")
+TRANSLATABLE = re.compile(r"[^\W\d_]", re.UNICODE)
+
+
+def available_locales():
+    """Locales that have a catalog, plus the source locale"""
+    found = {SOURCE_LOCALE}
+    if os.path.isdir(LOCALES_DIR):
+        found.update(name[:-5] for name in os.listdir(LOCALES_DIR) if name.endswith(".json"))
+    return sorted(found)
+
+
+class Catalog:
+    """Translations for one locale; untranslated strings fall back to English"""
+
+    def __init__(self, locale, messages=None):
+        self.locale = locale
+        self.messages = messages or {}
+        self.missing = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, locale):
+        if locale == SOURCE_LOCALE:
+            return cls(locale)
+        path = os.path.join(LOCALES_DIR, f"{locale}.json")
+        if not os.path.exists(path):
+            raise ValueError(f"No message catalog for locale '{locale}' ({path})")
+        with open(path, encoding="utf-8") as f:
+            return cls(locale, json.load(f))
+
+    def gettext(self, message):
+        translated = self.messages.get(message)
+        if translated is not None:
+            return translated
+        if self.locale != SOURCE_LOCALE:
+            with self._lock:
+                self.missing.add(message)
+        return message
+
+    def translate_rows(self, rows):
+        """Table data with every cell that contains words translated"""
+        return [[self.gettext(cell) if TRANSLATABLE.search(cell) else cell for cell in row] for row in rows]
+
+    def month_year(self, date):
+        return self.gettext("{month} {year}").format(month=self.gettext(MONTHS[date.month - 1]),
+                                                     year=date.year)
+
+
+def localized_output(output_file, locale):
+    """Output path for a locale; English keeps the unsuffixed name"""
+    if locale == SOURCE_LOCALE:
+        return output_file
+    stem, ext = os.path.splitext(output_file)
+    return f"{stem}-{locale}{ext}"
+
+
+def localize(config, catalog):
+    """Copy of a document config for one locale"""
+    if catalog.locale == config.locale:
+        return config
+    return replace(config, locale=catalog.locale, title=catalog.gettext(config.title),
+                   output_file=localized_output(config.output_file, catalog.locale))
@@ -0,0 +1,184 @@
+"""
+Print imposition
+Places the pages of an already published PDF onto larger sheets without
+laying anything out again: every source page is wrapped once as a Form
+XObject and drawn, scaled, wherever the arrangement needs it, so a card
+sheet with four copies of a page embeds that page (and its screenshots)
+only once.
+
+Arrangements:
+    2up, 4up             consecutive pages side by side (handouts)
+    cards-2up, cards-4up every sheet filled with copies of one page, with
+                         cut lines (laminated quick-reference cards)
+    booklet              saddle-stitch: pages in fold order on tabloid
+                         sheets, printed duplex (flip on short edge)
+
+Pages can be limited to one section through the published page manifest,
+e.g. the Quick Reference for cards. Needs pdfrw (pip install pdfrw).
+"""
+
+from reportlab.lib.colors import HexColor
+from reportlab.lib.pagesizes import TABLOID, landscape, letter
+from reportlab.lib.units import inch
+from dataclasses import dataclass
+import os
+import re
+import time
+
+from .page_manifest import load_manifest, manifest_path
+from .publish import PublishLock, discard, temp_path
+from .reproducible import dated_canvas
+
+try:
+    from pdfrw import PdfReader
+    from pdfrw.buildxobj import pagexobj
+    from pdfrw.toreportlab import makerl
+except ImportError:  # optional dependency
+    PdfReader = pagexobj = makerl = None
+
+CUT_LINE_COLOR = HexColor("#94A3B8")
+CUT_LINE_DASH = (4, 3)
+
+
+@dataclass(frozen=True)
+class Layout:
+    """How source pages are arranged on one side of a sheet"""
+    sheet: tuple
+    columns: int
+    rows: int
+    margin: float = 0.25*inch
+    copies: bool = False   # fill each sheet with one page (cards) instead of consecutive pages
+    booklet: bool = False  # saddle-stitch page order
+
+    @property
+    def cells(self):
+        return self.columns * self.rows
+
+
+LAYOUTS = {
+    "2up": Layout(landscape(letter), 2, 1),
+    "4up": Layout(letter, 2, 2),
+    "cards-2up": Layout(landscape(letter), 2, 1, copies=True),
+    "cards-4up": Layout(letter, 2, 2, copies=True),
+    "booklet": Layout(landscape(TABLOID), 2, 1, margin=0, booklet=True),
+}
+
+
+def available():
+    return PdfReader is not None
+
+
+def imposed_output(output_file, layout_name, section=None):
+    """<document>-<layout>[-<section>].pdf next to the published PDF"""
+    stem, ext = os.path.splitext(output_file)
+    suffix = f"-{re.sub(r'[^a-z0-9]+', '-', section.lower()).strip('-')}" if section else ""
+    return f"{stem}-{layout_name}{suffix}{ext}"
+
+
+def section_pages(output_file, section):
+    """Page numbers (from 0) of the published build that show a section, matched on label or title"""
+    manifest = load_manifest(manifest_path(output_file))
+    if manifest is None:
+        raise RuntimeError(f"No page manifest for {output_file}; publish a full build first")
+    wanted = section.lower()
+    indices = {index for index, entry in enumerate(manifest["sections"])
+               if wanted in entry["label"].lower() or wanted in entry["title"].lower()}
+    if not indices:
+        raise ValueError(f"No section matching {section!r} in {os.path.basename(output_file)}")
+    return [number for number, page in enumerate(manifest["pages"]) if indices & set(page["sections"])]
+
+
+def sheet_sides(pages, layout):
+    """Source page indices for every sheet side, None for a blank cell"""
+    if layout.copies:
+        return [[page] * layout.cells for page in pages]
+    if layout.booklet:
+        count = -(-len(pages) // 4) * 4
+        padded = pages + [None] * (count - len(pages))
+        sides = []
+        for sheet in range(count // 4):
+            sides.append([padded[count - 1 - 2 * sheet], padded[2 * sheet]])        # front
+            sides.append([padded[2 * sheet + 1], padded[count - 2 - 2 * sheet]])    # back
+        return sides
+    return [(pages[start:start + layout.cells] + [None] * layout.cells)[:layout.cells]
+            for start in range(0, len(pages), layout.cells)]
+
+
+def cell_boxes(layout):
+    """(x, y, width, height) of every cell, left to right and top to bottom"""
+    sheet_width, sheet_height = layout.sheet
+    width = (sheet_width - 2 * layout.margin) / layout.columns
+    height = (sheet_height - 2 * layout.margin) / layout.rows
+    return [(layout.margin + column * width, sheet_height - layout.margin - (row + 1) * height, width, height)
+            for row in range(layout.rows) for column in range(layout.columns)]
+
+
+def draw_cut_lines(canv, layout):
+    sheet_width, sheet_height = layout.sheet
+    canv.saveState()
+    canv.setStrokeColor(CUT_LINE_COLOR)
+    canv.setLineWidth(0.5)
+    canv.setDash(*CUT_LINE_DASH)
+    for column in range(1, layout.columns):
+        x = layout.margin + column * (sheet_width - 2 * layout.margin) / layout.columns
+        canv.line(x, 0, x, sheet_height)
+    for row in range(1, layout.rows):
+        y = layout.margin + row * (sheet_height - 2 * layout.margin) / layout.rows
+        canv.line(0, y, sheet_width, y)
+    canv.restoreState()
+
+
+def impose(source, output_file, layout, pages=None, build_date=None):
+    """Write the pages of source (all, or the given indices) onto sheets; returns the number of sheet sides
+
+    With a build_date the sheets carry that date and an invariant structure,
+    so the same source always gives the same bytes.
+    """
+    if PdfReader is None:
+        raise RuntimeError("Imposition needs pdfrw: pip install pdfrw")
+    reader = PdfReader(source)
+    pages = list(range(len(reader.pages))) if pages is None else list(pages)
+    forms = {}
+    sides = sheet_sides(pages, layout)
+    with PublishLock(output_file):
+        partial = temp_path(output_file)
+        canv = dated_canvas(build_date)(partial, pagesize=layout.sheet, invariant=1 if build_date else None)
+        try:
+            for side in sides:
+                for page, (x, y, width, height) in zip(side, cell_boxes(layout)):
+                    if page is None:
+                        continue
+                    if page not in forms:
+                        forms[page] = pagexobj(reader.pages[page])
+                    form = forms[page]
+                    left, bottom, right, top = (float(value) for value in form.BBox)
+                    page_width, page_height = right - left, top - bottom
+                    scale = min(width / page_width, height / page_height)
+                    canv.saveState()
+                    canv.translate(x + (width - page_width * scale) / 2 - left * scale,
+                                   y + (height - page_height * scale) / 2 - bottom * scale)
+                    canv.scale(scale, scale)
+                    canv.doForm(makerl(canv, form))
+                    canv.restoreState()
+                if layout.copies:
+                    draw_cut_lines(canv, layout)
+                canv.showPage()
+            canv.save()
+            os.replace(partial, output_file)
+        finally:
+            discard(partial)
+    return len(sides)
+
+
+def impose_document(config, shared, layout_name, section=None):
+    """Impose a document's published PDF; the build function behind --impose"""
+    started = time.perf_counter()
+    if not os.path.exists(config.output_file):
+        raise RuntimeError(f"{config.output_file} has not been built yet")
+    pages = section_pages(config.output_file, section) if section else None
+    output_file = imposed_output(config.output_file, layout_name, section)
+    sides = impose(config.output_file, output_file, LAYOUTS[layout_name], pages,
+                   build_date=shared.pdf_date)
+    print(f"🗂️  {config.name} [{config.locale}] {layout_name}: {sides} sheet side(s) → {output_file} "
+          f"({os.path.getsize(output_file) / 1024:.1f} KB) in {time.perf_counter() - started:.2f}s")
+    return output_file
@@ -0,0 +1,169 @@
+"""
+Incremental PDF updates
+Publishes a revision as a standard PDF incremental update: the objects of
+the new build are compared with the objects of the published file, and only
+the ones that differ (a page's content stream, a replaced screenshot, the
+info dictionary) are appended after the existing bytes, followed by an xref
+section and a trailer pointing back to the previous one (/Prev). Earlier
+bytes are never changed, so range-aware HTTP clients and sync tools only
+transfer the new tail.
+
+reportlab numbers objects in the order the layout registers them, so a typo
+fix or a swapped screenshot leaves every other object as it was. When the
+layout shifts so much that the update would not pay off, or earlier updates
+have grown the file well past a fresh copy, the whole file is rewritten.
+Objects the new build no longer has stay behind unreferenced until then.
+Only classic xref tables are read, which is what reportlab writes; a
+published file with xref streams (another producer) is rewritten.
+"""
+
+from bisect import bisect_right
+import os
+import re
+import shutil
+
+from .publish import discard, temp_path
+
+REWRITE_RATIO = 1.5  # rewrite once the updated file would be this many times the size of a fresh copy
+
+TRAILER_REF = rb"/%s\s+(\d+\s+\d+\s+R)"
+TRAILER_ID = re.compile(rb"/ID\s*(?:%[^\n]*\n\s*)*\[\s*(<[0-9A-Fa-f]*>)\s*(<[0-9A-Fa-f]*>)\s*\]")
+
+
+def read_xref(data):
+    """Current objects of a PDF with classic xref tables, following /Prev links
+
+    Returns ({number: (offset, generation)}, newest trailer, offsets of every
+    object and xref section in the file, newest xref offset). Raises
+    ValueError for anything else.
+    """
+    position = data.rfind(b"startxref")
+    if position < 0:
+        raise ValueError("no startxref")
+    newest = offset = int(data[position + 9:position + 40].split()[0])
+    objects, boundaries, trailer = {}, set(), None
+    while offset is not None:
+        if offset in boundaries:
+            raise ValueError("xref sections form a loop")
+        boundaries.add(offset)
+        if not data.startswith(b"xref", offset):
+            raise ValueError(f"no xref table at offset {offset}")
+        end = data.find(b"trailer", offset)
+        if end < 0:
+            raise ValueError(f"xref table at offset {offset} has no trailer")
+        tokens = data[offset + 4:end].split()
+        i = 0
+        while i < len(tokens):
+            first, count = int(tokens[i]), int(tokens[i + 1])
+            for number in range(first, first + count):
+                entry, generation, kind = tokens[i + 2:i + 5]
+                if kind == b"n":
+                    boundaries.add(int(entry))
+                # sections are read newest first; an older entry never replaces a newer one
+                objects.setdefault(number, (int(entry), int(generation)) if kind == b"n" else None)
+                i += 3
+            i += 2
+        section_trailer = data[end:data.find(b"startxref", end)]
+        trailer = trailer if trailer is not None else section_trailer
+        previous = re.search(rb"/Prev\s+(\d+)", section_trailer)
+        offset = int(previous.group(1)) if previous else None
+    return {number: entry for number, entry in objects.items() if entry is not None}, trailer, \
+        sorted(boundaries), newest
+
+
+def object_bytes(data, objects, boundaries):
+    """{number: b"N G obj ... endobj"} for the current objects"""
+    found = {}
+    for number, (offset, generation) in objects.items():
+        following = bisect_right(boundaries, offset)
+        chunk = data[offset:boundaries[following] if following < len(boundaries) else len(data)]
+        end = chunk.rfind(b"endobj")
+        if end < 0 or not chunk.startswith(b"%d %d obj" % (number, generation)):
+            raise ValueError(f"object {number} not found at offset {offset}")
+        found[number] = chunk[:end + 6]
+    return found
+
+
+def _trailer_ref(trailer, key):
+    match = re.search(TRAILER_REF % key, trailer)
+    return match.group(1) if match else None
+
+
+def incremental_update(old, new):
+    """Bytes to append to the PDF old so that it reads as the PDF new
+
+    Returns b"" when nothing changed, None when old cannot be updated this
+    way or a rewrite is smaller (see REWRITE_RATIO).
+    """
+    if old.split(b"\n", 1)[0] != new.split(b"\n", 1)[0]:
+        return None  # a different PDF version
+    try:
+        old_objects, old_trailer, old_boundaries, old_xref = read_xref(old)
+        new_objects, new_trailer, new_boundaries, _ = read_xref(new)
+        old_bodies = object_bytes(old, old_objects, old_boundaries)
+        new_bodies = object_bytes(new, new_objects, new_boundaries)
+    except (ValueError, IndexError):
+        return None
+    root, info = _trailer_ref(new_trailer, b"Root"), _trailer_ref(new_trailer, b"Info")
+    changed = [number for number in sorted(new_bodies) if old_bodies.get(number) != new_bodies[number]]
+    if not changed and (root, info) == (_trailer_ref(old_trailer, b"Root"), _trailer_ref(old_trailer, b"Info")):
+        return b""
+
+    update = bytearray(b"" if old.endswith(b"\n") else b"\n")
+    offsets = {}
+    for number in changed:
+        offsets[number] = len(old) + len(update)
+        update += new_bodies[number] + b"\n"
+    xref = len(old) + len(update)
+    # restating the head of the free list keeps readers that expect every table to start at 0 happy
+    update += b"xref\n0 1\n0000000000 65535 f\r\n"
+    start = 0
+    while start < len(changed):
+        end = start + 1
+        while end < len(changed) and changed[end] == changed[end - 1] + 1:
+            end += 1
+        update += b"%d %d\n" % (changed[start], end - start)
+        update += b"".join(b"%010d 00000 n\r\n" % offsets[number] for number in changed[start:end])
+        start = end
+    size = max(max(old_objects, default=0), max(new_objects, default=0)) + 1
+    update += b"trailer\n<<\n/Size %d\n/Root %s\n" % (size, root)
+    if info:
+        update += b"/Info %s\n" % info
+    old_id, new_id = TRAILER_ID.search(old_trailer), TRAILER_ID.search(new_trailer)
+    if new_id:
+        # the first identifier stays the one the file was created with
+        update += b"/ID [%s%s]\n" % ((old_id or new_id).group(1), new_id.group(2))
+    update += b"/Prev %d\n>>\nstartxref\n%d\n%%%%EOF\n" % (old_xref, xref)
+    if len(old) + len(update) > REWRITE_RATIO * len(new):
+        return None
+    return bytes(update)
+
+
+def publish_incremental(built, published):
+    """Publish the PDF at built to published, as an appended update where that pays off
+
+    Returns the number of bytes appended (0: nothing changed), or None when
+    the file was replaced whole. Like every publish, readers see the old
+    file or the new one, never a partial one.
+    """
+    try:
+        with open(published, "rb") as f:
+            old = f.read()
+    except FileNotFoundError:
+        old = None
+    with open(built, "rb") as f:
+        new = f.read()
+    update = incremental_update(old, new) if old else None
+    if update is None:
+        os.replace(built, published)
+        return None
+    if update:
+        staged = temp_path(published)
+        try:
+            shutil.copyfile(published, staged)
+            with open(staged, "ab") as f:
+                f.write(update)
+            os.replace(staged, published)
+        finally:
+            discard(staged)
+    return len(update)
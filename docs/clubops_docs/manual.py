@@ -0,0 +1,430 @@
+"""
+ClubOps Operations Manual
+Section builders and document configuration for the operations manual
+"""
+
+from reportlab.lib.units import inch
+from reportlab.lib.colors import black, white
+from reportlab.platypus import Spacer, PageBreak
+import os
+
+from .config import DocumentConfig, MANUAL_DIR, GOLD, ELECTRIC
+from .flowables import add_screenshot, data_table
+from .overlays import Arrow, Badge, Box
+from .paragraphs import Paragraph
+
+
+def build_cover_page(story, ctx):
+    """Build the cover page"""
+    styles = ctx.styles
+    _ = ctx.gettext
+    story.append(Spacer(1, 2*inch))
+    story.append(Paragraph("ClubOps", styles['CoverTitle']))
+    story.append(Paragraph(_("Operations Manual"), styles['CoverSubtitle']))
+    story.append(Spacer(1, 0.3*inch))
+    story.append(Paragraph(_("Premium Gentlemen's Club Management Platform"), styles['CoverVersion']))
+    story.append(Paragraph(_("Version 2.0 | {date}").format(date=ctx.month_year(ctx.build_date)), styles['ManualBody']))
+    story.append(Spacer(1, 1*inch))
+
+    # Quick access URLs
+    url_data = [
+        ["Resource", "URL/Credentials"],
+        ["Live Application", "https://clubops-saas-frontend.vercel.app"],
+        ["Demo Login", "admin@clubops.com / password"],
+        ["Backend API", "https://clubops-backend.vercel.app"],
+        ["Support Email", "support@clubops.com"]
+    ]
+
+    url_rows = ctx.translate_rows(url_data[:1]) + [[_(label), value] for label, value in url_data[1:]]
+    url_table = data_table(url_rows, header_bg=ELECTRIC, header_fg=white, padding=8,
+                           extra_styles=[('ALIGN', (0, 0), (-1, -1), 'LEFT')])
+    story.append(url_table)
+    story.append(PageBreak())
+
+
+def build_getting_started(story, ctx):
+    """Build Getting Started section"""
+    styles = ctx.styles
+    _ = ctx.gettext
+    story.append(Paragraph(_("1. Getting Started"), styles['SectionTitle']))
+
+    story.append(Paragraph(_("1.1 System Requirements"), styles['SubSection']))
+    story.append(Paragraph(
+        _("ClubOps is a cloud-based web application accessible from any modern device. "
+          "No installation is required."),
+        styles['ManualBody']
+    ))
+
+    story.append(Paragraph(_("Supported Browsers:"), styles['SubSubSection']))
+    for browser in [_("• Chrome 90+ (Recommended)"), "• Firefox 88+", "• Safari 14+", "• Edge 90+"]:
+        story.append(Paragraph(browser, styles['BulletItem']))
+
+    story.append(Paragraph(_("Device Compatibility:"), styles['SubSubSection']))
+    for device in ["• Desktop/Laptop (Windows, macOS, Linux)", "• Tablets (iPad, Android tablets)",
+                   "• Mobile Phones (iOS 14+, Android 10+)"]:
+        story.append(Paragraph(_(device), styles['BulletItem']))
+
+    story.append(Paragraph(_("1.2 Accessing ClubOps"), styles['SubSection']))
+    add_screenshot(story, ctx, "00-login.png", _("Figure 1.1: ClubOps Login Screen"))
+
+    story.append(Paragraph(
+        _("Navigate to https://clubops-saas-frontend.vercel.app and enter your credentials. "
+          "Contact your club administrator if you don't have login credentials."),
+        styles['ManualBody']
+    ))
+
+    story.append(PageBreak())
+
+
+def build_dashboard(story, ctx):
+    """Build Dashboard section"""
+    styles = ctx.styles
+    _ = ctx.gettext
+    story.append(Paragraph(_("2. Dashboard Overview"), styles['SectionTitle']))
+
+    story.append(Paragraph(
+        _("The Dashboard is your central command center, providing real-time visibility into all "
+          "club operations. It displays key metrics, recent activity, and quick action buttons."),
+        styles['ManualBody']
+    ))
+
+    add_screenshot(story, ctx, "01-dashboard.png", _("Figure 2.1: Main Dashboard with Real-Time Metrics"))
+
+    story.append(Paragraph(_("2.1 Key Metrics Cards"), styles['SubSection']))
+
+    metric_data = [
+        ["Metric", "Description"],
+        ["Active Dancers", "Number of checked-in dancers vs total roster size"],
+        ["VIP Booths", "Occupancy percentage and available booth count"],
+        ["DJ Queue", "Current queue depth and stage rotation status"],
+        ["Today's Revenue", "Running total with growth percentage indicator"]
+    ]
+
+    metric_table = data_table(ctx.translate_rows(metric_data))
+    story.append(metric_table)
+
+    story.append(Paragraph(_("2.2 Recent Activity Feed"), styles['SubSection']))
+    story.append(Paragraph(
+        _("The activity feed shows real-time events including license alerts, payment confirmations, "
+          "dancer check-ins, and compliance notifications. Click any activity to view details."),
+        styles['ManualBody']
+    ))
+
+    story.append(PageBreak())
+
+
+def build_dancer_management(story, ctx):
+    """Build Dancer Management section"""
+    styles = ctx.styles
+    _ = ctx.gettext
+    story.append(Paragraph(_("3. Dancer Management"), styles['SectionTitle']))
+
+    story.append(Paragraph(
+        _("Manage your complete dancer roster with license compliance tracking, bar fee collection, "
+          "and performance status monitoring. The color-coded card system provides instant visibility "
+          "into compliance issues."),
+        styles['ManualBody']
+    ))
+
+    add_screenshot(story, ctx, "02-dancers.png", _("Figure 3.1: Dancer Management Grid with Compliance Indicators"),
+                   tile=True)
+
+    story.append(Paragraph(_("3.1 License Status Indicators"), styles['SubSection']))
+
+    status_data = [
+        ["Status", "Color", "Meaning"],
+        ["Valid", "Green", "All documents current - dancer can perform"],
+        ["Expiring Soon", "Yellow", "License expires within 14 days - proactive alert"],
+        ["Expired", "Red", "Cannot perform - license renewal required"],
+        ["Pending", "Blue", "Application submitted - awaiting approval"]
+    ]
+
+    status_table = data_table(ctx.translate_rows(status_data))
+    story.append(status_table)
+
+    story.append(Paragraph(_("3.2 Adding a New Dancer"), styles['SubSection']))
+    steps = [
+        "1. Click the 'Add Dancer' button in the top right",
+        "2. Fill in required information: Legal Name, Stage Name, Phone, Email",
+        "3. Upload license documentation and ID verification",
+        "4. Set bar fee amount and schedule preferences",
+        "5. Click 'Save' to add dancer to roster"
+    ]
+    for step in steps:
+        story.append(Paragraph(_(step), styles['BulletItem']))
+
+    story.append(PageBreak())
+
+
+def build_dj_queue(story, ctx):
+    """Build DJ Queue section"""
+    styles = ctx.styles
+    _ = ctx.gettext
+    story.append(Paragraph(_("4. DJ Queue Management"), styles['SectionTitle']))
+
+    story.append(Paragraph(
+        _("The DJ Queue is the operational heart of ClubOps, featuring drag-and-drop stage management "
+          "and an integrated music player supporting MP3, AAC, FLAC, and WAV formats."),
+        styles['ManualBody']
+    ))
+
+    add_screenshot(story, ctx, "03-dj-queue.png", _("Figure 4.1: DJ Queue Interface with Music Player"), overlays=[
+        Box(1735, 86, 166, 60), Arrow(1560, 116, 1727, 116),  # Add Track
+        Box(1118, 309, 188, 64),                               # playback controls
+    ])
+
+    story.append(Paragraph(_("4.1 Managing the Queue"), styles['SubSection']))
+    operations = [
+        "• Drag and drop dancers to reorder the queue",
+        "• Click 'Now on Stage' to move a dancer to performance",
+        "• Use 'Add to Queue' to include checked-in dancers",
+        "• Click 'Clear' to remove a dancer from the queue",
+        "• Auto-rotation timer visible on active performer card"
+    ]
+    for op in operations:
+        story.append(Paragraph(_(op), styles['BulletItem']))
+
+    story.append(Paragraph(_("4.2 Music Player Controls"), styles['SubSection']))
+    story.append(Paragraph(
+        _("The integrated music player allows DJs to manage dancer-specific playlists with full "
+          "playback controls, volume adjustment, and track seeking."),
+        styles['ManualBody']
+    ))
+
+    story.append(PageBreak())
+
+
+def build_vip_booths(story, ctx):
+    """Build VIP Booths section"""
+    styles = ctx.styles
+    _ = ctx.gettext
+    story.append(Paragraph(_("5. VIP Booth Management"), styles['SectionTitle']))
+
+    story.append(Paragraph(
+        _("Monitor all VIP booth sessions in real-time with automatic timers, occupancy tracking, "
+          "and revenue calculation. Visual status cards show availability at a glance."),
+        styles['ManualBody']
+    ))
+
+    # badges match the numbered steps of 5.2
+    add_screenshot(story, ctx, "04-vip-booths.png", _("Figure 5.1: VIP Booth Status Cards with Session Controls"),
+                   overlays=[
+                       Box(1383, 555, 446, 56), Badge(1383, 555, 1),  # Start Session
+                       Box(295, 535, 446, 56), Badge(295, 535, 5),    # End Session
+                   ])
+
+    story.append(Paragraph(_("5.1 Booth Status Types"), styles['SubSection']))
+
+    booth_data = [
+        ["Status", "Color", "Available Actions"],
+        ["Available", "Green", "Start Session, Set Maintenance Mode"],
+        ["Occupied", "Red", "End Session, View Timer, Calculate Revenue"],
+        ["Cleaning", "Yellow", "Mark as Available (after cleanup)"],
+        ["Maintenance", "Gray", "Mark as Available (after repairs)"]
+    ]
+
+    booth_table = data_table(ctx.translate_rows(booth_data))
+    story.append(booth_table)
+
+    story.append(Paragraph(_("5.2 Starting a VIP Session"), styles['SubSection']))
+    session_steps = [
+        "1. Click 'Start Session' on an available booth",
+        "2. Select dancer(s) from the dropdown",
+        "3. Session timer begins automatically",
+        "4. Revenue tracking starts based on booth rate",
+        "5. Click 'End Session' when customer leaves"
+    ]
+    for step in session_steps:
+        story.append(Paragraph(_(step), styles['BulletItem']))
+
+    story.append(PageBreak())
+
+
+def build_revenue(story, ctx):
+    """Build Revenue Dashboard section"""
+    styles = ctx.styles
+    _ = ctx.gettext
+    story.append(Paragraph(_("6. Revenue Dashboard"), styles['SectionTitle']))
+
+    story.append(Paragraph(
+        _("Track all financial activity with multi-period views (Today, Week, Month, Year), "
+          "revenue breakdown by category, and automated goal tracking."),
+        styles['ManualBody']
+    ))
+
+    add_screenshot(story, ctx, "05-revenue.png", _("Figure 6.1: Revenue Dashboard with Category Breakdown"))
+
+    story.append(Paragraph(_("6.1 Revenue Categories"), styles['SubSection']))
+
+    revenue_data = [
+        ["Category", "Typical %", "Description"],
+        ["VIP Booth Revenue", "50-60%", "Session fees from private VIP areas"],
+        ["Bar Fees (House Fees)", "25-30%", "Fees collected from dancers per shift"],
+        ["Cover Charges", "10-15%", "Door entrance fees from customers"],
+        ["Tips & Miscellaneous", "3-5%", "Other revenue streams"]
+    ]
+
+    revenue_table = data_table(ctx.translate_rows(revenue_data))
+    story.append(revenue_table)
+
+    story.append(PageBreak())
+
+
+def build_settings(story, ctx):
+    """Build Settings section"""
+    styles = ctx.styles
+    _ = ctx.gettext
+    story.append(Paragraph(_("7. Settings & Configuration"), styles['SectionTitle']))
+
+    story.append(Paragraph(
+        _("Centralized management for user profiles, club information, notification preferences, "
+          "security settings, and system integrations."),
+        styles['ManualBody']
+    ))
+
+    add_screenshot(story, ctx, "06-settings.png", _("Figure 7.1: Settings Page with Profile Configuration"), tile=True)
+
+    story.append(Paragraph(_("7.1 Settings Categories"), styles['SubSection']))
+
+    categories = [
+        ("Profile", "Personal information, contact details, role assignment"),
+        ("Club Information", "Business name, address, operating hours, tax settings"),
+        ("Notifications", "Email/SMS alerts, compliance reminders, revenue thresholds"),
+        ("Security", "Password management, two-factor authentication, session timeout"),
+        ("Integrations", "Payment processors, accounting software, security systems"),
+        ("Appearance", "Theme customization, dashboard layout, display preferences")
+    ]
+
+    for cat, desc in categories:
+        story.append(Paragraph(f"<b>{_(cat)}:</b> {_(desc)}", styles['BulletItem']))
+
+    story.append(PageBreak())
+
+
+def build_subscription(story, ctx):
+    """Build Subscription section"""
+    styles = ctx.styles
+    _ = ctx.gettext
+    story.append(Paragraph(_("8. Subscription Management"), styles['SectionTitle']))
+
+    story.append(Paragraph(
+        _("ClubOps offers flexible subscription plans to match your club's needs. "
+          "Upgrade or downgrade at any time with prorated billing."),
+        styles['ManualBody']
+    ))
+
+    add_screenshot(story, ctx, "07-subscription.png", _("Figure 8.1: Subscription Plans Comparison"))
+
+    story.append(Paragraph(_("8.1 Subscription Tiers"), styles['SubSection']))
+
+    tier_data = [
+        ["Plan", "Monthly Price", "Key Features"],
+        ["Free", "$0", "Basic dashboard, up to 10 dancers, limited features"],
+        ["Basic", "$99", "Full dashboard, unlimited dancers, standard support"],
+        ["Pro", "$199", "All features, API access, priority support, analytics"],
+        ["Enterprise", "$499", "Multi-location, white-label, dedicated support, SLA"]
+    ]
+
+    tier_table = data_table(ctx.translate_rows(tier_data), header_bg=GOLD, header_fg=black, padding=8)
+    story.append(tier_table)
+
+    story.append(PageBreak())
+
+
+def build_troubleshooting(story, ctx):
+    """Build Troubleshooting section"""
+    styles = ctx.styles
+    _ = ctx.gettext
+    story.append(Paragraph(_("9. Troubleshooting & Support"), styles['SectionTitle']))
+
+    story.append(Paragraph(_("9.1 Common Issues"), styles['SubSection']))
+
+    issues = [
+        ("Cannot log in", "Verify email and password. Use 'Forgot Password' if needed. Clear browser cache and cookies."),
+        ("Screenshots not displaying", "Ensure stable internet connection. Try refreshing the page (F5 or Cmd+R)."),
+        ("Dancer not appearing in queue", "Verify dancer is checked in. Refresh the DJ Queue page."),
+        ("VIP booth timer not starting", "Check booth status is 'Available'. End any existing sessions first."),
+        ("Revenue not updating", "Wait 1-2 minutes for real-time sync. Check WebSocket connection indicator.")
+    ]
+
+    for issue, solution in issues:
+        story.append(Paragraph(f"<b>{_(issue)}:</b> {_(solution)}", styles['ManualBody']))
+        story.append(Spacer(1, 0.1*inch))
+
+    story.append(Paragraph(_("9.2 Getting Support"), styles['SubSection']))
+    support = [
+        "• Email: support@clubops.com (24-48 hour response)",
+        "• Live Chat: Available in-app (Pro/Enterprise plans)",
+        "• Phone: Available for Enterprise customers",
+        "• Knowledge Base: https://docs.clubops.com"
+    ]
+    for item in support:
+        story.append(Paragraph(_(item), styles['BulletItem']))
+
+    story.append(PageBreak())
+
+
+def build_quick_reference(story, ctx):
+    """Build Quick Reference section"""
+    styles = ctx.styles
+    _ = ctx.gettext
+    story.append(Paragraph(_("10. Quick Reference"), styles['SectionTitle']))
+
+    story.append(Paragraph(_("10.1 Keyboard Shortcuts"), styles['SubSection']))
+
+    shortcuts_data = [
+        ["Action", "Windows/Linux", "macOS"],
+        ["Search dancers", "Ctrl + F", "Cmd + F"],
+        ["Add new dancer", "Ctrl + N", "Cmd + N"],
+        ["Refresh page", "F5", "Cmd + R"],
+        ["Open settings", "Ctrl + ,", "Cmd + ,"],
+        ["Log out", "Ctrl + Shift + Q", "Cmd + Shift + Q"]
+    ]
+
+    shortcuts_rows = [[_(action), *keys] for action, *keys in shortcuts_data]
+    shortcuts_table = data_table(shortcuts_rows)
+    story.append(shortcuts_table)
+
+    story.append(Spacer(1, 0.2*inch))
+
+    story.append(Paragraph(_("10.2 User Roles & Permissions"), styles['SubSection']))
+
+    roles_data = [
+        ["Role", "Key Permissions"],
+        ["Owner", "Full access - all features, settings, billing"],
+        ["Manager", "Operations management - dancers, booths, revenue view"],
+        ["DJ", "Queue management - stage rotation, music player"],
+        ["Door Staff", "Check-in management - dancer arrival/departure"],
+        ["VIP Host", "Booth management - sessions, customer service"]
+    ]
+
+    roles_table = data_table(ctx.translate_rows(roles_data))
+    story.append(roles_table)
+
+
+MANUAL = DocumentConfig(
+    name="manual",
+    tenant="manual",
+    title="ClubOps Operations Manual",
+    screenshot_dir=os.path.join(MANUAL_DIR, "screenshots"),
+    output_file=os.path.join(MANUAL_DIR, "ClubOps_Operations_Manual.pdf"),
+    style_set="manual",
+    body_style="ManualBody",
+    figure_spacing=0.1*inch,
+    locales=("en", "es", "fr"),
+    screenshots=("00-login.png", "01-dashboard.png", "02-dancers.png", "03-dj-queue.png", "04-vip-booths.png",
+                 "05-revenue.png", "06-settings.png", "07-subscription.png"),
+    sections=[
+        ("cover page", build_cover_page),
+        ("Getting Started section", build_getting_started),
+        ("Dashboard section", build_dashboard),
+        ("Dancer Management section", build_dancer_management),
+        ("DJ Queue section", build_dj_queue),
+        ("VIP Booths section", build_vip_booths),
+        ("Revenue section", build_revenue),
+        ("Settings section", build_settings),
+        ("Subscription section", build_subscription),
+        ("Troubleshooting section", build_troubleshooting),
+        ("Quick Reference section", build_quick_reference),
+    ],
+)
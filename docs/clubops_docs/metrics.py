@@ -0,0 +1,60 @@
+"""
+Cached text measurement
+stringWidth walks the font's glyph widths character by character; tables
+repeat the same cell values (statuses, roles, amounts) many times, so every
+distinct string is measured once per font and size for the whole process.
+"""
+
+from reportlab.pdfbase.pdfmetrics import stringWidth
+import re
+
+WORD = re.compile(r"\S+")
+
+_widths = {}  # (font name, size) -> {text: width in points}
+
+
+def string_widths(texts, font_name, font_size):
+    """Widths of many strings in one font, measuring each distinct string once"""
+    cache = _widths.setdefault((font_name, font_size), {})
+    for text in [text for text in set(texts) if text not in cache]:
+        cache[text] = stringWidth(text, font_name, font_size)
+    return [cache[text] for text in texts]
+
+
+def text_widths(texts, font_name, font_size):
+    """Width of the longest line of each string"""
+    if not any("\n" in text for text in texts):
+        return string_widths(texts, font_name, font_size)
+    lines = [text.split("\n") for text in texts]
+    flat = string_widths([line for text_lines in lines for line in text_lines], font_name, font_size)
+    widths, start = [], 0
+    for text_lines in lines:
+        widths.append(max(flat[start:start + len(text_lines)]))
+        start += len(text_lines)
+    return widths
+
+
+def text_extent(texts, font_name, font_size):
+    """(widest line, widest word) over a batch of strings, for table column sizing"""
+    texts = list(set(texts))
+    words = [word for text in texts for word in WORD.findall(text)]
+    widest_line = max(text_widths(texts, font_name, font_size), default=0)
+    widest_word = max(string_widths(words, font_name, font_size), default=0)
+    return widest_line, widest_word
+
+
+def wrap_text(text, font_name, font_size, max_width):
+    """Greedy line breaking with cached word widths; words wider than max_width get a line of their own"""
+    space = string_widths([" "], font_name, font_size)[0]
+    lines = []
+    for paragraph in text.split("\n"):
+        words = WORD.findall(paragraph)
+        line, line_width = [], 0
+        for word, width in zip(words, string_widths(words, font_name, font_size)):
+            if line and line_width + space + width > max_width:
+                lines.append(" ".join(line))
+                line, line_width = [], 0
+            line_width += (space if line else 0) + width
+            line.append(word)
+        lines.append(" ".join(line))
+    return "\n".join(lines)
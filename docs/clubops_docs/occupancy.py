@@ -0,0 +1,277 @@
+"""
+VIP booth occupancy reports
+Reads vip_rooms and vip_sessions from a SQLite export of database/schema.sql
+and writes one PDF per club with, for every booth and hour of the day, how
+much of the time the booth was in use, the most sessions that overlapped in
+it, and the idle gaps between sessions, as heatmaps in the layout of the
+manual's VIP Booth Management section.
+
+Each booth's sessions are swept once in time order: session starts come
+sorted from the query and their ends are sorted next to them, so walking
+both lists yields every point where the number of running sessions changes.
+Between two such points the count is constant, and that stretch is added to
+the hour-of-day slots it covers. The cost follows the number of sessions and
+the hours they span, never minutes, so a year of sessions across every club
+takes seconds.
+"""
+
+from reportlab.lib.colors import HexColor, black
+from reportlab.platypus import Spacer
+from dataclasses import dataclass, field
+import calendar
+import itertools
+import os
+import sqlite3
+import time
+
+from .build import SharedResources
+from .config import GOLD, OCCUPANCY_DIR, TABLE_WIDTH
+from .flowables import data_table
+from .paragraphs import Paragraph
+from .reports import build_reports, club_slug, load_clubs, open_export, report_config, title_paragraph
+
+HOUR = 3600
+DAY = 24 * HOUR
+CLOSED_GAP = 4 * HOUR  # a longer pause between sessions is closing time, not an idle booth
+DAY_START = 6          # hour columns run from 06:00 to 05:00, so a night reads left to right
+HEATMAP_EMPTY = HexColor("#F8FAFC")
+HEATMAP_FONT_SIZE = 6.5
+HEATMAP_LABEL_WIDTH = 76
+HEATMAP_MAX_CELL_WIDTH = 32  # hour columns share the table width up to this
+
+ROOMS_QUERY = "SELECT club_id, id, room_name, capacity FROM vip_rooms ORDER BY club_id, room_name, id"
+# times as seconds since the epoch, computed by SQLite; naive timestamps are read as they are.
+# unixepoch() (SQLite 3.38) is about twice as fast as strftime('%s') on a year of sessions
+EPOCH = "unixepoch(%s)" if sqlite3.sqlite_version_info >= (3, 38) else "CAST(strftime('%%s', %s) AS INTEGER)"
+SESSIONS_QUERY = f"""
+    SELECT room_id, start, end
+    FROM (SELECT room_id, start, COALESCE({EPOCH % "ended_at"}, start + duration_minutes * 60, :as_of) AS end
+          FROM (SELECT room_id, ended_at, duration_minutes, {EPOCH % "started_at"} AS start
+                FROM vip_sessions
+                WHERE COALESCE(status, 'active') != 'cancelled'))
+    WHERE end > start
+    ORDER BY room_id, start
+"""
+
+
+@dataclass
+class BoothUsage:
+    """Per hour of the day totals for one booth, from sweep_sessions"""
+    room_id: str
+    name: str
+    capacity: int
+    sessions: int = 0
+    occupied: list = field(default_factory=lambda: [0] * 24)   # seconds with at least one session
+    peak: list = field(default_factory=lambda: [0] * 24)       # most sessions running at once
+    idle: list = field(default_factory=lambda: [0] * 24)       # seconds of idle gaps starting in the hour
+    gaps: list = field(default_factory=lambda: [0] * 24)       # number of idle gaps starting in the hour
+    longest_gap: int = 0
+    first: int = None  # earliest start and latest end, in epoch seconds
+    last: int = None
+
+
+def sweep_sessions(usage, starts, ends):
+    """Add sessions to a BoothUsage; starts sorted, ends in any order (sorted here)
+
+    One pass over the merged start and end times: between two consecutive
+    times the number of running sessions is constant, so each stretch is
+    added to the hour slots it touches. An end and a start at the same
+    moment are a handover, not an overlap or a gap.
+    """
+    ends = sorted(ends)
+    occupied, peak, idle, gaps = usage.occupied, usage.peak, usage.idle, usage.gaps
+    count = len(starts)
+    i = j = running = 0
+    previous = idle_since = None
+    while j < count:
+        # while starts remain, ends[j] exists: no more sessions have ended than have started
+        if i < count and starts[i] < ends[j]:
+            moment, step = starts[i], 1
+            i += 1
+        else:
+            moment, step = ends[j], -1
+            j += 1
+        if running and moment > previous:
+            position = previous
+            hour_end = (position // HOUR + 1) * HOUR
+            while hour_end < moment:
+                hour = position // HOUR % 24
+                occupied[hour] += hour_end - position
+                if running > peak[hour]:
+                    peak[hour] = running
+                position, hour_end = hour_end, hour_end + HOUR
+            hour = position // HOUR % 24
+            occupied[hour] += moment - position
+            if running > peak[hour]:
+                peak[hour] = running
+        elif not running and step > 0 and idle_since is not None and 0 < moment - idle_since <= CLOSED_GAP:
+            hour = idle_since // HOUR % 24
+            idle[hour] += moment - idle_since
+            gaps[hour] += 1
+            usage.longest_gap = max(usage.longest_gap, moment - idle_since)
+        running += step
+        if not running:
+            idle_since = moment
+        previous = moment
+    if count:
+        usage.sessions += count
+        usage.first = starts[0] if usage.first is None else min(usage.first, starts[0])
+        usage.last = ends[-1] if usage.last is None else max(usage.last, ends[-1])
+    return usage
+
+
+@dataclass
+class ClubOccupancy:
+    club_id: str
+    name: str
+    subdomain: str
+    booths: list = field(default_factory=list)
+
+    @property
+    def days(self):
+        """Days covered by the club's sessions, the denominator of every occupancy share"""
+        firsts = [booth.first for booth in self.booths if booth.first is not None]
+        if not firsts:
+            return 0
+        lasts = [booth.last for booth in self.booths if booth.last is not None]
+        return max(1, max(lasts) // DAY - min(firsts) // DAY + 1)
+
+
+def load_occupancy(db_path, as_of):
+    """ClubOccupancy for every club in the export; sessions still running end at as_of (a datetime)"""
+    connection = open_export(db_path)
+    try:
+        clubs = {club_id: ClubOccupancy(str(club_id), name, subdomain)
+                 for club_id, name, subdomain in load_clubs(connection)}
+        booths = {}
+        for club_id, room_id, name, capacity in connection.execute(ROOMS_QUERY):
+            if club_id in clubs:
+                booths[room_id] = BoothUsage(str(room_id), name, capacity or 1)
+                clubs[club_id].booths.append(booths[room_id])
+        rows = connection.execute(SESSIONS_QUERY, {"as_of": calendar.timegm(as_of.timetuple())})
+        for room_id, sessions in itertools.groupby(rows, key=lambda row: row[0]):
+            if room_id in booths:
+                sessions = list(sessions)
+                sweep_sessions(booths[room_id], [row[1] for row in sessions], [row[2] for row in sessions])
+    finally:
+        connection.close()
+    return list(clubs.values())
+
+
+def hour_columns(booths):
+    """Hours of the day with any use, from DAY_START round to the hour before it, trimmed at both ends"""
+    hours = [(DAY_START + offset) % 24 for offset in range(24)]
+    used = [hour for hour in hours if any(booth.occupied[hour] for booth in booths)]
+    if not used:
+        return hours
+    return hours[hours.index(used[0]):hours.index(used[-1]) + 1]
+
+
+def shade(value, top, color=GOLD):
+    """Heatmap fill: from near white (0) to color (top)"""
+    if not value or not top:
+        return HEATMAP_EMPTY
+    share = min(1.0, value / top)
+    return HexColor("#%02X%02X%02X" % tuple(
+        round(255 + (channel * 255 - 255) * (0.15 + 0.85 * share))
+        for channel in (color.red, color.green, color.blue)))
+
+
+def heatmap(booths, hours, values, top, fmt):
+    """Booth x hour table with each cell shaded by its value"""
+    rows = [["Booth"] + [f"{hour:02d}" for hour in hours]]
+    commands = [("FONTSIZE", (0, 0), (-1, -1), HEATMAP_FONT_SIZE), ("LEADING", (0, 0), (-1, -1), HEATMAP_FONT_SIZE),
+                ("ALIGN", (1, 0), (-1, -1), "CENTER"),
+                ("LEFTPADDING", (0, 0), (-1, -1), 2), ("RIGHTPADDING", (0, 0), (-1, -1), 2),
+                ("GRID", (0, 0), (-1, -1), 0.5, black)]
+    for row, booth in enumerate(booths, 1):
+        cells = [values(booth, hour) for hour in hours]
+        rows.append([booth.name] + [fmt(value) if value else "" for value in cells])
+        commands += [("BACKGROUND", (column, row), (column, row), shade(value, top))
+                     for column, value in enumerate(cells, 1)]
+    cell_width = min(HEATMAP_MAX_CELL_WIDTH, (TABLE_WIDTH - HEATMAP_LABEL_WIDTH) / len(hours))
+    return data_table(rows, col_widths=[HEATMAP_LABEL_WIDTH] + [cell_width] * len(hours),
+                      padding=3, extra_styles=commands, repeat_header=True)
+
+
+def occupancy_story(ctx, club):
+    styles = ctx.styles
+    body = styles[ctx.config.body_style]
+    days = club.days
+    booths = club.booths
+    story = [title_paragraph(ctx)]
+    if not days:
+        story.append(Paragraph("No VIP sessions recorded.", body))
+        return story
+    first = min(booth.first for booth in booths if booth.first is not None)
+    story.append(Paragraph(
+        f"{sum(booth.sessions for booth in booths)} session(s) in {len(booths)} booth(s) over {days} day(s) "
+        f"from {time.strftime('%Y-%m-%d', time.gmtime(first))}. Each hour column covers that hour on every "
+        f"day of the period; idle gaps longer than {CLOSED_GAP // HOUR} hours count as closing time.", body))
+
+    summary = [["Booth", "Capacity", "Sessions", "Occupancy", "Busiest", "Peak", "Avg gap", "Longest gap"]]
+    for booth in booths:
+        busiest = max(range(24), key=lambda hour: booth.occupied[hour])
+        gaps = sum(booth.gaps)
+        summary.append([
+            booth.name, str(booth.capacity), str(booth.sessions), f"{sum(booth.occupied) / (days * DAY):.0%}",
+            f"{busiest:02d}:00" if booth.occupied[busiest] else "-", str(max(booth.peak)),
+            f"{sum(booth.idle) / gaps / 60:.0f} min" if gaps else "-",
+            f"{booth.longest_gap / 60:.0f} min" if booth.longest_gap else "-",
+        ])
+    story.append(data_table(summary, repeat_header=True))
+
+    hours = hour_columns(booths)
+    story.append(Spacer(1, 12))
+    story.append(Paragraph("Occupancy by hour (% of the hour in use)", styles["SubSection"]))
+    story.append(heatmap(booths, hours, lambda booth, hour: booth.occupied[hour] / (days * HOUR), 1.0,
+                         lambda value: f"{value * 100:.0f}" if value >= 0.005 else "<1"))
+    story.append(Spacer(1, 12))
+    story.append(Paragraph("Peak concurrent sessions", styles["SubSection"]))
+    story.append(heatmap(booths, hours, lambda booth, hour: booth.peak[hour],
+                         max(max(booth.peak) for booth in booths), str))
+    story.append(Spacer(1, 12))
+    story.append(Paragraph("Average idle gap starting in the hour (minutes)", styles["SubSection"]))
+    story.append(heatmap(booths, hours,
+                         lambda booth, hour: booth.idle[hour] / booth.gaps[hour] / 60 if booth.gaps[hour] else 0,
+                         CLOSED_GAP / 60, lambda value: f"{value:.0f}"))
+    return story
+
+
+def occupancy_output(club, out_dir=OCCUPANCY_DIR):
+    """<out_dir>/<subdomain>-vip-occupancy.pdf"""
+    return os.path.join(out_dir, f"{club_slug(club.subdomain, club.club_id)}-vip-occupancy.pdf")
+
+
+def occupancy_report(club, out_dir=OCCUPANCY_DIR):
+    """(config, story builder) of one club's occupancy report, charged to the club"""
+    config = report_config("vip-occupancy", f"{club.name} VIP Booth Occupancy", occupancy_output(club, out_dir),
+                           tenant=club_slug(club.subdomain, club.club_id))
+    return config, lambda ctx: occupancy_story(ctx, club)
+
+
+def build_occupancy_reports(db_path, out_dir=OCCUPANCY_DIR, shared=None, options=None, as_of=None, queue=None):
+    """Occupancy PDFs for every club in the export in one pass; returns their paths
+
+    Sessions without an end are counted as running until as_of, which
+    defaults to the build date. The reports are batch jobs on queue, one
+    tenant per club (see reports.build_reports).
+    """
+    owned = shared is None
+    shared = shared or SharedResources(options)
+    as_of = as_of or shared.build_date
+    started = time.perf_counter()
+    os.makedirs(out_dir, exist_ok=True)
+    try:
+        clubs = load_occupancy(db_path, as_of)
+        swept = time.perf_counter() - started
+        print(f"🛋️  {sum(booth.sessions for club in clubs for booth in club.booths)} VIP session(s) in "
+              f"{sum(len(club.booths) for club in clubs)} booth(s) of {len(clubs)} club(s) swept in {swept:.2f}s")
+        outputs = build_reports([occupancy_report(club, out_dir) for club in clubs], shared, queue)
+        for club, output in zip(clubs, outputs):
+            print(f"   {club.name} → {output}")
+    finally:
+        if owned:
+            shared.close()
+    print(f"✅ {len(outputs)} occupancy report(s) in {time.perf_counter() - started:.2f}s")
+    return outputs
@@ -0,0 +1,142 @@
+"""
+Vector callouts drawn over screenshots
+Annotations are given in the screenshot's own pixel coordinates (origin at
+the top left, as in any image editor) and drawn as vectors over the cached
+base image, so a highlighted button or numbered step costs a few hundred
+bytes instead of another captured PNG. Line widths and badge sizes are in
+points on the page, whatever the image is scaled to. The HTML target draws
+the same annotations as an inline SVG over the responsive image.
+"""
+
+from dataclasses import dataclass
+import math
+
+from .config import DARK_BG, GOLD
+
+CALLOUT_COLOR = GOLD
+BADGE_TEXT_COLOR = DARK_BG
+LINE_WIDTH = 2        # points
+ARROW_HEAD = (9, 7)   # length and width in points
+BADGE_RADIUS = 8      # points
+BADGE_FONT = ("Helvetica-Bold", 9)
+
+
+def _svg_color(color):
+    return "#" + color.hexval()[2:]
+
+
+@dataclass(frozen=True)
+class Box:
+    """Rounded outline around a region, e.g. a button"""
+    x: float
+    y: float
+    width: float
+    height: float
+    radius: float = 6
+
+    def bounds(self):
+        return self.x, self.y, self.x + self.width, self.y + self.height
+
+    def draw(self, canv, scale, image_height):
+        canv.setStrokeColor(CALLOUT_COLOR)
+        canv.setLineWidth(LINE_WIDTH)
+        canv.roundRect(self.x * scale, (image_height - self.y - self.height) * scale,
+                       self.width * scale, self.height * scale, self.radius * scale, stroke=1, fill=0)
+
+    def svg(self, scale):
+        return (f'<rect x="{self.x:g}" y="{self.y:g}" width="{self.width:g}" height="{self.height:g}" '
+                f'rx="{self.radius:g}" fill="none" stroke="{_svg_color(CALLOUT_COLOR)}" '
+                f'stroke-width="{LINE_WIDTH / scale:.2f}"/>')
+
+
+@dataclass(frozen=True)
+class Arrow:
+    """Straight arrow from (x1, y1) with its head at (x2, y2)"""
+    x1: float
+    y1: float
+    x2: float
+    y2: float
+
+    def bounds(self):
+        return min(self.x1, self.x2), min(self.y1, self.y2), max(self.x1, self.x2), max(self.y1, self.y2)
+
+    def _head(self, scale):
+        """Shaft end and the two back corners of the head, in image pixels"""
+        length, width = ARROW_HEAD[0] / scale, ARROW_HEAD[1] / scale
+        dx, dy = self.x2 - self.x1, self.y2 - self.y1
+        norm = math.hypot(dx, dy) or 1
+        ux, uy = dx / norm, dy / norm
+        bx, by = self.x2 - ux * length, self.y2 - uy * length
+        return (bx, by), (bx - uy * width / 2, by + ux * width / 2), (bx + uy * width / 2, by - ux * width / 2)
+
+    def draw(self, canv, scale, image_height):
+        def page(x, y):
+            return x * scale, (image_height - y) * scale
+        base, left, right = self._head(scale)
+        canv.setStrokeColor(CALLOUT_COLOR)
+        canv.setFillColor(CALLOUT_COLOR)
+        canv.setLineWidth(LINE_WIDTH)
+        canv.line(*page(self.x1, self.y1), *page(*base))
+        path = canv.beginPath()
+        path.moveTo(*page(self.x2, self.y2))
+        path.lineTo(*page(*left))
+        path.lineTo(*page(*right))
+        path.close()
+        canv.drawPath(path, stroke=0, fill=1)
+
+    def svg(self, scale):
+        base, left, right = self._head(scale)
+        color = _svg_color(CALLOUT_COLOR)
+        points = " ".join(f"{x:.1f},{y:.1f}" for x, y in ((self.x2, self.y2), left, right))
+        return (f'<line x1="{self.x1:g}" y1="{self.y1:g}" x2="{base[0]:.1f}" y2="{base[1]:.1f}" '
+                f'stroke="{color}" stroke-width="{LINE_WIDTH / scale:.2f}"/>'
+                f'<polygon points="{points}" fill="{color}"/>')
+
+
+@dataclass(frozen=True)
+class Badge:
+    """Numbered disc centred on (x, y), matching a numbered step in the text"""
+    x: float
+    y: float
+    number: int
+
+    def bounds(self):
+        return self.x, self.y, self.x, self.y
+
+    def draw(self, canv, scale, image_height):
+        cx, cy = self.x * scale, (image_height - self.y) * scale
+        canv.setFillColor(CALLOUT_COLOR)
+        canv.circle(cx, cy, BADGE_RADIUS, stroke=0, fill=1)
+        canv.setFillColor(BADGE_TEXT_COLOR)
+        canv.setFont(*BADGE_FONT)
+        canv.drawCentredString(cx, cy - BADGE_FONT[1] * 0.35, str(self.number))
+
+    def svg(self, scale):
+        font, size = BADGE_FONT
+        return (f'<circle cx="{self.x:g}" cy="{self.y:g}" r="{BADGE_RADIUS / scale:.1f}" '
+                f'fill="{_svg_color(CALLOUT_COLOR)}"/>'
+                f'<text x="{self.x:g}" y="{self.y + size * 0.35 / scale:.1f}" text-anchor="middle" '
+                f'font-family="Helvetica,Arial,sans-serif" font-weight="bold" font-size="{size / scale:.1f}" '
+                f'fill="{_svg_color(BADGE_TEXT_COLOR)}">{self.number}</text>')
+
+
+def draw_overlays(canv, overlays, scale, image_height):
+    """Draw annotations over an image placed at the canvas origin"""
+    for overlay in overlays:
+        canv.saveState()
+        overlay.draw(canv, scale, image_height)
+        canv.restoreState()
+
+
+def overlay_svg(overlays, image_width, image_height, scale):
+    """Inline SVG drawing the annotations over an image of the given pixel size"""
+    body = "".join(overlay.svg(scale) for overlay in overlays)
+    return (f'<svg viewBox="0 0 {image_width:g} {image_height:g}" preserveAspectRatio="none" '
+            f'aria-hidden="true">{body}</svg>')
+
+
+def outside(overlays, image_width, image_height):
+    """Annotations that reach beyond the image"""
+    return [overlay for overlay in overlays
+            if (bounds := overlay.bounds())[0] < 0 or bounds[1] < 0
+            or bounds[2] > image_width or bounds[3] > image_height]
@@ -0,0 +1,142 @@
+"""
+Page manifest
+A layout listener that fingerprints every placed flowable and every page and
+records which section builder produced it. Each published build writes the
+manifest next to the PDF; revision notices (changes.py) compare a fresh
+build against it to find the sections and pages that changed.
+
+Format (version 1):
+    {
+      "version": 1,
+      "document": "manual",
+      "built": "2026-10-19T12:00:00",
+      "sections": [{"label": "DJ Queue section", "title": "4. DJ Queue Management",
+                    "hash": "..."}, ...],
+      "pages": [{"hash": "...", "sections": [4], "items": ["...", ...],
+                 "bands": [[bottom, top], ...]}, ...]
+    }
+
+items holds one short fingerprint per drawn flowable on the page, in
+placement order; bands holds the vertical extent (in points) of each one.
+A page hash covers the fingerprints and their positions, so a page whose
+content merely moved also counts as changed.
+"""
+
+from reportlab.platypus import Paragraph, Table
+import hashlib
+import json
+import os
+
+from .flowables import Screenshot
+from .publish import atomic_write
+from .search_index import flowable_texts
+
+VERSION = 1
+
+
+def _digest(*parts):
+    return hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def flowable_fingerprint(flowable):
+    """Short content hash of a flowable that draws something, else None
+
+    Split parts of paragraphs and tables get their own fingerprint, so the
+    same content split at the same place matches across builds.
+    """
+    if isinstance(flowable, Paragraph):
+        text = flowable.text if flowable.text is not None else flowable.getPlainText()
+        return _digest("P", flowable.style.name, text)
+    if isinstance(flowable, Table):
+        widths = [round(width, 1) for width in flowable._colWidths or ()]
+        return _digest("T", widths, flowable_texts(flowable))
+    if isinstance(flowable, Screenshot):
+        asset = flowable.asset
+        return _digest("S", asset.digest or os.path.basename(asset.path),
+                       round(flowable.drawWidth, 1), round(flowable.drawHeight, 1), flowable.overlays)
+    return None
+
+
+def section_hashes(ctx, story):
+    """Content hash of every section builder's flowables, before layout"""
+    return [_digest(label, [flowable_fingerprint(flowable) or type(flowable).__name__
+                            for flowable in story[start:end]])
+            for label, start, end in ctx.sections]
+
+
+def section_titles(ctx, story, section_style="SectionTitle"):
+    """Heading of every section builder's output, or its progress label if it has none"""
+    titles = []
+    for label, start, end in ctx.sections:
+        headings = [flowable.getPlainText() for flowable in story[start:end]
+                    if isinstance(flowable, Paragraph) and flowable.style.name == section_style]
+        titles.append(headings[0] if headings else label)
+    return titles
+
+
+class PageManifestBuilder:
+    """Layout listener that fingerprints each page of a story built by build_story"""
+
+    def __init__(self, config, ctx, story, built=None):
+        self.config = config
+        self.labels = [label for label, _, _ in ctx.sections]
+        self.titles = section_titles(ctx, story)
+        self.hashes = section_hashes(ctx, story)
+        self.built = built
+        # split parts and layout wrappers are new objects and inherit the current section
+        self.section_of = {id(flowable): index
+                           for index, (_, start, end) in enumerate(ctx.sections)
+                           for flowable in story[start:end]}
+        self.section = 0
+        self.pages = []
+        self._top = None
+
+    def flowable_placed(self, flowable, page, frame=None):
+        known = id(flowable) in self.section_of
+        self.section = self.section_of.get(id(flowable), self.section)
+        while len(self.pages) < page:
+            self.pages.append({"sections": [], "items": [], "bands": []})
+            self._top = frame._y2 - frame._topPadding if frame is not None else None
+        entry = self.pages[page - 1]
+        fingerprint = flowable_fingerprint(flowable)
+        # layout's own page-start actions belong to no section
+        if (known or fingerprint is not None) and self.section not in entry["sections"]:
+            entry["sections"].append(self.section)
+        if frame is None:
+            bottom = top = 0
+        else:
+            bottom, top = round(frame._y, 1), round(self._top, 1)
+            self._top = frame._y
+        if fingerprint is not None:
+            entry["items"].append(fingerprint)
+            entry["bands"].append([bottom, top])
+
+    def to_dict(self):
+        pages = [dict(page, hash=_digest(page["items"], page["bands"])) for page in self.pages]
+        return {
+            "version": VERSION,
+            "document": self.config.name,
+            "built": self.built.isoformat(timespec="seconds") if self.built else None,
+            "sections": [{"label": label, "title": title, "hash": digest}
+                         for label, title, digest in zip(self.labels, self.titles, self.hashes)],
+            "pages": pages,
+        }
+
+    def write(self, path):
+        atomic_write(path, json.dumps(self.to_dict(), separators=(",", ":"), ensure_ascii=False))
+        return path
+
+
+def manifest_path(output_file):
+    """Sidecar location for a document's page manifest"""
+    return output_file.rsplit(".", 1)[0] + ".pages.json"
+
+
+def load_manifest(path):
+    """Manifest of the last published build, or None if there is none (or it is unreadable)"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get("version") == VERSION else None
@@ -0,0 +1,86 @@
+"""
+Cached paragraph parsing
+reportlab parses a paragraph's mini-markup with an HTML parser every time a
+Paragraph is created, and the builders create the same short strings again
+and again: bullets, "<b>Label:</b> text" lines, every locale and every
+rebuild of a document. Parsed fragments are kept per style and text, and
+each new paragraph gets its own copies of them. Only the PARSED_CACHE_SIZE
+most recently used strings are kept, so a long-running server rendering
+reports full of one-off text (names, notes, dates) stays bounded. Text
+without any markup or entities skips the parser altogether: its single
+fragment is a copy of the style's plain fragment with the text filled in.
+
+Use clubops_docs.paragraphs.Paragraph wherever reportlab's Paragraph would
+be used; it is a subclass, so isinstance checks keep working.
+"""
+
+from collections import OrderedDict
+import threading
+
+from reportlab.platypus import paragraph as rl_paragraph
+from reportlab.platypus.paraparser import ParaParser
+
+NO_CACHE = "<seq"  # <seq>, <seqreset/> and friends number differently on every parse
+PARSED_CACHE_SIZE = 4096  # distinct (style, text) pairs; the manual needs a few dozen
+
+_parsed = OrderedDict()  # (style, case sensitive, text) -> (style, frags, bullet frags), least recent first
+_parsed_lock = threading.Lock()
+_plain = {}   # (style, case sensitive) -> fragment of text without markup
+
+
+def _parse(text, style, case_sensitive):
+    parser = ParaParser()
+    parser.caseSensitive = case_sensitive
+    style, frags, bullet_frags = parser.parse(text, style)
+    if frags is None:
+        raise ValueError("xml parser error (%s) in paragraph beginning\n'%s'"
+                         % (parser.errors[0], text[:min(30, len(text))]))
+    rl_paragraph.textTransformFrags(frags, style)
+    return style, frags, bullet_frags
+
+
+def _clone(frags):
+    return [frag.clone() for frag in frags] if frags else frags
+
+
+def parse_markup(text, style, case_sensitive=1):
+    """(style, frags, bullet frags) for paragraph text, as ParaParser.parse returns them
+
+    The fragments are fresh copies, safe for the caller to wrap and split.
+    """
+    key = (style, case_sensitive)
+    if text and "<" not in text and "&" not in text:
+        template = _plain.get(key)
+        if template is None:
+            # "x" stands in for any text: one data run, no tags, no entities
+            template = _plain[key] = _parse("x", style, case_sensitive)[1][0]
+        frags = [template.clone(text=text)]
+        rl_paragraph.textTransformFrags(frags, style)
+        return style, frags, None
+    if NO_CACHE in text:
+        return _parse(text, style, case_sensitive)
+    key += (text,)
+    with _parsed_lock:
+        parsed = _parsed.get(key)
+        if parsed is not None:
+            _parsed.move_to_end(key)
+    if parsed is None:
+        parsed = _parse(text, style, case_sensitive)
+        with _parsed_lock:
+            _parsed[key] = parsed
+            if len(_parsed) > PARSED_CACHE_SIZE:
+                _parsed.popitem(last=False)
+    parsed_style, frags, bullet_frags = parsed
+    return parsed_style, _clone(frags), _clone(bullet_frags)
+
+
+class Paragraph(rl_paragraph.Paragraph):
+    """reportlab Paragraph that parses each distinct markup string once per style"""
+
+    def _setup(self, text, style, bulletText, frags, cleaner):
+        if frags is None:
+            text = cleaner(text)
+            style, frags, bullet_frags = parse_markup(text, style, self.caseSensitive)
+            if bullet_frags:
+                bulletText = bullet_frags
+        rl_paragraph.Paragraph._setup(self, text, style, bulletText, frags, cleaner)
@@ -0,0 +1,109 @@
+"""
+Preflight validation run between story building and layout
+Checks every referenced asset in parallel and collects all problems into
+one report, so a broken document fails before the expensive doc.build
+"""
+
+from reportlab.platypus import Paragraph
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import os
+import re
+
+from .config import FRAME_WIDTH, FRAME_HEIGHT
+from .overlays import outside
+
+FIGURE_NUMBER = re.compile(r"^\s*[^\W\d_]+\s+(\d+)\.(\d+)\s*:")  # "Figure 2.1:", "Figura 2.1:"
+SECTION_NUMBER = re.compile(r"^\s*(\d+)\.\s")
+
+
+class PreflightError(Exception):
+    """Raised with the consolidated list of problems found by preflight"""
+
+    def __init__(self, title, problems):
+        self.title = title
+        self.problems = problems
+        super().__init__(f"preflight failed for {title}: {len(problems)} problem(s)")
+
+    def report(self):
+        lines = [f"❌ Preflight failed for {self.title} ({len(self.problems)} problem(s)):"]
+        lines.extend(f"   • {problem}" for problem in self.problems)
+        return "\n".join(lines)
+
+
+def check_asset(figure, frame_width=FRAME_WIDTH, frame_height=FRAME_HEIGHT, decode=True):
+    """Problems with one referenced screenshot: existence, decoding, fit and callouts"""
+    if figure.error:
+        return [f"{figure.filename}: {figure.error}"]
+    if figure.asset is None:
+        return [f"{figure.filename}: screenshot not found at {figure.path}"]
+    problems = []
+    if decode and not figure.asset.vector:
+        try:
+            # prepared once here and cached: prepare_all and the layout reuse it
+            if figure.tiles:
+                figure.asset.tiles(figure.tiles)
+            else:
+                figure.asset.prepared()
+        except Exception as e:
+            problems.append(f"{figure.filename}: image does not decode ({' '.join(str(e).split())})")
+    if figure.width > frame_width + 0.01 or figure.height > frame_height + 0.01:
+        problems.append(f"{figure.filename}: drawn size {figure.width:.0f}x{figure.height:.0f}pt "
+                        f"exceeds the {frame_width:.0f}x{frame_height:.0f}pt page frame")
+    for overlay in outside(figure.overlays, figure.asset.width, figure.asset.height):
+        problems.append(f"{figure.filename}: {overlay} lies outside the "
+                        f"{figure.asset.width}x{figure.asset.height} image")
+    return problems
+
+
+def section_numbers(story, section_style="SectionTitle"):
+    """Section number in effect at every story index (None before the first section)"""
+    current, numbers = None, []
+    for flowable in story:
+        if isinstance(flowable, Paragraph) and flowable.style.name == section_style:
+            match = SECTION_NUMBER.match(flowable.text)
+            current = int(match.group(1)) if match else None
+        numbers.append(current)
+    return numbers
+
+
+def check_figure_numbering(figures, story):
+    """Captions must be numbered section.n, counting up from 1 within each section"""
+    problems = []
+    numbers = section_numbers(story)
+    seen = set()
+    expected = {}
+    for figure in figures:
+        match = FIGURE_NUMBER.match(figure.caption)
+        if not match:
+            problems.append(f"{figure.filename}: caption has no 'Figure N.M:' number ({figure.caption!r})")
+            continue
+        major, minor = int(match.group(1)), int(match.group(2))
+        if (major, minor) in seen:
+            problems.append(f"Figure {major}.{minor}: number used more than once")
+        seen.add((major, minor))
+        section = numbers[figure.story_index - 1] if 0 < figure.story_index <= len(numbers) else None
+        if section is not None and major != section:
+            problems.append(f"Figure {major}.{minor}: appears in section {section}")
+        wanted = expected.get(major, 1)
+        if minor != wanted:
+            problems.append(f"Figure {major}.{minor}: expected Figure {major}.{wanted}")
+        expected[major] = minor + 1
+    return problems
+
+
+def preflight(ctx, story, max_workers=None):
+    """Validate a built story before layout; raise PreflightError on any problem"""
+    problems = list(ctx.problems)
+    workers = max_workers or min(8, (os.cpu_count() or 1) + 4)
+    # draft builds never touch pixel data, so they skip the decode check
+    check = partial(check_asset, decode=not ctx.options.draft)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for found in pool.map(check, ctx.figures):
+            problems.extend(found)
+    problems.extend(check_figure_numbering(ctx.figures, story))
+    problems.extend(f"{figure.filename}: not listed in the document's screenshots, so an asset store "
+                    f"would not provide it" for figure in ctx.figures
+                    if figure.filename not in ctx.config.screenshots)
+    if problems:
+        raise PreflightError(ctx.config.title, problems)
@@ -0,0 +1,111 @@
+"""
+Atomic publishing
+Generated files are written next to their final path and renamed into
+place, so the static host never serves a half-written PDF. A lock file per
+output, kept in the cache directory rather than next to the output, keeps
+two processes from building the same document at once.
+"""
+
+import hashlib
+import os
+import threading
+import time
+
+from .config import CACHE_DIR
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+LOCK_DIR = os.path.join(CACHE_DIR, "locks")
+
+
+def temp_path(path):
+    """Sibling path for writing path's new content (same directory, so rename is atomic)"""
+    directory, name = os.path.split(path)
+    return os.path.join(directory, f".{name}.{os.getpid()}-{threading.get_ident()}.tmp")
+
+
+def atomic_write(path, data):
+    """Replace path with data (bytes or str) in one rename"""
+    partial = temp_path(path)
+    mode, kw = ("wb", {}) if isinstance(data, bytes) else ("w", {"encoding": "utf-8"})
+    try:
+        with open(partial, mode, **kw) as f:
+            f.write(data)
+        os.replace(partial, path)
+    except BaseException:
+        discard(partial)
+        raise
+
+
+def discard(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def lock_path(output_file, lock_dir=LOCK_DIR):
+    """<lock_dir>/<output name>-<hash of its absolute path>.lock"""
+    path = os.path.abspath(output_file)
+    digest = hashlib.sha1(path.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(lock_dir, f"{os.path.basename(path)}-{digest}.lock")
+
+
+class PublishLock:
+    """Exclusive lock for one output path, held while a document is built and published
+
+    Works across processes (flock on POSIX, msvcrt.locking on Windows) and
+    across threads of one process. The lock file lives in LOCK_DIR, so
+    nothing is left next to the published files; processes only exclude
+    each other when they share a cache directory. The lock file itself is
+    left in place, since removing it would race with a process waiting on it.
+    """
+
+    _thread_locks = {}
+    _guard = threading.Lock()
+
+    def __init__(self, output_file):
+        self.path = lock_path(output_file)
+        with self._guard:
+            self._thread_lock = self._thread_locks.setdefault(self.path, threading.Lock())
+        self._fd = None
+        self.waited = 0.0
+
+    def __enter__(self):
+        started = time.perf_counter()
+        self._thread_lock.acquire()
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            else:
+                while True:
+                    try:
+                        msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:  # LK_LOCK gives up after ten seconds
+                        pass
+        except BaseException:
+            self._release()
+            raise
+        self.waited = time.perf_counter() - started
+        return self
+
+    def __exit__(self, *exc):
+        self._release()
+
+    def _release(self):
+        if self._fd is not None:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+            os.close(self._fd)
+            self._fd = None
+        self._thread_lock.release()
@@ -0,0 +1,100 @@
+"""
+Per-club reports from a database export
+Shared plumbing for the reports that read a SQLite export of
+database/schema.sql instead of screenshots: opening the export read-only,
+the club list, and publishing one PDF per club with the manual's styles.
+
+Per-club reports are built through a BuildQueue as batch jobs charged to
+their club, so a nightly run shares the queue's priorities, merging and
+kind limits with documents and interactive requests (see build_reports).
+
+Names from the export are text, not paragraph markup: anything that puts
+them into a Paragraph escapes them first (see title_paragraph). Plain
+string table cells are drawn as they are and need no escaping.
+"""
+
+from xml.sax.saxutils import escape
+import functools
+import os
+import re
+import sqlite3
+
+from .build import BuildContext, document_template
+from .build_queue import BuildQueue
+from .config import DocumentConfig
+from .paragraphs import Paragraph
+from .publish import PublishLock, discard, temp_path
+
+CLUBS_QUERY = "SELECT id, name, subdomain FROM clubs ORDER BY name, id"
+REPORT_WORKERS = 1  # layout holds the GIL; page compression already runs on its own pool
+
+
+def open_export(db_path):
+    """Read-only connection to a SQLite export"""
+    if not os.path.exists(db_path):
+        raise FileNotFoundError(f"No database export at {db_path}")
+    return sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+
+
+def load_clubs(connection):
+    """[(id, name, subdomain)] in club name order"""
+    return list(connection.execute(CLUBS_QUERY))
+
+
+def club_slug(subdomain, club_id):
+    return re.sub(r"[^a-z0-9]+", "-", str(subdomain or club_id).lower()).strip("-")
+
+
+def report_config(kind, title, output_file, tenant=None):
+    """DocumentConfig for a generated report, laid out with the Operations Manual's styles
+
+    tenant is the club the report belongs to, which a BuildQueue charges
+    for the build.
+    """
+    return DocumentConfig(
+        name=f"{kind}-{os.path.splitext(os.path.basename(output_file))[0]}",
+        title=title,
+        screenshot_dir="",
+        output_file=output_file,
+        style_set="manual",
+        body_style="ManualBody",
+        tenant=tenant,
+    )
+
+
+def title_paragraph(ctx):
+    """The report's title as its section heading; club names such as "R&B Lounge" stay literal"""
+    return Paragraph(escape(ctx.config.title), ctx.styles["SectionTitle"])
+
+
+def write_report(config, shared, story_builder):
+    """Lay out story_builder(ctx) into config.output_file and publish it atomically; returns the path"""
+    ctx = BuildContext(config, shared)
+    with PublishLock(config.output_file):
+        partial = temp_path(config.output_file)
+        try:
+            doc = document_template(partial, config, shared.options)
+            doc.build(story_builder(ctx), canvasmaker=shared.canvasmaker())
+            os.replace(partial, config.output_file)
+        finally:
+            discard(partial)
+    return config.output_file
+
+
+def build_reports(reports, shared, queue=None, priority="batch"):
+    """Build (config, story_builder) reports through a BuildQueue; returns their paths in order
+
+    Each report is requested at the given priority and charged to its
+    club. queue may be shared with other work, such as documents or
+    interactive downloads; without one a private queue is used.
+    """
+    owned = queue is None
+    queue = queue or BuildQueue(shared, workers=REPORT_WORKERS)
+    try:
+        futures = [queue.request(config, priority=priority, tenant=config.tenant,
+                                 build=functools.partial(write_report, story_builder=story_builder))
+                   for config, story_builder in reports]
+        return [future.result() for future in futures]
+    finally:
+        if owned:
+            queue.close()
@@ -0,0 +1,135 @@
+"""
+Reproducible builds
+Fixed build dates, an up-front hash of every input, and the stamp file that
+lets an identical build be skipped entirely
+"""
+
+from reportlab.pdfgen.canvas import Canvas
+import reportlab
+import hashlib
+import json
+import os
+import subprocess
+import threading
+from datetime import datetime, timezone
+
+from .publish import atomic_write
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+STAMP_SUFFIX = ".buildstamp"
+
+
+def source_date_epoch(paths=()):
+    """SOURCE_DATE_EPOCH, falling back to the last git commit touching the inputs
+
+    Only commits that change the builders or the given paths move the date, so
+    unrelated commits do not invalidate otherwise identical artifacts.
+    """
+    value = os.environ.get("SOURCE_DATE_EPOCH", "").strip()
+    if value:
+        return int(value)
+    try:
+        out = subprocess.run(["git", "log", "-1", "--format=%ct", "--", PACKAGE_DIR, *paths],
+                             cwd=PACKAGE_DIR, capture_output=True, text=True, check=True)
+        return int(out.stdout.strip())
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return 946684800  # 2000-01-01, reportlab's own invariant date
+
+
+def fixed_build_date(paths=()):
+    """The build date of a deterministic build, as a UTC datetime (see source_date_epoch)"""
+    return datetime.fromtimestamp(source_date_epoch(paths), tz=timezone.utc)
+
+
+_stamp_lock = threading.Lock()
+
+
+def dated_canvas(build_date, canvasmaker=Canvas):
+    """canvasmaker whose PDF dates are build_date rather than the clock; None keeps the clock
+
+    reportlab only reads SOURCE_DATE_EPOCH while a canvas creates its
+    document, so the variable is set for that moment and then restored,
+    under a lock so that concurrent builds never see each other's date. The
+    cover page and the document info dictionary then agree.
+    """
+    def make(*args, **kw):
+        with _stamp_lock:
+            if build_date is None:
+                return canvasmaker(*args, **kw)
+            previous = os.environ.get("SOURCE_DATE_EPOCH")
+            os.environ["SOURCE_DATE_EPOCH"] = str(int(build_date.timestamp()))
+            try:
+                return canvasmaker(*args, **kw)
+            finally:
+                if previous is None:
+                    del os.environ["SOURCE_DATE_EPOCH"]
+                else:
+                    os.environ["SOURCE_DATE_EPOCH"] = previous
+    return make
+
+
+def _hash_file(h, path, root):
+    h.update(os.path.relpath(path, root).replace(os.sep, "/").encode("utf-8") + b"\0")
+    with open(path, "rb") as f:
+        h.update(hashlib.sha256(f.read()).digest())
+
+
+def _walk(root, suffixes=None):
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d != "__pycache__")
+        for name in sorted(filenames):
+            if suffixes is None or name.lower().endswith(suffixes):
+                found.append(os.path.join(dirpath, name))
+    return found
+
+
+def inputs_hash(config, build_date, settings=None):
+    """Hash of everything that can change a document's bytes
+
+    Covers the builder source code and message catalogs, every file in the
+    screenshot directory, the build date, the reportlab version and any build
+    settings.
+    """
+    h = hashlib.sha256()
+    h.update(json.dumps({
+        "document": config.name,
+        "locale": config.locale,
+        "output": os.path.basename(config.output_file),
+        "build_date": build_date.isoformat(),
+        "reportlab": reportlab.Version,
+        "settings": settings or {},
+    }, sort_keys=True).encode("utf-8"))
+    for path in _walk(PACKAGE_DIR, (".py", ".json")):
+        _hash_file(h, path, PACKAGE_DIR)
+    if os.path.isdir(config.screenshot_dir):
+        for path in _walk(config.screenshot_dir):
+            _hash_file(h, path, config.screenshot_dir)
+    return h.hexdigest()
+
+
+def file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def is_up_to_date(output_file, digest):
+    """True when the artifact on disk was built from exactly these inputs"""
+    stamp_file = output_file + STAMP_SUFFIX
+    if not (os.path.exists(output_file) and os.path.exists(stamp_file)):
+        return False
+    try:
+        with open(stamp_file) as f:
+            stamp = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return stamp.get("inputs") == digest and stamp.get("output") == file_sha256(output_file)
+
+
+def write_stamp(output_file, digest):
+    """Record which inputs produced the artifact"""
+    atomic_write(output_file + STAMP_SUFFIX,
+                 json.dumps({"inputs": digest, "output": file_sha256(output_file)}, indent=2))
@@ -0,0 +1,94 @@
+"""
+Sidecar full-text search index
+Collected from the paragraphs and table cells as layout places them, so the
+page numbers are the real ones. The in-app help fetches the JSON once and
+prefix-searches it without touching the PDF.
+
+Format (version 1):
+    {
+      "version": 1,
+      "document": "manual",
+      "pages": 11,
+      "sections": [{"title": "...", "page": 1}, ...],
+      "terms": ["access", "accessing", ...],          # sorted, lowercase
+      "postings": [[page, section, position, ...], ...]
+    }
+
+terms is sorted, so every term starting with a prefix is one contiguous
+run found by binary search. postings[i] belongs to terms[i] and holds flat
+(page, section index, word position on that page) triples.
+"""
+
+from reportlab.platypus import Paragraph, Table
+import json
+import re
+
+from .publish import atomic_write
+
+TOKEN = re.compile(r"\w\w+", re.UNICODE)
+
+
+def tokenize(text):
+    """Lowercase index terms of a text fragment"""
+    return [token.lower() for token in TOKEN.findall(text)]
+
+
+def flowable_texts(flowable):
+    """Plain text carried by a placed flowable, in reading order"""
+    if isinstance(flowable, Paragraph):
+        return [flowable.getPlainText()]
+    if isinstance(flowable, Table):
+        texts = []
+        for row in flowable._cellvalues:
+            for cell in row:
+                for item in (cell if isinstance(cell, (list, tuple)) else [cell]):
+                    if isinstance(item, Paragraph):
+                        texts.append(item.getPlainText())
+                    elif isinstance(item, str):
+                        texts.append(item)
+        return texts
+    return []
+
+
+class SearchIndexBuilder:
+    """Layout listener that turns placed text into a prefix-searchable index"""
+
+    def __init__(self, config, section_style="SectionTitle"):
+        self.config = config
+        self.section_style = section_style
+        self.sections = [{"title": config.title, "page": 1}]
+        self.postings = {}
+        self.page_positions = {}
+        self.pages = 0
+
+    def flowable_placed(self, flowable, page, frame=None):
+        self.pages = max(self.pages, page)
+        if isinstance(flowable, Paragraph) and flowable.style.name == self.section_style:
+            self.sections.append({"title": flowable.getPlainText(), "page": page})
+        section = len(self.sections) - 1
+        position = self.page_positions.get(page, 0)
+        for text in flowable_texts(flowable):
+            for term in tokenize(text):
+                self.postings.setdefault(term, []).extend((page, section, position))
+                position += 1
+        self.page_positions[page] = position
+
+    def to_dict(self):
+        terms = sorted(self.postings)
+        return {
+            "version": 1,
+            "document": self.config.name,
+            "pages": self.pages,
+            "sections": self.sections,
+            "terms": terms,
+            "postings": [self.postings[term] for term in terms],
+        }
+
+    def write(self, path):
+        atomic_write(path, json.dumps(self.to_dict(), separators=(",", ":"), ensure_ascii=False))
+        return path
+
+
+def index_path(output_file):
+    """Sidecar location for a document's search index"""
+    return output_file.rsplit(".", 1)[0] + ".search.json"
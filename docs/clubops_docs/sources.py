@@ -0,0 +1,261 @@
+"""
+Screenshot sources
+A document's screenshots either live in a local directory or are pulled from
+an HTTP artifact store into a local cache before layout. Either way the rest
+of the pipeline only ever sees a directory of files.
+
+The HTTP source fetches every file concurrently over a small pool of
+keep-alive connections and revalidates cached copies with If-None-Match, so
+an unchanged store costs one 304 round-trip per file, overlapped. Redirects
+are followed as long as they stay on the store's host; a redirect elsewhere
+(another host, port or scheme) is reported as a failed fetch.
+"""
+
+from urllib.parse import quote, urljoin, urlsplit
+import asyncio
+import hashlib
+import json
+import os
+import ssl
+import threading
+
+from .config import CACHE_DIR
+from .publish import discard
+
+DEFAULT_CACHE_DIR = os.path.join(CACHE_DIR, "assets")
+DEFAULT_CONCURRENCY = 32
+REQUEST_TIMEOUT = 30
+ETAGS_FILE = "etags.json"
+REDIRECTS = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 5
+
+
+class FetchError(Exception):
+    pass
+
+
+class LocalSource:
+    """Screenshots already on disk"""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def sync(self, filenames):
+        """Directory holding the files, and the files that could not be provided"""
+        return self.directory, []
+
+
+class HTTPSource:
+    """Screenshots published under base_url/<filename>, mirrored into a local cache"""
+
+    def __init__(self, base_url, cache_dir=DEFAULT_CACHE_DIR, concurrency=DEFAULT_CONCURRENCY,
+                 timeout=REQUEST_TIMEOUT):
+        self.base_url = base_url.rstrip("/") + "/"
+        parts = urlsplit(self.base_url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported asset store URL: {base_url}")
+        self.parts = parts
+        self.directory = os.path.join(cache_dir, hashlib.sha1(self.base_url.encode("utf-8")).hexdigest()[:16])
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.stats = {"fetched": 0, "not_modified": 0, "failed": 0, "bytes": 0}
+
+    def sync(self, filenames):
+        """Bring the cache up to date with the store; return (directory, failures)
+
+        A file that cannot be fetched but has a cached copy keeps the cached
+        copy, so builds still work offline.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        etags = self._load_etags()
+        failures = asyncio.run(self._sync(sorted(set(filenames)), etags))
+        self._save_etags(etags)
+        return self.directory, failures
+
+    async def _sync(self, filenames, etags):
+        pool = _ConnectionPool(self.parts, self.concurrency, self.timeout)
+        try:
+            results = await asyncio.gather(*(self._fetch(pool, name, etags) for name in filenames))
+        finally:
+            pool.close()
+        return [failure for failure in results if failure]
+
+    async def _fetch(self, pool, filename, etags):
+        path = os.path.join(self.directory, filename)
+        cached = os.path.exists(path)
+        headers = {"If-None-Match": etags[filename]} if cached and filename in etags else {}
+        try:
+            status, response_headers, body = await self._get(pool, self.parts.path + quote(filename), headers)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, FetchError) as e:
+            return self._failed(filename, cached, f"{type(e).__name__}: {e}")
+        if status == 304 and cached:
+            self.stats["not_modified"] += 1
+            return None
+        if status != 200:
+            return self._failed(filename, cached, f"HTTP {status}")
+        partial = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(partial, "wb") as f:
+                f.write(body)
+            os.replace(partial, path)
+        except OSError as e:
+            return self._failed(filename, cached, f"cannot store it: {type(e).__name__}: {e}")
+        finally:
+            discard(partial)
+        if "etag" in response_headers:
+            etags[filename] = response_headers["etag"]
+        else:
+            etags.pop(filename, None)
+        self.stats["fetched"] += 1
+        self.stats["bytes"] += len(body)
+        return None
+
+    async def _get(self, pool, target, headers):
+        """pool.get, following redirects that stay on the store's host"""
+        for _ in range(MAX_REDIRECTS + 1):
+            status, response_headers, body = await pool.get(target, headers)
+            if status not in REDIRECTS:
+                return status, response_headers, body
+            if "location" not in response_headers:
+                raise FetchError(f"HTTP {status} without a Location header")
+            location = urlsplit(urljoin(f"{self.parts.scheme}://{self.parts.netloc}{target}",
+                                        response_headers["location"]))
+            if _origin(location) != _origin(self.parts):
+                raise FetchError(f"HTTP {status} redirect to another host ({location.geturl()}) is not supported")
+            target = location.path + (f"?{location.query}" if location.query else "")
+        raise FetchError(f"more than {MAX_REDIRECTS} redirects")
+
+    def _failed(self, filename, cached, reason):
+        self.stats["failed"] += 1
+        if cached:
+            print(f"⚠️  {filename}: {reason}, using cached copy")
+            return None
+        return f"{filename}: cannot fetch from {self.base_url} ({reason})"
+
+    def _load_etags(self):
+        try:
+            with open(os.path.join(self.directory, ETAGS_FILE), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_etags(self, etags):
+        path = os.path.join(self.directory, ETAGS_FILE)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(etags, f, indent=1, sort_keys=True)
+        os.replace(path + ".tmp", path)
+
+
+def _origin(parts):
+    return parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80)
+
+
+def _length(value, base=10):
+    """Content-Length or chunk size from the wire; FetchError when it is not a length"""
+    try:
+        length = int(value, base)
+    except ValueError:
+        length = -1
+    if length < 0:
+        raise FetchError(f"malformed length {value[:40]!r}")
+    return length
+
+
+class _ConnectionPool:
+    """Minimal HTTP/1.1 GET client: at most `size` keep-alive connections to one host"""
+
+    def __init__(self, parts, size, timeout):
+        self.host = parts.hostname
+        self.secure = parts.scheme == "https"
+        self.port = parts.port or (443 if self.secure else 80)
+        self.host_header = parts.netloc.rsplit("@", 1)[-1]
+        self.timeout = timeout
+        self.slots = asyncio.Semaphore(size)
+        self.idle = []
+
+    async def get(self, target, headers):
+        async with self.slots:
+            # a reused connection may have been closed by the server; retry once on a fresh one
+            for attempt in (0, 1):
+                fresh = not self.idle
+                reader, writer = self.idle.pop() if self.idle else await self._connect()
+                try:
+                    status, response_headers, body, keep_alive = await asyncio.wait_for(
+                        self._exchange(reader, writer, target, headers), self.timeout)
+                except (ConnectionError, asyncio.IncompleteReadError, FetchError):
+                    writer.close()
+                    if fresh or attempt:
+                        raise
+                    continue
+                except BaseException:
+                    writer.close()
+                    raise
+                if keep_alive:
+                    self.idle.append((reader, writer))
+                else:
+                    writer.close()
+                return status, response_headers, body
+
+    async def _connect(self):
+        context = ssl.create_default_context() if self.secure else None
+        return await asyncio.wait_for(asyncio.open_connection(self.host, self.port, ssl=context), self.timeout)
+
+    async def _exchange(self, reader, writer, target, headers):
+        lines = [f"GET {target or '/'} HTTP/1.1", f"Host: {self.host_header}",
+                 "Accept-Encoding: identity", "Connection: keep-alive"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("connection closed before response")
+        try:
+            version, status = status_line.decode("latin-1").split()[:2]
+            status = int(status)
+        except ValueError:
+            raise FetchError(f"malformed status line {status_line[:40]!r}")
+        response_headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        keep_alive = version == "HTTP/1.1" and response_headers.get("connection", "").lower() != "close"
+        if status in (204, 304) or 100 <= status < 200:
+            body = b""
+        elif response_headers.get("transfer-encoding", "").lower() == "chunked":
+            body = await self._read_chunked(reader)
+        elif "content-length" in response_headers:
+            body = await reader.readexactly(_length(response_headers["content-length"]))
+        else:
+            body = await reader.read()
+            keep_alive = False
+        return status, response_headers, body, keep_alive
+
+    @staticmethod
+    async def _read_chunked(reader):
+        chunks = []
+        while True:
+            size = _length((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+            if size == 0:
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+
+    def close(self):
+        for _, writer in self.idle:
+            writer.close()
+        self.idle.clear()
+
+
+def screenshot_source(config, asset_store=None, cache_dir=DEFAULT_CACHE_DIR):
+    """Source for a document's screenshots: <asset_store>/<document>/ when given, else its directory"""
+    if asset_store:
+        return HTTPSource(f"{asset_store.rstrip('/')}/{config.name}/", cache_dir)
+    return LocalSource(config.screenshot_dir)
@@ -0,0 +1,206 @@
+"""
+Paragraph style sheets for the ClubOps documents
+Each document picks one of the style sets below by name
+"""
+
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.colors import HexColor, black
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+
+from .config import GOLD, ELECTRIC, ROYAL, BLUE
+
+
+def create_manual_styles():
+    """Create the Operations Manual paragraph styles"""
+    styles = getSampleStyleSheet()
+
+    styles.add(ParagraphStyle(
+        name='CoverTitle',
+        parent=styles['Title'],
+        fontSize=42,
+        textColor=GOLD,
+        alignment=TA_CENTER,
+        spaceAfter=20,
+        fontName='Helvetica-Bold'
+    ))
+
+    styles.add(ParagraphStyle(
+        name='CoverSubtitle',
+        parent=styles['Normal'],
+        fontSize=20,
+        textColor=ELECTRIC,
+        alignment=TA_CENTER,
+        spaceAfter=12
+    ))
+
+    styles.add(ParagraphStyle(
+        name='CoverVersion',
+        parent=styles['Normal'],
+        fontSize=14,
+        textColor=black,
+        alignment=TA_CENTER,
+        spaceAfter=30
+    ))
+
+    styles.add(ParagraphStyle(
+        name='SectionTitle',
+        parent=styles['Heading1'],
+        fontSize=22,
+        textColor=ELECTRIC,
+        spaceBefore=20,
+        spaceAfter=12,
+        fontName='Helvetica-Bold',
+        keepWithNext=True
+    ))
+
+    styles.add(ParagraphStyle(
+        name='SubSection',
+        parent=styles['Heading2'],
+        fontSize=16,
+        textColor=ROYAL,
+        spaceBefore=12,
+        spaceAfter=8,
+        fontName='Helvetica-Bold',
+        keepWithNext=True
+    ))
+
+    styles.add(ParagraphStyle(
+        name='SubSubSection',
+        parent=styles['Heading3'],
+        fontSize=13,
+        textColor=black,
+        spaceBefore=10,
+        spaceAfter=6,
+        fontName='Helvetica-Bold',
+        keepWithNext=True
+    ))
+
+    styles.add(ParagraphStyle(
+        name='ManualBody',
+        parent=styles['Normal'],
+        fontSize=11,
+        textColor=black,
+        spaceBefore=6,
+        spaceAfter=6,
+        leading=15,
+        alignment=TA_JUSTIFY
+    ))
+
+    styles.add(ParagraphStyle(
+        name='ImageCaption',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=HexColor("#555555"),
+        alignment=TA_CENTER,
+        spaceBefore=4,
+        spaceAfter=12,
+        fontName='Helvetica-Oblique'
+    ))
+
+    styles.add(ParagraphStyle(
+        name='BulletItem',
+        parent=styles['Normal'],
+        fontSize=11,
+        textColor=black,
+        leftIndent=20,
+        spaceBefore=3,
+        spaceAfter=3,
+        bulletIndent=10
+    ))
+
+    styles.add(ParagraphStyle(
+        name='CodeBlock',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=black,
+        fontName='Courier',
+        leftIndent=20,
+        spaceBefore=6,
+        spaceAfter=6,
+        backColor=HexColor("#F5F5F5")
+    ))
+
+    return styles
+
+
+def create_ui_guide_styles():
+    """Create the UI Documentation paragraph styles"""
+    styles = getSampleStyleSheet()
+
+    styles.add(ParagraphStyle(
+        name='CoverTitle',
+        parent=styles['Title'],
+        fontSize=36,
+        textColor=GOLD,
+        alignment=TA_CENTER,
+        spaceAfter=20,
+        fontName='Helvetica-Bold'
+    ))
+
+    styles.add(ParagraphStyle(
+        name='CoverSubtitle',
+        parent=styles['Normal'],
+        fontSize=18,
+        textColor=black,
+        alignment=TA_CENTER,
+        spaceAfter=30
+    ))
+
+    styles.add(ParagraphStyle(
+        name='SectionTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=BLUE,
+        spaceBefore=20,
+        spaceAfter=15,
+        fontName='Helvetica-Bold'
+    ))
+
+    styles.add(ParagraphStyle(
+        name='SubSection',
+        parent=styles['Heading2'],
+        fontSize=16,
+        textColor=black,
+        spaceBefore=15,
+        spaceAfter=10,
+        fontName='Helvetica-Bold'
+    ))
+
+    styles.add(ParagraphStyle(
+        name='ClubBody',
+        parent=styles['Normal'],
+        fontSize=11,
+        textColor=black,
+        spaceBefore=6,
+        spaceAfter=6,
+        leading=14
+    ))
+
+    styles.add(ParagraphStyle(
+        name='ImageCaption',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=HexColor("#666666"),
+        alignment=TA_CENTER,
+        spaceBefore=5,
+        spaceAfter=15,
+        fontName='Helvetica-Oblique'
+    ))
+
+    styles.add(ParagraphStyle(
+        name='FeatureItem',
+        parent=styles['Normal'],
+        fontSize=11,
+        textColor=black,
+        leftIndent=20,
+        spaceBefore=3,
+        spaceAfter=3
+    ))
+
+    return styles
+
+
+STYLE_SETS = {
+    "manual": create_manual_styles,
+    "ui-guide": create_ui_guide_styles,
+}
@@ -0,0 +1,147 @@
+"""
+Page thumbnails and previews for the document portal
+Every page of a generated PDF is rasterized once at preview size and scaled
+down to a thumbnail. Pages are hashed first and only pages whose content
+changed since the last run are rendered again, spread over a process pool.
+
+Needs PyMuPDF (pip install pymupdf); everything else works without it.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image as PILImage
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+
+try:
+    import pymupdf
+except ImportError:  # optional dependency
+    pymupdf = None
+
+FORMATS = ("webp", "png")
+SIZES = {"preview": 800, "thumb": 200}  # width in pixels
+WEBP_QUALITY = 80
+MANIFEST_FILE = "manifest.json"
+POOL_THRESHOLD = 8  # fewer changed pages than this render in-process
+
+
+def available():
+    return pymupdf is not None
+
+
+def thumbnail_dir(output_file):
+    """thumbnails/<document stem>/ next to the PDF"""
+    stem = os.path.splitext(os.path.basename(output_file))[0]
+    return os.path.join(os.path.dirname(output_file), "thumbnails", stem)
+
+
+def image_name(number, size, fmt):
+    return f"page-{number + 1:04d}-{size}.{fmt}"
+
+
+def page_hashes(pdf_path):
+    """Content hash per page, stable across builds that leave the page alone
+
+    Object numbers shift whenever anything earlier in the file changes, so
+    the hash covers what the page draws (content stream, image data, font
+    names, size) rather than the page object itself.
+    """
+    image_digests = {}
+    hashes = []
+    with pymupdf.open(pdf_path) as doc:
+        for page in doc:
+            h = hashlib.sha256(repr(tuple(page.rect)).encode("ascii"))
+            h.update(page.read_contents())
+            for font in page.get_fonts():
+                h.update(font[3].encode("utf-8"))
+            for image in page.get_images():
+                xref = image[0]
+                if xref not in image_digests:
+                    image_digests[xref] = hashlib.sha256(doc.xref_stream_raw(xref)).digest()
+                h.update(image_digests[xref])
+            hashes.append(h.hexdigest())
+    return hashes
+
+
+def _encode(image, fmt):
+    buf = io.BytesIO()
+    if fmt == "webp":
+        # method 2 is about twice as fast as the default for a few percent more bytes
+        image.save(buf, "WEBP", quality=WEBP_QUALITY, method=2)
+    else:
+        image.save(buf, "PNG")
+    return buf.getvalue()
+
+
+def _write(path, data):
+    partial = f"{path}.{os.getpid()}.tmp"
+    with open(partial, "wb") as f:
+        f.write(data)
+    os.replace(partial, path)
+
+
+def render_pages(pdf_path, numbers, out_dir, fmt):
+    """Rasterize the given pages (0-based); runs in a worker process"""
+    with pymupdf.open(pdf_path) as doc:
+        for number in numbers:
+            page = doc[number]
+            zoom = SIZES["preview"] / page.rect.width
+            pix = page.get_pixmap(matrix=pymupdf.Matrix(zoom, zoom), alpha=False)
+            preview = PILImage.frombytes("RGB", (pix.width, pix.height), pix.samples)
+            for size, width in SIZES.items():
+                image = preview if width == pix.width else preview.resize(
+                    (width, round(pix.height * width / pix.width)), PILImage.LANCZOS, reducing_gap=2.0)
+                _write(os.path.join(out_dir, image_name(number, size, fmt)), _encode(image, fmt))
+    return len(numbers)
+
+
+def _load_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST_FILE), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def render_thumbnails(pdf_path, out_dir, fmt="webp", pool=None, max_workers=None):
+    """Bring out_dir up to date with the PDF; return (rendered, total) page counts
+
+    Pass a shared ProcessPoolExecutor as pool to reuse workers across
+    documents; otherwise a pool is started only when enough pages changed.
+    """
+    if pymupdf is None:
+        raise RuntimeError("Page thumbnails need PyMuPDF: pip install pymupdf")
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported thumbnail format: {fmt}")
+    os.makedirs(out_dir, exist_ok=True)
+    hashes = page_hashes(pdf_path)
+    manifest = _load_manifest(out_dir)
+    previous = manifest.get("pages", []) if manifest.get("format") == fmt and manifest.get("sizes") == SIZES else []
+    changed = [number for number, digest in enumerate(hashes)
+               if number >= len(previous) or previous[number] != digest
+               or not all(os.path.exists(os.path.join(out_dir, image_name(number, size, fmt))) for size in SIZES)]
+
+    if len(changed) < POOL_THRESHOLD:
+        render_pages(pdf_path, changed, out_dir, fmt)
+    else:
+        workers = max_workers or min(os.cpu_count() or 1, len(changed))
+        owned = pool is None
+        if owned:
+            pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+        try:
+            # interleaved chunks spread runs of screenshot-heavy pages over all workers
+            chunks = [changed[i::workers] for i in range(workers)]
+            for future in [pool.submit(render_pages, pdf_path, chunk, out_dir, fmt) for chunk in chunks if chunk]:
+                future.result()
+        finally:
+            if owned:
+                pool.shutdown()
+
+    for name in os.listdir(out_dir):
+        if name.startswith("page-") and (int(name[5:9]) > len(hashes) or not name.endswith("." + fmt)):
+            os.remove(os.path.join(out_dir, name))
+    _write(os.path.join(out_dir, MANIFEST_FILE),
+           json.dumps({"format": fmt, "sizes": SIZES, "pages": hashes}, indent=1).encode("utf-8"))
+    return len(changed), len(hashes)
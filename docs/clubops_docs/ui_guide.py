@@ -0,0 +1,224 @@
+"""
+ClubOps UI Documentation v3.0
+Section builders and document configuration for the visual UI guide
+"""
+
+from reportlab.lib.units import inch
+from reportlab.lib.colors import black, white
+from reportlab.platypus import Spacer, PageBreak
+import os
+
+from .config import DocumentConfig, UI_GUIDE_DIR, GOLD, BLUE
+from .flowables import add_screenshot, data_table
+from .paragraphs import Paragraph
+
+
+def build_cover_page(story, ctx):
+    """Build the cover page"""
+    styles = ctx.styles
+    story.append(Spacer(1, 1.5*inch))
+    story.append(Paragraph("ClubOps", styles['CoverTitle']))
+    story.append(Paragraph("UI Documentation & Visual Guide", styles['CoverSubtitle']))
+    story.append(Spacer(1, 0.5*inch))
+    story.append(Paragraph("Version 3.0 - With Screenshots", styles['ClubBody']))
+    story.append(Paragraph(f"Generated: {ctx.build_date.strftime('%B %d, %Y')}", styles['ClubBody']))
+    story.append(Spacer(1, 0.5*inch))
+
+    url_data = [
+        ["Resource", "URL"],
+        ["Frontend Application", "https://clubops-saas-frontend.vercel.app"],
+        ["Backend API", "https://clubops-backend.vercel.app"],
+        ["Investor Page", "https://clubops-saas-frontend.vercel.app/investors"],
+        ["Demo Login", "admin@clubops.com / password"]
+    ]
+
+    url_table = data_table(url_data, header_bg=BLUE, header_fg=white, padding=8,
+                           extra_styles=[('ALIGN', (0, 0), (-1, -1), 'LEFT')])
+    story.append(url_table)
+    story.append(PageBreak())
+
+
+def build_toc(story, ctx):
+    """Build table of contents"""
+    styles = ctx.styles
+    story.append(Paragraph("Table of Contents", styles['SectionTitle']))
+    story.append(Spacer(1, 0.3*inch))
+
+    toc_items = [
+        ("1. Executive Summary", "3"),
+        ("2. Dashboard Overview", "4"),
+        ("3. Dancer Management", "5"),
+        ("4. DJ Queue System", "6"),
+        ("5. VIP Booth Management", "7"),
+        ("6. Revenue Dashboard", "8"),
+        ("7. Settings & Configuration", "9"),
+        ("8. Investor Landing Page", "10"),
+        ("9. Technical Stack", "11"),
+        ("10. Subscription Tiers", "12"),
+    ]
+
+    for item, page in toc_items:
+        story.append(Paragraph(f"{item} {'.' * (50 - len(item) - len(page))} {page}", styles['ClubBody']))
+
+    story.append(PageBreak())
+
+
+def build_executive_summary(story, ctx):
+    """Build executive summary section"""
+    styles = ctx.styles
+    story.append(Paragraph("1. Executive Summary", styles['SectionTitle']))
+    story.append(Paragraph(
+        "ClubOps is a comprehensive SaaS platform designed specifically for gentlemen's club management. "
+        "The application provides a premium, dark-themed interface optimized for low-light environments "
+        "with real-time operations tracking across all key business functions.",
+        styles['ClubBody']
+    ))
+    story.append(Paragraph("Design Principles", styles['SubSection']))
+    for p in ["Dark theme with vibrant gold, blue, and red accents", "Optimized for low-light club environments",
+              "Real-time data synchronization across all modules", "Drag-and-drop interfaces for intuitive operation"]:
+        story.append(Paragraph(f"• {p}", styles['FeatureItem']))
+    story.append(PageBreak())
+
+
+def build_dashboard_section(story, ctx):
+    """Build dashboard documentation section"""
+    styles = ctx.styles
+    story.append(Paragraph("2. Dashboard Overview", styles['SectionTitle']))
+    story.append(Paragraph(
+        "The main dashboard provides at-a-glance visibility into all club operations with real-time "
+        "metrics, activity feeds, and quick action buttons.", styles['ClubBody']
+    ))
+    add_screenshot(story, ctx, "01-dashboard.png", "Figure 2.1: Main Dashboard with real-time metrics and activity feed")
+    story.append(Paragraph("Key Components", styles['SubSection']))
+    for c in ["Active Dancers Counter", "VIP Booth Status with occupancy", "DJ Queue Status",
+              "Today's Revenue with growth %", "Recent Activity Feed", "Quick Actions Panel"]:
+        story.append(Paragraph(f"• {c}", styles['FeatureItem']))
+    story.append(PageBreak())
+
+
+def build_dancers_section(story, ctx):
+    """Build dancer management documentation section"""
+    styles = ctx.styles
+    story.append(Paragraph("3. Dancer Management", styles['SectionTitle']))
+    story.append(Paragraph(
+        "Comprehensive dancer roster management with license compliance tracking, bar fee collection, "
+        "and performance status monitoring.", styles['ClubBody']
+    ))
+    add_screenshot(story, ctx, "02-dancers.png", "Figure 3.1: Dancer Management grid with compliance indicators")
+    story.append(PageBreak())
+
+
+def build_dj_queue_section(story, ctx):
+    """Build DJ Queue documentation section"""
+    styles = ctx.styles
+    story.append(Paragraph("4. DJ Queue System", styles['SectionTitle']))
+    story.append(Paragraph(
+        "The DJ Queue features drag-and-drop stage management, an integrated music player supporting "
+        "MP3, AAC, FLAC, and WAV formats.", styles['ClubBody']
+    ))
+    add_screenshot(story, ctx, "03-dj-queue.png", "Figure 4.1: DJ Queue interface with integrated music player")
+    story.append(PageBreak())
+
+
+def build_vip_section(story, ctx):
+    """Build VIP Booth documentation section"""
+    styles = ctx.styles
+    story.append(Paragraph("5. VIP Booth Management", styles['SectionTitle']))
+    story.append(Paragraph(
+        "Real-time VIP booth monitoring with session timers, occupancy tracking, and revenue calculation.",
+        styles['ClubBody']
+    ))
+    add_screenshot(story, ctx, "04-vip-booths.png", "Figure 5.1: VIP Booth status cards with session controls")
+    story.append(PageBreak())
+
+
+def build_revenue_section(story, ctx):
+    """Build Revenue Dashboard documentation section"""
+    styles = ctx.styles
+    story.append(Paragraph("6. Revenue Dashboard", styles['SectionTitle']))
+    story.append(Paragraph(
+        "Comprehensive financial tracking with multi-period views, revenue breakdown by category, "
+        "and goal tracking with progress visualization.", styles['ClubBody']
+    ))
+    add_screenshot(story, ctx, "05-revenue.png", "Figure 6.1: Revenue Dashboard with breakdown and goal progress")
+    story.append(PageBreak())
+
+
+def build_settings_section(story, ctx):
+    """Build Settings documentation section"""
+    styles = ctx.styles
+    story.append(Paragraph("7. Settings & Configuration", styles['SectionTitle']))
+    story.append(Paragraph(
+        "Centralized settings for user profiles, club information, notifications, security, and integrations.",
+        styles['ClubBody']
+    ))
+    add_screenshot(story, ctx, "06-settings.png", "Figure 7.1: Settings page with profile configuration")
+    story.append(PageBreak())
+
+
+def build_investor_section(story, ctx):
+    """Build Investor Page documentation section"""
+    styles = ctx.styles
+    story.append(Paragraph("8. Investor Landing Page", styles['SectionTitle']))
+    story.append(Paragraph(
+        "A dedicated public landing page featuring market opportunity ($8.1B), product roadmap, "
+        "revenue model overview, and live demo access.", styles['ClubBody']
+    ))
+    add_screenshot(story, ctx, "07-investors.png", "Figure 8.1: Investor landing page hero section")
+    story.append(PageBreak())
+
+
+def build_tech_stack_section(story, ctx):
+    """Build Technical Stack documentation section"""
+    styles = ctx.styles
+    story.append(Paragraph("9. Technical Stack", styles['SectionTitle']))
+    story.append(Paragraph("Frontend", styles['SubSection']))
+    for f in ["React 18 with TypeScript", "Vite for fast builds", "Tailwind CSS", "Lucide React icons"]:
+        story.append(Paragraph(f"• {f}", styles['FeatureItem']))
+    story.append(Paragraph("Backend", styles['SubSection']))
+    for b in ["Node.js with Express.js", "PostgreSQL with Prisma ORM", "JWT authentication", "Socket.io for real-time"]:
+        story.append(Paragraph(f"• {b}", styles['FeatureItem']))
+    story.append(PageBreak())
+
+
+def build_subscription_section(story, ctx):
+    """Build Subscription Tiers documentation section"""
+    styles = ctx.styles
+    story.append(Paragraph("10. Subscription Tiers", styles['SectionTitle']))
+    tier_data = [
+        ["Tier", "Price", "Features"],
+        ["Free", "$0/mo", "Basic dashboard, up to 10 dancers"],
+        ["Basic", "$99/mo", "Full dashboard, unlimited dancers"],
+        ["Pro", "$199/mo", "All features, API access, analytics"],
+        ["Enterprise", "$399/mo", "Multi-location, white-label, SLA"]
+    ]
+    tier_table = data_table(tier_data, header_bg=GOLD, header_fg=black, padding=8,
+                            top_padding=3)
+    story.append(tier_table)
+
+
+UI_GUIDE = DocumentConfig(
+    name="ui-guide",
+    tenant="ui-guide",
+    title="ClubOps UI Documentation v3.0",
+    screenshot_dir=r"C:\Users\tonyt\AppData\Local\Temp\playwright-mcp-output\1765929013988",
+    output_file=os.path.join(UI_GUIDE_DIR, "ClubOps-UI-Documentation-v3.pdf"),
+    style_set="ui-guide",
+    body_style="ClubBody",
+    screenshots=("01-dashboard.png", "02-dancers.png", "03-dj-queue.png", "04-vip-booths.png", "05-revenue.png",
+                 "06-settings.png", "07-investors.png"),
+    sections=[
+        ("cover page", build_cover_page),
+        ("table of contents", build_toc),
+        ("Executive Summary section", build_executive_summary),
+        ("Dashboard section", build_dashboard_section),
+        ("Dancer Management section", build_dancers_section),
+        ("DJ Queue section", build_dj_queue_section),
+        ("VIP Booths section", build_vip_section),
+        ("Revenue section", build_revenue_section),
+        ("Settings section", build_settings_section),
+        ("Investor section", build_investor_section),
+        ("Technical Stack section", build_tech_stack_section),
+        ("Subscription section", build_subscription_section),
+    ],
+)
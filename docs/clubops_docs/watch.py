@@ -0,0 +1,61 @@
+"""
+Watch mode
+Polls each document's screenshot directory and queues a rebuild when a file
+changes. Bursts of changes (a screenshot run writing many files) collapse
+into at most one running and one pending build per document through the
+BuildQueue. Rebuilds after an edit are queued as interactive, ahead of the
+initial builds, so the page being worked on comes back first. Changes to
+the builders or catalogs still need a restart.
+"""
+
+import os
+import time
+
+from .build import IMAGE_BUILDS, build_document, job_kind
+from .build_queue import BuildQueue
+from .preflight import PreflightError
+
+
+def snapshot(directory):
+    """{file: (mtime, size)} for every file under a directory"""
+    found = {}
+    for dirpath, _, filenames in os.walk(directory):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            found[path] = (stat.st_mtime_ns, stat.st_size)
+    return found
+
+
+def report_failure(future):
+    error = future.exception()
+    if isinstance(error, PreflightError):
+        print(f"\n{error.report()}")
+    elif error is not None:
+        print(f"\n❌ Error generating PDF: {error}")
+
+
+def watch(configs, shared, interval=2.0, workers=None):
+    """Rebuild documents whenever their screenshots change, until interrupted"""
+    queue = BuildQueue(shared, build_document, workers=workers or len(configs), limits={"image": IMAGE_BUILDS})
+    kind = job_kind(shared.options)
+    seen = {config.output_file: snapshot(config.screenshot_dir) for config in configs}
+    for config in configs:
+        queue.request(config, priority="batch", tenant=config.tenant, kind=kind).add_done_callback(report_failure)
+    print(f"👀 Watching {len(configs)} document(s) every {interval:g}s, Ctrl+C to stop")
+    try:
+        while True:
+            time.sleep(interval)
+            for config in configs:
+                current = snapshot(config.screenshot_dir)
+                if current != seen[config.output_file]:
+                    seen[config.output_file] = current
+                    print(f"🔄 {config.name} [{config.locale}]: screenshots changed, rebuild queued")
+                    queue.request(config, priority="interactive", tenant=config.tenant,
+                                  kind=kind).add_done_callback(report_failure)
+    finally:
+        queue.close()
+        print(queue.report())
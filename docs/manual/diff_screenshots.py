@@ -0,0 +1,19 @@
+"""
+ClubOps Screenshot Diff Report
+Compares recaptured screenshots with the previously published ones and
+emits a change manifest plus an appendix PDF with side-by-side highlights
+
+The report itself lives in docs/clubops_docs (see diff.py); this script is
+kept so existing workflows keep working. Equivalent to:
+python -m clubops_docs diff manual [--baseline-dir DIR] [--ref REV]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clubops_docs.__main__ import main
+
+if __name__ == "__main__":
+    sys.exit(main(["diff", "manual", *sys.argv[1:]]))
@@ -0,0 +1,175 @@
+"""
+Screenshot embedding: plain PNGs passed through, everything else decoded,
+and tall screenshots cut into row bands while their PNG scanlines stream in
+
+Run from docs/: python -m pytest tests
+"""
+
+import io
+import random
+import struct
+import zlib
+
+from PIL import Image as PILImage
+from reportlab.lib.rl_accel import asciiBase85Decode
+from reportlab.pdfgen.canvas import Canvas
+import pytest
+
+from clubops_docs.assets import PNG_SIGNATURE, ScreenshotAsset, png_chunk, png_chunks, png_passthrough, png_tiles
+from clubops_docs.flowables import FigureRef
+from clubops_docs.preflight import check_asset
+
+WIDTH, HEIGHT = 120, 3000  # a full-page capture: far taller than one page frame
+BOUNDS = ((0, 1100), (1100, 2200), (2200, 3000))
+
+
+def tall_png(path, mode, height=HEIGHT, **save):
+    rng = random.Random(mode)
+    im = PILImage.new(mode, (WIDTH, height))
+    # noise and gradients, so every PNG filter type turns up somewhere
+    if mode == "P":
+        im.putpalette([rng.randrange(256) for _ in range(768)])
+    bands = len(im.getbands())
+    im.putdata([tuple(rng.randrange(256) if (x // 8 + y // 50) % 2 else (x + y) % 256 for _ in range(bands))
+                if bands > 1 else (x * y) % 256 for y in range(height) for x in range(WIDTH)])
+    im.save(path, optimize=False, **save)
+    return im
+
+
+def stream_bytes(prepared):
+    stream = prepared.streamContent
+    if "ASCII85Decode" in prepared._filters:
+        stream = asciiBase85Decode(stream)
+    return zlib.decompress(stream)
+
+
+def band_pixels(prepared, mode):
+    """Pixels of one prepared band, undoing the PNG predictor where the stream kept its filters"""
+    if not prepared.decodeParms:
+        return stream_bytes(prepared)
+    header = struct.pack(">IIBBBBB", prepared.width, prepared.height, 8, 2 if mode == "RGB" else 0, 0, 0, 0)
+    png = (PNG_SIGNATURE + png_chunk(b"IHDR", header) + png_chunk(b"IDAT", prepared.streamContent)
+           + png_chunk(b"IEND", b""))
+    return PILImage.open(io.BytesIO(png)).tobytes()
+
+
+@pytest.mark.parametrize("mode", ["RGB", "L", "RGBA", "P"])
+def test_bands_match_a_crop_of_the_whole_image(tmp_path, mode):
+    path = str(tmp_path / f"tall-{mode}.png")
+    whole = tall_png(path, mode)
+    tiles = ScreenshotAsset(path, "0" * 40, whole.size).tiles(BOUNDS)
+    assert [(tile.width, tile.height) for tile in tiles] == [(WIDTH, bottom - top) for top, bottom in BOUNDS]
+    for tile, (top, bottom) in zip(tiles, BOUNDS):
+        crop = whole.crop((0, top, WIDTH, bottom))
+        expected = crop.convert("RGB" if mode in ("RGBA", "P") else mode).tobytes()
+        assert band_pixels(tile, mode) == expected, f"rows {top}-{bottom} differ"
+        if mode == "RGBA":
+            assert stream_bytes(tile.smask) == crop.getchannel("A").tobytes()
+
+
+def rewrite_idat(path, change):
+    with open(path, "rb") as f:
+        data = f.read()
+    chunks = list(png_chunks(data))
+    idat = b"".join(data[start:end] for kind, start, end in chunks if kind == b"IDAT")
+    out = PNG_SIGNATURE + b"".join(png_chunk(kind, data[start:end]) for kind, start, end in chunks
+                                   if kind not in (b"IDAT", b"IEND"))
+    with open(path, "wb") as f:
+        f.write(out + png_chunk(b"IDAT", change(idat)) + png_chunk(b"IEND", b""))
+
+
+@pytest.mark.parametrize("change, message", [
+    (lambda idat: idat[:len(idat) // 2], "compressed image data is cut off after row"),
+    (lambda idat: zlib.compress(zlib.decompress(idat)[:-(WIDTH * 3 + 1)]), f"image data ends after row {HEIGHT - 1}"),
+    (lambda idat: zlib.compress(zlib.decompress(idat) + bytes(WIDTH * 3 + 1)), f"more than the {HEIGHT} rows"),
+], ids=["truncated", "row-short", "row-extra"])
+def test_damaged_image_data_is_reported(tmp_path, change, message):
+    path = str(tmp_path / "tall.png")
+    tall_png(path, "RGB")
+    rewrite_idat(path, change)
+    with pytest.raises(ValueError, match=message):
+        png_tiles(path, BOUNDS, "t")
+
+
+ADAM7 = ((0, 0, 8, 8), (4, 0, 8, 8), (0, 4, 4, 8), (2, 0, 4, 4), (0, 2, 2, 4), (1, 0, 2, 2), (0, 1, 1, 2))
+
+
+def interlaced_png(path, im):
+    """im (RGB) written as an Adam7-interlaced PNG, which PIL does not write itself"""
+    width, height = im.size
+    pixels = im.tobytes()
+    raw = b""
+    for x0, y0, dx, dy in ADAM7:
+        if x0 >= width or y0 >= height:
+            continue
+        for y in range(y0, height, dy):
+            raw += b"\0" + b"".join(pixels[(y * width + x) * 3:(y * width + x) * 3 + 3] for x in range(x0, width, dx))
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 1)
+    with open(path, "wb") as f:
+        f.write(PNG_SIGNATURE + png_chunk(b"IHDR", header) + png_chunk(b"IDAT", zlib.compress(raw))
+                + png_chunk(b"IEND", b""))
+
+
+def embedded_pixels(prepared, tmp_path):
+    """The image as a PDF reader decodes it: embedded in a one-page PDF, then read back with PyMuPDF"""
+    pymupdf = pytest.importorskip("pymupdf")
+    path = str(tmp_path / "embedded.pdf")
+    canv = Canvas(path, pagesize=(prepared.width, prepared.height))
+    prepared.draw(canv, 0, 0, prepared.width, prepared.height)
+    canv.showPage()
+    canv.save()
+    with pymupdf.open(path) as doc:
+        xref = doc[0].get_images()[0][0]
+        pixmap = pymupdf.Pixmap(doc, xref)
+        return pixmap.samples
+
+
+def screenshot(path):
+    with PILImage.open(path) as im:
+        return ScreenshotAsset(path, "1" * 40, im.size)
+
+
+@pytest.mark.parametrize("mode, passthrough", [("RGB", True), ("L", True), ("P", False)])
+def test_embedded_pixels_match_the_file(tmp_path, mode, passthrough):
+    path = str(tmp_path / f"shot-{mode}.png")
+    im = tall_png(path, mode, height=90)
+    assert (png_passthrough(path, "x") is not None) == passthrough
+    prepared = screenshot(path).prepared()
+    if passthrough:
+        # the file's own IDAT stream, undone by the reader through the PNG predictors
+        assert prepared.decodeParms["Predictor"] == 15
+    assert embedded_pixels(prepared, tmp_path) == im.convert("RGB" if mode == "P" else mode).tobytes()
+
+
+@pytest.mark.parametrize("kind", ["transparency", "interlaced"])
+def test_files_the_reader_cannot_take_as_they_are_are_decoded(tmp_path, kind):
+    path = str(tmp_path / f"{kind}.png")
+    if kind == "transparency":
+        im = tall_png(path, "RGB", height=90, transparency=(0, 0, 0))
+    else:
+        im = tall_png(str(tmp_path / "plain.png"), "RGB", height=90)
+        interlaced_png(path, im)
+    assert png_passthrough(path, "x") is None
+    prepared = screenshot(path).prepared()
+    assert not prepared.decodeParms
+    assert embedded_pixels(prepared, tmp_path) == im.tobytes()
+
+
+@pytest.mark.parametrize("damage", ["truncated", "crc"])
+def test_damaged_png_falls_back_and_fails_preflight(tmp_path, damage):
+    path = str(tmp_path / "damaged.png")
+    tall_png(path, "RGB", height=90)
+    with open(path, "rb") as f:
+        data = bytearray(f.read())
+    if damage == "truncated":
+        data = data[:len(data) * 2 // 3]
+    else:
+        start = next(start for kind, start, end in png_chunks(bytes(data)) if kind == b"IDAT")
+        data[start + 20] ^= 0xFF  # the chunk's CRC no longer matches
+    with open(path, "wb") as f:
+        f.write(data)
+    assert png_passthrough(path, "x") is None
+    asset = screenshot(path)
+    figure = FigureRef("damaged.png", path, "Figure 1.1: Damaged", 1, asset, 100, 50)
+    problems = check_asset(figure)
+    assert len(problems) == 1 and problems[0].startswith("damaged.png: image does not decode (")
@@ -0,0 +1,151 @@
+"""
+BuildQueue scheduling: priority, deadline, tenant fairness, kind limits and merging
+
+Run from docs/: python -m pytest tests
+"""
+
+import threading
+import time
+
+import pytest
+
+from clubops_docs.build_queue import BuildQueue
+from clubops_docs.config import DocumentConfig
+
+
+def config(name):
+    return DocumentConfig(name=name, title=name, screenshot_dir="", output_file=f"/nonexistent/{name}.pdf",
+                          style_set="manual", body_style="ManualBody")
+
+
+class Builds:
+    """build() for the queue: records the order of builds; gated outputs wait for release(name)"""
+
+    def __init__(self, gated=(), durations=None):
+        self.order = []
+        self.started = {}
+        self.gates = {name: threading.Event() for name in gated}
+        self.durations = durations or {}
+
+    def __call__(self, cfg, shared):
+        self.started[cfg.name] = threading.Event()
+        self.started[cfg.name].set()
+        gate = self.gates.get(cfg.name)
+        if gate:
+            assert gate.wait(5), f"{cfg.name} was never released"
+        time.sleep(self.durations.get(cfg.name, 0))
+        self.order.append(cfg.name)
+        return cfg.name
+
+    def release(self, name):
+        self.gates[name].set()
+
+    def wait_started(self, name, timeout=5):
+        deadline = time.perf_counter() + timeout
+        while name not in self.started:
+            assert time.perf_counter() < deadline, f"{name} never started"
+            time.sleep(0.005)
+
+
+@pytest.fixture
+def run():
+    queues = []
+
+    def start(builds, **kw):
+        queue = BuildQueue(None, builds, **kw)
+        queues.append(queue)
+        return queue
+
+    yield start
+    for queue in queues:
+        queue.close()
+
+
+def test_priority_before_arrival(run):
+    builds = Builds(gated=["busy"])
+    queue = run(builds)
+    queue.request(config("busy"))
+    builds.wait_started("busy")
+    futures = [queue.request(config("nightly"), priority="batch"),
+               queue.request(config("download"), priority="interactive"),
+               queue.request(config("rebuild"))]
+    builds.release("busy")
+    assert [future.result(5) for future in futures] == ["nightly", "download", "rebuild"]
+    assert builds.order == ["busy", "download", "rebuild", "nightly"]
+
+
+def test_deadline_counts_back_from_expected_build_time(run):
+    builds = Builds(gated=["busy"], durations={"slow": 0.4})
+    queue = run(builds)
+    queue.request(config("slow")).result(5)  # the queue now expects "slow" to take 0.4s
+    queue.request(config("busy"))
+    builds.wait_started("busy")
+    # slow must start within 0.6s, quick within 0.8s; no deadline comes last
+    futures = [queue.request(config("relaxed")),
+               queue.request(config("quick"), deadline=0.8),
+               queue.request(config("slow"), deadline=1.0)]
+    builds.release("busy")
+    for future in futures:
+        future.result(5)
+    assert builds.order == ["slow", "busy", "slow", "quick", "relaxed"]
+
+
+def test_tenant_with_less_build_time_goes_first(run):
+    builds = Builds(gated=["a-busy"], durations={"a-busy": 0.05})
+    queue = run(builds)
+    queue.request(config("a-busy"), tenant="a")
+    builds.wait_started("a-busy")
+    futures = [queue.request(config(name), tenant="a") for name in ("a-1", "a-2")]
+    futures.append(queue.request(config("b-1"), tenant="b"))
+    builds.release("a-busy")
+    for future in futures:
+        future.result(5)
+    assert builds.order == ["a-busy", "b-1", "a-1", "a-2"]
+
+
+def test_identical_requests_merge(run):
+    builds = Builds(gated=["busy"])
+    queue = run(builds)
+    queue.request(config("busy"))
+    builds.wait_started("busy")
+    first = queue.request(config("manual"), priority="batch")
+    second = queue.request(config("manual"), priority="interactive")
+    other = queue.request(config("guide"))
+    assert first is second
+    builds.release("busy")
+    assert first.result(5) == "manual" and other.result(5) == "guide"
+    # one build, at the most urgent priority of the two requests
+    assert builds.order == ["busy", "manual", "guide"]
+    assert queue.stats()["interactive"]["builds"] == 1
+
+
+def test_merged_request_charges_its_tenant(run):
+    builds = Builds(gated=["a-busy"], durations={"a-busy": 0.05})
+    queue = run(builds)
+    queue.request(config("a-busy"), tenant="a")
+    builds.wait_started("a-busy")
+    futures = [queue.request(config("p"), tenant="a"), queue.request(config("q"), tenant="b")]
+    # p is now built for tenant b, which has used no build time, and was queued before q
+    futures.append(queue.request(config("p"), tenant="b"))
+    builds.release("a-busy")
+    for future in futures:
+        future.result(5)
+    assert builds.order == ["a-busy", "p", "q"]
+
+
+def test_merged_request_counts_against_its_kind_limit(run):
+    builds = Builds(gated=["render", "layout"])
+    queue = run(builds, workers=2, limits={"image": 1})
+    queue.request(config("render"), kind="image")
+    queue.request(config("layout"))
+    builds.wait_started("render")
+    builds.wait_started("layout")
+    queue.request(config("p"))
+    future = queue.request(config("p"), kind="image")
+    builds.release("layout")
+    # a worker is free, but p now renders images and the one image slot is taken
+    time.sleep(0.2)
+    assert "p" not in builds.started
+    builds.release("render")
+    assert future.result(5) == "p"
+    assert builds.order == ["layout", "render", "p"]
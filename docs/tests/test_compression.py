@@ -0,0 +1,61 @@
+"""
+Page streams compressed on a thread pool: the same bytes as compressing one after another
+
+Run from docs/: python -m pytest tests
+"""
+
+from reportlab import rl_config
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import PageBreak
+import pytest
+
+from clubops_docs.build import BuildOptions, SharedResources
+from clubops_docs.flowables import data_table
+from clubops_docs.paragraphs import Paragraph
+from clubops_docs.reports import report_config, write_report
+
+
+def story(ctx):
+    body = ctx.styles["ManualBody"]
+    flowables = []
+    for section in range(6):
+        flowables.append(Paragraph(f"Section {section}", ctx.styles["SectionTitle"]))
+        flowables.extend(Paragraph(f"<b>Line {line}:</b> the quick brown fox jumps over the lazy dog " * 3, body)
+                         for line in range(12))
+        flowables.append(data_table([["Booth", "Sessions"]] + [[f"Booth {n}", str(n * section)] for n in range(8)]))
+        flowables.append(PageBreak())
+    return flowables
+
+
+class ReportlabCompression(SharedResources):
+    """Pages compressed by reportlab's own Canvas, while it writes the file"""
+
+    def canvasmaker(self, canvas=None):
+        return SharedResources.canvasmaker(self, canvas or Canvas)
+
+
+def build(tmp_path, name, resources=SharedResources, **options):
+    shared = resources(BuildOptions(deterministic=True, **options))
+    try:
+        config = report_config("compression", "Compression check", str(tmp_path / f"{name}.pdf"))
+        with open(write_report(config, shared, story), "rb") as f:
+            return f.read()
+    finally:
+        shared.close()
+
+
+@pytest.mark.parametrize("level", [1, 6, 9])
+@pytest.mark.parametrize("a85", [0, 1])
+def test_threads_give_the_same_bytes_as_sequential(tmp_path, monkeypatch, level, a85):
+    monkeypatch.setattr(rl_config, "useA85", a85)
+    sequential = build(tmp_path, "sequential", compress_threads=1, page_compression=level)
+    threaded = build(tmp_path, "threaded", compress_threads=4, page_compression=level)
+    assert sequential.count(b"/Type /Page\n") >= 6
+    assert threaded == sequential
+
+
+def test_same_bytes_as_reportlab_itself(tmp_path):
+    # at zlib's default level the pool only moves reportlab's own compression off the writing thread
+    reportlab = build(tmp_path, "reportlab", ReportlabCompression)
+    threaded = build(tmp_path, "threaded", compress_threads=4)
+    assert threaded == reportlab
@@ -0,0 +1,20 @@
+"""
+Paragraph mini-markup rendered as HTML
+
+Run from docs/: python -m pytest tests
+"""
+
+import pytest
+
+from clubops_docs.html_output import markup
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("<b>Label:</b> text", "<b>Label:</b> text"),
+    # entity-encoded for reportlab, escaped exactly once for HTML
+    ("<b>R&amp;B</b> &lt;Lounge&gt; &amp; Bar", "<b>R&amp;B</b> &lt;Lounge&gt; &amp; Bar"),
+    ("Tips &amp; fees<br/>Net", "Tips &amp; fees<br/>Net"),
+    ("<i>a</i> <script>x</script>", "<i>a</i> &lt;script&gt;x&lt;/script&gt;"),
+])
+def test_markup(text, expected):
+    assert markup(text) == expected
@@ -0,0 +1,114 @@
+"""
+Incremental PDF updates: appended revisions that readers take as the new build
+
+Run from docs/: python -m pytest tests
+"""
+
+import io
+
+from pypdf import PdfReader
+from reportlab.pdfgen.canvas import Canvas
+import pytest
+
+from clubops_docs.incremental import TRAILER_ID, incremental_update, publish_incremental, read_xref
+
+PAGES = ["Getting started", "Dashboard", "Dancer management", "DJ queue"]
+
+
+def build(path, pages=PAGES, repeat=20):
+    """A small invariant PDF, one page per title with a few lines of text under it"""
+    canv = Canvas(str(path), invariant=1)
+    for title in pages:
+        canv.setFont("Helvetica-Bold", 16)
+        canv.drawString(72, 720, title)
+        canv.setFont("Helvetica", 10)
+        for line in range(repeat):
+            canv.drawString(72, 690 - 14 * line, f"{title}: line {line} of the section text")
+        canv.showPage()
+    canv.save()
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def page_texts(data):
+    reader = PdfReader(io.BytesIO(data), strict=True)
+    return [page.extract_text() for page in reader.pages]
+
+
+@pytest.fixture
+def published(tmp_path):
+    """The published file, first written whole"""
+    path = tmp_path / "manual.pdf"
+    build(tmp_path / "first.pdf")
+    assert publish_incremental(str(tmp_path / "first.pdf"), str(path)) is None  # nothing published yet
+    return path
+
+
+def test_one_changed_page_is_appended(published, tmp_path):
+    old = read(published)
+    revised = PAGES[:1] + ["Dashboard (revised)"] + PAGES[2:]
+    new = build(tmp_path / "second.pdf", revised)
+    appended = publish_incremental(str(tmp_path / "second.pdf"), str(published))
+    data = read(published)
+    assert 0 < appended < len(new) / 2
+    assert len(data) == len(old) + appended
+    assert data[:len(old)] == old  # earlier bytes untouched
+    texts = page_texts(data)
+    assert len(texts) == len(PAGES)
+    assert "Dashboard (revised)" in texts[1] and "Dancer management" in texts[2]
+    # the update points back at the original xref and keeps the file's first /ID
+    objects, trailer, _, _ = read_xref(data)
+    _, old_trailer, _, old_xref = read_xref(old)
+    assert b"/Prev %d" % old_xref in trailer
+    assert b"/Size %d" % (max(objects) + 1) in trailer
+    assert TRAILER_ID.search(trailer).group(1) == TRAILER_ID.search(old_trailer).group(1)
+
+
+def test_second_update_chains_onto_the_first(published, tmp_path):
+    build(tmp_path / "second.pdf", ["Getting started (revised)"] + PAGES[1:])
+    publish_incremental(str(tmp_path / "second.pdf"), str(published))
+    first_update = read(published)
+    build(tmp_path / "third.pdf", ["Getting started (revised)"] + PAGES[1:3] + ["DJ queue (revised)"])
+    assert publish_incremental(str(tmp_path / "third.pdf"), str(published)) > 0
+    data = read(published)
+    assert data.startswith(first_update)
+    texts = page_texts(data)
+    assert "Getting started (revised)" in texts[0] and "DJ queue (revised)" in texts[3]
+    pymupdf = pytest.importorskip("pymupdf")
+    with pymupdf.open(stream=data, filetype="pdf") as doc:
+        assert not doc.is_repaired
+        assert "DJ queue (revised)" in doc[3].get_text()
+
+
+def test_unchanged_rebuild_appends_nothing(published, tmp_path):
+    old = read(published)
+    assert incremental_update(old, build(tmp_path / "again.pdf")) == b""
+    assert publish_incremental(str(tmp_path / "again.pdf"), str(published)) == 0
+    assert read(published) == old
+
+
+def test_missing_published_file_is_written_whole(tmp_path):
+    new = build(tmp_path / "built.pdf")
+    assert publish_incremental(str(tmp_path / "built.pdf"), str(tmp_path / "fresh.pdf")) is None
+    assert read(tmp_path / "fresh.pdf") == new
+
+
+def test_oversized_update_rewrites_the_file(published, tmp_path):
+    # every page changes, so old + update would be about twice a fresh copy
+    new = build(tmp_path / "rewrite.pdf", [f"{title} (rewritten)" for title in PAGES])
+    assert incremental_update(read(published), new) is None
+    assert publish_incremental(str(tmp_path / "rewrite.pdf"), str(published)) is None
+    assert read(published) == new
+
+
+def test_unreadable_published_file_is_rewritten(published, tmp_path):
+    with open(published, "wb") as f:
+        f.write(b"%PDF-1.4\nnot really a pdf\n")
+    new = build(tmp_path / "second.pdf")
+    assert publish_incremental(str(tmp_path / "second.pdf"), str(published)) is None
+    assert read(published) == new
@@ -0,0 +1,29 @@
+"""
+Paragraph markup cache: reuse and bounded size
+
+Run from docs/: python -m pytest tests
+"""
+
+from reportlab.lib.styles import getSampleStyleSheet
+
+from clubops_docs import paragraphs
+from clubops_docs.paragraphs import Paragraph, parse_markup
+
+
+def test_cached_fragments_are_copies():
+    style = getSampleStyleSheet()["Normal"]
+    first = parse_markup("<b>Label:</b> text", style)[1]
+    second = parse_markup("<b>Label:</b> text", style)[1]
+    assert [frag.text for frag in first] == [frag.text for frag in second] == ["Label:", " text"]
+    assert first[0] is not second[0]
+
+
+def test_cache_keeps_the_most_recently_used(monkeypatch):
+    style = getSampleStyleSheet()["Normal"]
+    monkeypatch.setattr(paragraphs, "PARSED_CACHE_SIZE", 3)
+    monkeypatch.setattr(paragraphs, "_parsed", paragraphs.OrderedDict())
+    for n in range(3):
+        Paragraph(f"<b>{n}</b>", style)
+    Paragraph("<b>0</b>", style)  # used again, so 1 is now the oldest
+    Paragraph("<b>3</b>", style)
+    assert [key[2] for key in paragraphs._parsed] == ["<b>2</b>", "<b>0</b>", "<b>3</b>"]
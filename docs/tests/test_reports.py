@@ -0,0 +1,141 @@
+"""
+Per-club reports: database text is printed as written, never parsed as markup
+
+Run from docs/: python -m pytest tests
+"""
+
+from datetime import date, datetime, timezone
+import os
+import sqlite3
+import threading
+import time
+
+from pypdf import PdfReader
+import pytest
+
+from clubops_docs.build import BuildOptions, SharedResources
+from clubops_docs.build_queue import BuildQueue
+from clubops_docs.compliance import ClubRoster, Dancer, build_roster, build_rosters
+from clubops_docs.config import DocumentConfig
+from clubops_docs.occupancy import BoothUsage, ClubOccupancy, build_occupancy_reports, occupancy_report, sweep_sessions
+from clubops_docs.reports import write_report
+
+CLUB = "R&B <Lounge> & Bar"
+TODAY = date(2026, 1, 15)
+
+
+@pytest.fixture
+def shared():
+    resources = SharedResources(BuildOptions(deterministic=True))
+    yield resources
+    resources.close()
+
+
+def pdf_text(path):
+    """Text of every page, with line breaks and runs of spaces collapsed"""
+    return " ".join(" ".join(page.extract_text() for page in PdfReader(path).pages).split())
+
+
+def test_compliance_roster_prints_names_as_written(shared, tmp_path):
+    roster = ClubRoster("1", CLUB, "rb", [Dancer("Salt & <Pepper>", "Jo <b>Doe</b>", "L-1", "2026-01-20", "active")])
+    path = build_roster(roster, roster.buckets(TODAY), shared, TODAY, str(tmp_path))
+    text = pdf_text(path)
+    assert f"{CLUB} License Compliance Roster" in text
+    assert "Salt & <Pepper>" in text and "Jo <b>Doe</b>" in text
+    assert "&amp;" not in text
+
+
+def test_occupancy_report_prints_names_as_written(shared, tmp_path):
+    booth = sweep_sessions(BoothUsage("7", "Champagne & <Caviar>", 4), [1768500000], [1768503600])
+    club = ClubOccupancy("1", CLUB, "rb", [booth])
+    config, story_builder = occupancy_report(club, str(tmp_path))
+    assert config.tenant == "rb"
+    text = pdf_text(write_report(config, shared, story_builder))
+    assert f"{CLUB} VIP Booth Occupancy" in text
+    assert "Champagne & <Caviar>" in text
+    assert "&amp;" not in text
+
+
+def export(path):
+    """A SQLite export with two clubs, the tables and columns the reports read"""
+    connection = sqlite3.connect(path)
+    connection.executescript("""
+        CREATE TABLE clubs (id INTEGER, name TEXT, subdomain TEXT);
+        CREATE TABLE dancers (club_id INTEGER, stage_name TEXT, legal_name TEXT, license_number TEXT,
+                              license_expiry_date TEXT, license_status TEXT, is_active INTEGER);
+        CREATE TABLE vip_rooms (club_id INTEGER, id INTEGER, room_name TEXT, capacity INTEGER);
+        CREATE TABLE vip_sessions (room_id INTEGER, started_at TEXT, ended_at TEXT, duration_minutes INTEGER,
+                                   status TEXT);
+        INSERT INTO clubs VALUES (1, 'Velvet', 'velvet'), (2, 'Neon', 'neon');
+        INSERT INTO dancers VALUES (1, 'Ruby', 'R. One', 'L-1', '2026-01-20', 'active', 1),
+                                   (2, 'Jade', 'J. Two', 'L-2', '2027-01-01', 'active', 1);
+        INSERT INTO vip_rooms VALUES (1, 10, 'Gold', 4), (2, 20, 'Onyx', 6);
+        INSERT INTO vip_sessions VALUES (10, '2026-01-14 22:00:00', '2026-01-14 23:30:00', NULL, 'completed'),
+                                        (20, '2026-01-14 21:00:00', NULL, 45, 'completed');
+    """)
+    connection.commit()
+    connection.close()
+    return path
+
+
+class RecordingQueue(BuildQueue):
+    """BuildQueue that remembers the terms of every request"""
+
+    def __init__(self, *args, **kw):
+        self.requests = []
+        super().__init__(*args, **kw)
+
+    def request(self, config, priority="normal", deadline=None, tenant=None, kind="layout", build=None):
+        self.requests.append((os.path.basename(config.output_file), priority, tenant))
+        return super().request(config, priority, deadline, tenant, kind, build)
+
+
+def test_reports_are_batch_jobs_charged_to_their_club(shared, tmp_path):
+    db = export(str(tmp_path / "export.db"))
+    queue = RecordingQueue(shared)
+    try:
+        rosters = build_rosters(db, str(tmp_path), shared, today=TODAY, queue=queue)
+        occupancy = build_occupancy_reports(db, str(tmp_path), shared, as_of=datetime(2026, 1, 15, tzinfo=timezone.utc),
+                                            queue=queue)
+    finally:
+        queue.close()
+    assert [os.path.basename(path) for path in rosters + occupancy] == [
+        "neon-compliance.pdf", "velvet-compliance.pdf", "neon-vip-occupancy.pdf", "velvet-vip-occupancy.pdf"]
+    assert queue.requests == [("neon-compliance.pdf", "batch", "neon"), ("velvet-compliance.pdf", "batch", "velvet"),
+                              ("neon-vip-occupancy.pdf", "batch", "neon"),
+                              ("velvet-vip-occupancy.pdf", "batch", "velvet")]
+    assert queue.stats()["batch"]["builds"] == 4
+
+
+def test_interactive_request_goes_before_a_waiting_report_batch(shared, tmp_path):
+    db = export(str(tmp_path / "export.db"))
+    queue = BuildQueue(shared)
+    release, seen = threading.Event(), {}
+
+    def busy(config, shared):
+        release.wait(5)
+        return config.output_file
+
+    def download(config, shared):
+        seen["reports built before it"] = [name for name in os.listdir(tmp_path) if name.endswith(".pdf")]
+        return config.output_file
+
+    def document(name):
+        return DocumentConfig(name=name, title=name, screenshot_dir="", output_file=str(tmp_path / f"{name}.out"),
+                              style_set="manual", body_style="ManualBody", tenant="manual")
+
+    try:
+        queue.request(document("busy"), build=busy)
+        batch = threading.Thread(target=build_rosters, args=(db, str(tmp_path), shared),
+                                 kwargs={"today": TODAY, "queue": queue})
+        batch.start()
+        time.sleep(0.2)  # both rosters are waiting behind the busy worker
+        future = queue.request(document("download"), priority="interactive", build=download)
+        release.set()
+        future.result(5)
+        batch.join(10)
+    finally:
+        queue.close()
+    assert seen["reports built before it"] == []
+    assert sorted(name for name in os.listdir(tmp_path) if name.endswith(".pdf")) == [
+        "neon-compliance.pdf", "velvet-compliance.pdf"]
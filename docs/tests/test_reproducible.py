@@ -0,0 +1,43 @@
+"""
+Fixed PDF dates without touching the process environment
+
+Run from docs/: python -m pytest tests
+"""
+
+from datetime import datetime, timezone
+import io
+import os
+
+from clubops_docs.build import BuildOptions, SharedResources
+from clubops_docs.reproducible import dated_canvas
+
+BUILD_DATE = datetime.fromtimestamp(1700000000, tz=timezone.utc)
+
+
+def pdf_bytes(canvasmaker):
+    buffer = io.BytesIO()
+    canv = canvasmaker(buffer, invariant=1)
+    canv.showPage()
+    canv.save()
+    return buffer.getvalue()
+
+
+def test_pdf_dates_follow_the_build_date(monkeypatch):
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "946684800")
+    assert b"D:20231114221320+00'00'" in pdf_bytes(dated_canvas(BUILD_DATE))
+    # restored afterwards, not left pinned for whatever is built next
+    assert os.environ["SOURCE_DATE_EPOCH"] == "946684800"
+    assert b"D:20000101000000+00'00'" in pdf_bytes(dated_canvas(None))
+
+
+def test_deterministic_build_leaves_the_environment_alone(monkeypatch):
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    shared = SharedResources(BuildOptions(deterministic=True))
+    try:
+        assert "SOURCE_DATE_EPOCH" not in os.environ
+        stamp = shared.build_date.strftime("D:%Y%m%d%H%M%S").encode()
+        assert stamp in pdf_bytes(shared.canvasmaker())
+        assert "SOURCE_DATE_EPOCH" not in os.environ
+    finally:
+        shared.close()
+    assert SharedResources().pdf_date is None
@@ -0,0 +1,207 @@
+"""
+HTTPSource against a local stand-in for the asset store
+
+Run from docs/: python -m pytest tests
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import hashlib
+import os
+import threading
+import time
+
+import pytest
+
+from clubops_docs.sources import MAX_REDIRECTS, HTTPSource
+
+
+class Store(ThreadingHTTPServer):
+    """Serves files under /store/; paths listed in `reset` are dropped without a response"""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StoreHandler)
+        self.files = {}
+        self.reset = set()
+        self.malformed = set()
+        self.redirects = {}  # path -> Location
+        self.delay = 0.0
+        self.requests = []  # (path, If-None-Match)
+        self.active = self.max_active = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/store/"
+
+
+class StoreHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        store = self.server
+        with store.lock:
+            store.requests.append((self.path, self.headers.get("If-None-Match")))
+            store.active += 1
+            store.max_active = max(store.max_active, store.active)
+        try:
+            time.sleep(store.delay)
+            self.respond(store)
+        finally:
+            with store.lock:
+                store.active -= 1
+
+    def respond(self, store):
+        name = self.path[len("/store/"):]
+        if name in store.reset:
+            self.close_connection = True
+            return
+        if name in store.malformed:
+            self.wfile.write(b"HTTP/1.1 200 OK\r\nContent-Length: abc\r\n\r\n")
+            self.close_connection = True
+            return
+        if self.path in store.redirects:
+            self.send_response(302)
+            self.send_header("Location", store.redirects[self.path])
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if name not in store.files:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = store.files[name]
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def store():
+    server = Store()
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def sync(store, tmp_path, filenames, **kw):
+    source = HTTPSource(store.url, cache_dir=str(tmp_path), **kw)
+    directory, failures = source.sync(filenames)
+    return source, directory, failures
+
+
+def read(directory, name):
+    with open(os.path.join(directory, name), "rb") as f:
+        return f.read()
+
+
+def test_fetch_then_not_modified(store, tmp_path):
+    store.files = {"a.png": b"alpha", "b.png": b"beta"}
+    source, directory, failures = sync(store, tmp_path, ["a.png", "b.png"])
+    assert failures == []
+    assert source.stats["fetched"] == 2 and source.stats["bytes"] == 9
+    assert read(directory, "a.png") == b"alpha"
+
+    store.requests.clear()
+    source, _, failures = sync(store, tmp_path, ["a.png", "b.png"])
+    assert failures == []
+    assert source.stats["not_modified"] == 2 and source.stats["fetched"] == 0
+    # the second sync revalidated with the ETags from the first
+    assert sorted(store.requests) == [("/store/a.png", '"%s"' % hashlib.sha1(b"alpha").hexdigest()),
+                                      ("/store/b.png", '"%s"' % hashlib.sha1(b"beta").hexdigest())]
+
+
+def test_changed_file_is_fetched_again(store, tmp_path):
+    store.files = {"a.png": b"alpha"}
+    sync(store, tmp_path, ["a.png"])
+    store.files["a.png"] = b"alpha 2"
+    source, directory, failures = sync(store, tmp_path, ["a.png"])
+    assert failures == [] and source.stats["fetched"] == 1
+    assert read(directory, "a.png") == b"alpha 2"
+
+
+@pytest.mark.parametrize("breakage", ["missing", "reset", "malformed"])
+def test_failure_without_cached_copy(store, tmp_path, breakage):
+    store.files = {"a.png": b"alpha"}
+    if breakage == "reset":
+        store.reset.add("b.png")
+    elif breakage == "malformed":
+        store.malformed.add("b.png")
+    source, directory, failures = sync(store, tmp_path, ["a.png", "b.png"])
+    # one broken file is reported; it does not abort the others
+    assert len(failures) == 1 and failures[0].startswith("b.png: cannot fetch")
+    assert source.stats["failed"] == 1 and source.stats["fetched"] == 1
+    assert read(directory, "a.png") == b"alpha"
+
+
+@pytest.mark.parametrize("breakage", ["missing", "reset", "malformed"])
+def test_failure_keeps_cached_copy(store, tmp_path, breakage):
+    store.files = {"a.png": b"alpha"}
+    sync(store, tmp_path, ["a.png"])
+    if breakage == "missing":
+        del store.files["a.png"]
+    elif breakage == "reset":
+        store.reset.add("a.png")
+    else:
+        store.malformed.add("a.png")
+    source, directory, failures = sync(store, tmp_path, ["a.png"])
+    assert failures == [] and source.stats["failed"] == 1
+    assert read(directory, "a.png") == b"alpha"
+
+
+def test_unwritable_file_fails_alone(store, tmp_path):
+    store.files = {"a.png": b"alpha", "sub/b.png": b"beta", "blocked/c.png": b"gamma"}
+    source = HTTPSource(store.url, cache_dir=str(tmp_path))
+    os.makedirs(source.directory)
+    open(os.path.join(source.directory, "blocked"), "w").close()  # a file where c.png's directory should be
+    directory, failures = source.sync(store.files)
+    assert len(failures) == 1 and failures[0].startswith("blocked/c.png: cannot fetch")
+    assert "cannot store it" in failures[0]
+    assert read(directory, "a.png") == b"alpha" and read(directory, "sub/b.png") == b"beta"
+    assert not [name for _, _, names in os.walk(directory) for name in names if name.endswith(".tmp")]
+
+
+def test_same_host_redirect_is_followed(store, tmp_path):
+    store.files = {"new.png": b"moved"}
+    store.redirects = {"/store/old.png": "/store/new.png"}
+    source, directory, failures = sync(store, tmp_path, ["old.png"])
+    assert failures == []
+    assert read(directory, "old.png") == b"moved"
+
+
+def test_redirects_elsewhere_fail(store, tmp_path):
+    store.redirects = {"/store/away.png": "http://example.invalid/away.png",
+                       "/store/loop.png": "/store/loop.png"}
+    source, _, failures = sync(store, tmp_path, ["away.png", "loop.png"])
+    assert sorted(failures) == [
+        f"away.png: cannot fetch from {store.url} (FetchError: HTTP 302 redirect to another host "
+        f"(http://example.invalid/away.png) is not supported)",
+        f"loop.png: cannot fetch from {store.url} (FetchError: more than {MAX_REDIRECTS} redirects)",
+    ]
+
+
+def test_concurrency_is_bounded(store, tmp_path):
+    names = [f"{n:02d}.png" for n in range(24)]
+    store.files = {name: name.encode() for name in names}
+    store.delay = 0.05
+    started = time.perf_counter()
+    source, _, failures = sync(store, tmp_path, names, concurrency=4)
+    elapsed = time.perf_counter() - started
+    assert failures == [] and source.stats["fetched"] == 24
+    assert 1 < store.max_active <= 4
+    assert elapsed < 24 * store.delay  # overlapped, not one request after another